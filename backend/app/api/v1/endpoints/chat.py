@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from typing import Literal
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
@@ -8,8 +10,15 @@ from pydantic import BaseModel, Field
 
 from app.core.dependencies import get_current_user
 from app.models.auth import UserInfo
+from app.models.chat import ChatEvent
 from app.services.chat_service import chat_service
 
+try:
+    from fastapi.sse import EventSourceResponse, ServerSentEvent
+except ImportError:  # FastAPI < 0.135 has no native SSE support
+    EventSourceResponse = None
+    ServerSentEvent = None
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
@@ -17,21 +26,39 @@ router = APIRouter(prefix="/chat", tags=["chat"])
 
 class ChatRequest(BaseModel):
     query: str = Field(..., min_length=1, max_length=2000)
-    language: str = Field(default="de", pattern=r"^(de|en)$")
-
-
-@router.post("/stream", response_class=StreamingResponse)
-async def chat_stream(
-    request: ChatRequest,
-    user: UserInfo = Depends(get_current_user),  # noqa: B008
-):
-    logger.info("Chat stream request from user=%s query=%s", user.name, request.query[:50])
-
-    return StreamingResponse(
-        chat_service.stream_chat(query=request.query, language=request.language),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+    language: Literal["de", "en"] = "de"
+
+
+if EventSourceResponse is not None:
+
+    @router.post("/stream", response_class=EventSourceResponse)
+    async def chat_stream(
+        request: ChatRequest,
+        user: UserInfo = Depends(get_current_user),  # noqa: B008
+    ) -> AsyncIterator[ServerSentEvent]:
+        logger.info("Chat stream request from user=%s query=%s", user.name, request.query[:50])
+
+        async for event in chat_service.stream_chat(query=request.query, language=request.language):
+            yield ServerSentEvent(event=event.event, data=event.data)
+
+else:
+
+    async def _encode_events(events: AsyncIterator[ChatEvent]) -> AsyncIterator[str]:
+        async for event in events:
+            yield event.encode()
+
+    @router.post("/stream", response_class=StreamingResponse)
+    async def chat_stream(
+        request: ChatRequest,
+        user: UserInfo = Depends(get_current_user),  # noqa: B008
+    ):
+        logger.info("Chat stream request from user=%s query=%s", user.name, request.query[:50])
+
+        return StreamingResponse(
+            _encode_events(chat_service.stream_chat(query=request.query, language=request.language)),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+            },
+        )
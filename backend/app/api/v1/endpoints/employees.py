@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 
 from app.core.dependencies import get_current_user
 from app.models.auth import UserInfo
@@ -13,6 +14,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
+_EMPLOYEE_LIST_ADAPTER = TypeAdapter(list[EmployeeSummary])
+
 
 @router.get("", response_model=list[EmployeeSummary])
 async def list_employees(
@@ -21,7 +24,7 @@ async def list_employees(
     user: UserInfo = Depends(get_current_user),  # noqa: B008
 ):
     try:
-        return await employee_service.get_employees(skip=skip, limit=limit)
+        employees = await employee_service.get_employees(skip=skip, limit=limit)
     except Exception as err:
         logger.exception("Failed to list employees")
         raise HTTPException(
@@ -29,6 +32,10 @@ async def list_employees(
             detail="Failed to retrieve employees",
         ) from err
 
+    # The service already returns EmployeeSummary instances, so serialize them
+    # directly; response_model is kept for the OpenAPI schema only.
+    return Response(_EMPLOYEE_LIST_ADAPTER.dump_json(employees), media_type="application/json")
+
 
 @router.get("/{alias}", response_model=EmployeeDetail)
 async def get_employee(
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import asyncio
+import time
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.core.dependencies import get_current_user
@@ -11,45 +17,55 @@ from app.services.search_service import search_service
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+_HEALTH_CACHE_TTL_SECONDS = 1.0
+_READY_BODY = orjson.dumps({"ready": True})
 
-@router.get("")
-async def health_check():
-    services: dict[str, str] = {}
+# (monotonic timestamp, payload) of the last /health evaluation
+_health_cache: tuple[float, dict[str, Any]] | None = None
 
-    try:
-        if employee_service.initialized:
-            ok = await employee_service.check_connection()
-            services["cosmos_db"] = "ok" if ok else "error"
-        else:
-            services["cosmos_db"] = "not_configured"
-    except Exception:
-        services["cosmos_db"] = "error"
 
+async def _probe(service: Any) -> str:
+    if not service.initialized:
+        return "not_configured"
     try:
-        if search_service.initialized:
-            ok = await search_service.check_connection()
-            services["azure_search"] = "ok" if ok else "error"
-        else:
-            services["azure_search"] = "not_configured"
+        return "ok" if await service.check_connection() else "error"
     except Exception:
-        services["azure_search"] = "error"
+        return "error"
 
-    try:
-        if embedding_service.initialized:
-            ok = await embedding_service.check_connection()
-            services["azure_openai"] = "ok" if ok else "error"
-        else:
-            services["azure_openai"] = "not_configured"
-    except Exception:
-        services["azure_openai"] = "error"
+
+async def _check_cosmos() -> tuple[str, str]:
+    return "cosmos_db", await _probe(employee_service)
+
+
+async def _check_search() -> tuple[str, str]:
+    return "azure_search", await _probe(search_service)
+
+
+async def _check_openai() -> tuple[str, str]:
+    return "azure_openai", await _probe(embedding_service)
+
+
+@router.get("", response_class=ORJSONResponse)
+async def health_check():
+    global _health_cache
+    # Probes poll every replica every few seconds; reuse the last result briefly
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < _HEALTH_CACHE_TTL_SECONDS:
+        return ORJSONResponse(_health_cache[1])
+
+    # Each probe handles its own errors; running them together bounds the
+    # endpoint by the slowest service instead of the sum of all three.
+    services: dict[str, str] = dict(await asyncio.gather(_check_cosmos(), _check_search(), _check_openai()))
 
     all_ok = all(v in ("ok", "not_configured") for v in services.values())
 
-    return {
+    payload = {
         "status": "healthy" if all_ok else "degraded",
         "version": settings.APP_VERSION,
         "services": services,
     }
+    _health_cache = (now, payload)
+    return ORJSONResponse(payload)
 
 
 @router.get("/protected")
@@ -57,6 +73,6 @@ async def health_protected(user: UserInfo = Depends(get_current_user)):  # noqa:
     return {"status": "ok", "user": user.model_dump()}
 
 
-@router.get("/ready")
+@router.get("/ready", response_class=ORJSONResponse)
 async def readiness_probe():
-    return {"ready": True}
+    return Response(_READY_BODY, media_type="application/json")
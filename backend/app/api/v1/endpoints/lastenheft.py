@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile, status
 
 from app.core.dependencies import get_current_user
 from app.models.auth import UserInfo
@@ -27,25 +27,30 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/lastenheft", tags=["lastenheft"])
 
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 @router.post("/upload", response_model=LastenheftUploadResponse)
 async def upload_lastenheft(
     file: UploadFile,
     user: UserInfo = Depends(get_current_user),  # noqa: B008
 ):
-    if file.content_type not in SUPPORTED_CONTENT_TYPES:
+    fmt = SUPPORTED_CONTENT_TYPES.get(file.content_type)
+    if fmt is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Unsupported file type: {file.content_type}. Allowed: PDF, DOCX",
         )
 
-    file_bytes = await file.read()
-
-    if len(file_bytes) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large: {len(file_bytes)} bytes. Maximum: {MAX_FILE_SIZE} bytes (10 MB)",
-        )
+    # Read in chunks so oversized uploads are rejected without buffering them whole
+    file_bytes = bytearray()
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        file_bytes += chunk
+        if len(file_bytes) > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Maximum: {MAX_FILE_SIZE} bytes (10 MB)",
+            )
 
     if not file_bytes:
         raise HTTPException(
@@ -54,7 +59,7 @@ async def upload_lastenheft(
         )
 
     try:
-        extracted = document_extractor.extract(file_bytes, file.content_type)
+        extracted = await document_extractor.extract_async(file_bytes, file.content_type)
     except DocumentExtractionError as e:
         logger.error("Extraction failed for file=%s: %s", file.filename, e)
         raise HTTPException(
@@ -62,7 +67,6 @@ async def upload_lastenheft(
             detail=str(e),
         ) from e
 
-    fmt = SUPPORTED_CONTENT_TYPES[file.content_type]
     logger.info("Extracted %d chars from %s (%s) user=%s", len(extracted), file.filename, fmt, user.name)
 
     return LastenheftUploadResponse(
@@ -109,7 +113,9 @@ async def analyze_lastenheft(
         len(result.extracted_skills),
         user.name,
     )
-    return result
+    # Already a validated model: serialize once instead of letting FastAPI
+    # re-validate it against response_model, which stays for the OpenAPI schema.
+    return Response(result.model_dump_json(), media_type="application/json")
 
 
 @router.post("/match", response_model=CandidateMatchResponse)
@@ -132,4 +138,4 @@ async def match_candidates(
         result.total_candidates_searched,
         user.name,
     )
-    return result
+    return Response(result.model_dump_json(), media_type="application/json")
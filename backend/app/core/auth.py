@@ -2,62 +2,136 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import time
-import urllib.error
-import urllib.request
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
+import aiohttp
+import orjson
 from fastapi import HTTPException, status
 from jose import jwk, jwt
+from jose.backends.base import Key
 from jose.constants import Algorithms
-from jose.exceptions import ExpiredSignatureError, JWSSignatureError, JWTClaimsError, JWTError
+from jose.exceptions import ExpiredSignatureError, JWKError, JWSSignatureError, JWTClaimsError, JWTError
 
 logger = logging.getLogger("azure_auth")
 
 _JWKS_TTL_SECONDS = 24 * 60 * 60
+_JWKS_TIMEOUT = aiohttp.ClientTimeout(total=15)
 
 _cache: dict[str, Any] = {
     "jwks": {},
     "jwks_timestamp": {},
+    "keys_by_kid": {},
 }
 
 
-def get_jwks(tenant_id: str) -> dict[str, Any]:
-    cache_key = f"jwks_{tenant_id}"
-    now = time.time()
+_jwks_session: aiohttp.ClientSession | None = None
+_owns_jwks_session = False
+# One lock per tenant so a slow refresh for one tenant never blocks another
+_jwks_refresh_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def init_jwks_session(session: aiohttp.ClientSession | None = None) -> None:
+    """Set the HTTP session used for JWKS downloads (called from the app lifespan).
+
+    A session passed in is shared and left for its owner to close; otherwise
+    a private one is opened.
+    """
+    global _jwks_session, _owns_jwks_session
+    if session is not None:
+        _jwks_session, _owns_jwks_session = session, False
+    elif _jwks_session is None or _jwks_session.closed:
+        _jwks_session, _owns_jwks_session = aiohttp.ClientSession(), True
+
+
+async def close_jwks_session() -> None:
+    global _jwks_session, _owns_jwks_session
+    if _jwks_session is not None and _owns_jwks_session:
+        await _jwks_session.close()
+    _jwks_session, _owns_jwks_session = None, False
 
+
+def _get_cached_jwks(cache_key: str, now: float) -> dict[str, Any] | None:
     if (
         cache_key in _cache["jwks"]
         and cache_key in _cache["jwks_timestamp"]
         and now - _cache["jwks_timestamp"][cache_key] < _JWKS_TTL_SECONDS
     ):
         return _cache["jwks"][cache_key]
+    return None
 
-    jwks_uri = f"https://login.microsoftonline.com/{tenant_id}/discovery/v2.0/keys"
-    logger.info("Fetching JWKS from %s", jwks_uri)
 
-    try:
-        req = urllib.request.Request(jwks_uri)  # noqa: S310
-        with urllib.request.urlopen(req, timeout=15) as resp:  # noqa: S310
-            jwks = json.loads(resp.read().decode())
+async def get_jwks(tenant_id: str) -> dict[str, Any]:
+    cache_key = f"jwks_{tenant_id}"
 
-        _cache["jwks"][cache_key] = jwks
-        _cache["jwks_timestamp"][cache_key] = now
+    jwks = _get_cached_jwks(cache_key, time.time())
+    if jwks is not None:
         return jwks
-    except (urllib.error.URLError, urllib.error.HTTPError) as e:
-        logger.error("Failed to fetch JWKS: %s", e)
-        if cache_key in _cache["jwks"]:
-            logger.warning("Using expired JWKS from cache for tenant %s", tenant_id)
-            return _cache["jwks"][cache_key]
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Could not fetch JWKS: {e}",
-        ) from e
+
+    # Concurrent cache misses wait here; the first one fetches, the rest find the
+    # refreshed entry on the re-check and return without another HTTPS call.
+    async with _jwks_refresh_locks[cache_key]:
+        now = time.time()
+        jwks = _get_cached_jwks(cache_key, now)
+        if jwks is not None:
+            return jwks
+
+        if _jwks_session is None or _jwks_session.closed:
+            await init_jwks_session()
+
+        jwks_uri = f"https://login.microsoftonline.com/{tenant_id}/discovery/v2.0/keys"
+        logger.info("Fetching JWKS from %s", jwks_uri)
+
+        try:
+            async with _jwks_session.get(jwks_uri, timeout=_JWKS_TIMEOUT) as resp:
+                resp.raise_for_status()
+                jwks = orjson.loads(await resp.read())
+
+            _cache["jwks"][cache_key] = jwks
+            _cache["jwks_timestamp"][cache_key] = now
+            return jwks
+        except (aiohttp.ClientError, TimeoutError) as e:
+            logger.error("Failed to fetch JWKS: %s", e)
+            if cache_key in _cache["jwks"]:
+                logger.warning("Using expired JWKS from cache for tenant %s", tenant_id)
+                return _cache["jwks"][cache_key]
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Could not fetch JWKS: {e}",
+            ) from e
+
+
+def _get_keys_by_kid(tenant_id: str, jwks: dict[str, Any]) -> dict[str, tuple[Key, str]]:
+    """Return ``{kid: (constructed_key, algorithm)}`` for a JWKS document.
+
+    The mapping is rebuilt only when ``get_jwks`` hands back a different JWKS
+    object, i.e. after a refresh, so steady-state lookups are a single dict access.
+    """
+    cache_key = f"jwks_{tenant_id}"
+    cached = _cache["keys_by_kid"].get(cache_key)
+    if cached is not None and cached[0] is jwks:
+        return cached[1]
+
+    keys_by_kid: dict[str, tuple[Key, str]] = {}
+    for key in jwks.get("keys", []):
+        kid = key.get("kid")
+        if not kid:
+            continue
+        algorithm = key.get("alg", Algorithms.RS256)
+        try:
+            keys_by_kid[kid] = (jwk.construct(key, algorithm=algorithm), algorithm)
+        except JWKError as e:
+            logger.warning("Skipping unusable JWKS key kid=%s: %s", kid, e)
+
+    _cache["keys_by_kid"][cache_key] = (jwks, keys_by_kid)
+    return keys_by_kid
 
 
-def get_signing_key(token: str, tenant_id: str) -> dict[str, str]:
+async def get_signing_key(token: str, tenant_id: str) -> tuple[Key, str]:
     try:
         header = jwt.get_unverified_header(token)
     except JWTError as e:
@@ -73,10 +147,9 @@ def get_signing_key(token: str, tenant_id: str) -> dict[str, str]:
             detail="Token has no 'kid' in header",
         )
 
-    jwks = get_jwks(tenant_id)
-    for key in jwks.get("keys", []):
-        if key.get("kid") == kid:
-            return key
+    signing_key = _get_keys_by_kid(tenant_id, await get_jwks(tenant_id)).get(kid)
+    if signing_key is not None:
+        return signing_key
 
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -84,72 +157,83 @@ def get_signing_key(token: str, tenant_id: str) -> dict[str, str]:
     )
 
 
-def validate_token(token: str, tenant_id: str, client_id: str) -> dict[str, Any]:
+@lru_cache(maxsize=8)
+def _expected_claims(tenant_id: str, client_id: str) -> tuple[frozenset[str], frozenset[str]]:
+    """Allowed ``iss`` and ``aud`` values, built once per tenant/client pair."""
+    issuers = frozenset(
+        {
+            f"https://login.microsoftonline.com/{tenant_id}/v2.0",
+            f"https://sts.windows.net/{tenant_id}/",
+        }
+    )
+    audiences = frozenset({client_id, f"api://{client_id}"})
+    return issuers, audiences
+
+
+async def validate_token(token: str, tenant_id: str, client_id: str) -> dict[str, Any]:
     if not tenant_id or not client_id:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Missing Azure AD configuration",
         )
 
-    signing_key_dict = get_signing_key(token, tenant_id)
-    algorithm = signing_key_dict.get("alg", Algorithms.RS256)
-    public_key = jwk.construct(signing_key_dict, algorithm=algorithm)
+    public_key, algorithm = await get_signing_key(token, tenant_id)
 
-    expected_issuers = [
-        f"https://login.microsoftonline.com/{tenant_id}/v2.0",
-        f"https://sts.windows.net/{tenant_id}/",
-    ]
-    expected_audiences = [client_id, f"api://{client_id}"]
+    expected_issuers, expected_audiences = _expected_claims(tenant_id, client_id)
 
+    # Issuer and audience (including their presence) are checked below against the
+    # allowed values, so the signature is verified once instead of once per (iss, aud)
+    # pair. jose's require_iss/require_aud would re-enable its single-value checks.
     options = {
         "verify_signature": True,
-        "verify_aud": True,
-        "verify_iss": True,
+        "verify_aud": False,
+        "verify_iss": False,
         "verify_exp": True,
-        "require": ["exp", "iss", "aud"],
+        "require_exp": True,
     }
 
-    last_error: Exception | None = None
-
-    for issuer in expected_issuers:
-        for audience in expected_audiences:
-            try:
-                return jwt.decode(
-                    token,
-                    public_key,
-                    algorithms=[algorithm],
-                    audience=audience,
-                    issuer=issuer,
-                    options=options,
-                )
-            except ExpiredSignatureError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token is expired",
-                ) from e
-            except JWSSignatureError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid token signature",
-                ) from e
-            except (JWTClaimsError, JWTError) as e:
-                last_error = e
-                continue
-
-    detail = "Invalid authentication credentials"
-    if isinstance(last_error, JWTClaimsError) and "audience" in str(last_error).lower():
-        detail = f"Invalid token audience. Expected one of: {expected_audiences}"
-    elif isinstance(last_error, JWTClaimsError) and "issuer" in str(last_error).lower():
-        detail = f"Invalid token issuer. Expected one of: {expected_issuers}"
+    try:
+        payload = jwt.decode(
+            token,
+            public_key,
+            algorithms=[algorithm],
+            options=options,
+        )
+    except ExpiredSignatureError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token is expired",
+        ) from e
+    except JWSSignatureError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token signature",
+        ) from e
+    except (JWTClaimsError, JWTError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+        ) from e
+
+    if payload.get("iss") not in expected_issuers:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid token issuer. Expected one of: {sorted(expected_issuers)}",
+        )
 
-    raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail=detail,
-    )
+    audience = payload.get("aud")
+    token_audiences = audience if isinstance(audience, list) else [audience]
+    if expected_audiences.isdisjoint(token_audiences):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid token audience. Expected one of: {sorted(expected_audiences)}",
+        )
+
+    return payload
 
 
-def extract_roles_from_token(payload: dict[str, Any]) -> list[str]:
-    roles = payload.get("roles", [])
+def extract_roles_from_token(payload: dict[str, Any]) -> tuple[str, ...]:
+    roles = payload.get("roles", ())
     if not isinstance(roles, list):
-        return []
-    return [str(r) for r in roles if isinstance(r, str | int)]
+        return ()
+    return tuple(str(r) for r in roles if isinstance(r, str | int))
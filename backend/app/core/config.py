@@ -13,6 +13,10 @@ class Settings(BaseSettings):
     COSMOS_DB_KEY: str = ""
     COSMOS_DB_DATABASE: str = "emposo-db"
     COSMOS_DB_EMPLOYEES_CONTAINER: str = "employee"
+    # Partition key path of the employees container, if known. Set it to "/id" only when the
+    # container really is partitioned on id: lookups then try a 1 RU point read before the
+    # cross-partition query. Left empty, every lookup goes straight to the query.
+    COSMOS_DB_EMPLOYEES_PARTITION_KEY: str = ""
 
     AZURE_SEARCH_ENDPOINT: str = ""
     AZURE_SEARCH_KEY: str = ""
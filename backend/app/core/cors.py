@@ -0,0 +1,29 @@
+"""CORS middleware tuned for a fixed origin allow-list."""
+
+from __future__ import annotations
+
+import typing
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class CachedCORSMiddleware(CORSMiddleware):
+    """Starlette's CORSMiddleware with O(1) origin matching.
+
+    Starlette already pre-joins the Allow-Methods/Allow-Headers/Max-Age values in
+    ``__init__``; what it still does per request is a linear scan of
+    ``allow_origins``. Storing the origins as a frozenset turns that into a
+    hash lookup. Requests without an ``Origin`` header (health probes,
+    server-to-server calls) skip the middleware before any header parsing.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: typing.Sequence[str] = (), **kwargs: typing.Any) -> None:
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allow_origins = frozenset(allow_origins)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not any(name == b"origin" for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
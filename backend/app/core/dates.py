@@ -0,0 +1,45 @@
+"""Start-date parsing shared by the employee API and the reindex script."""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+from functools import lru_cache
+
+# Formats seen in Cosmos employee records: 2020-01-15T08:00:00, 2020-01-15, 2020-01, 2020, 15.01.2020
+_START_DATE_RE = re.compile(
+    r"(\d{4})(?:-(\d{1,2})(?:-(\d{1,2})(?:T\d{1,2}:\d{1,2}:\d{1,2})?)?)?|(\d{1,2})\.(\d{1,2})\.(\d{4})"
+)
+
+
+# Cached on the string only: the same start dates recur across list pages and reindex runs,
+# while "today" is applied afterwards so results never go stale
+@lru_cache(maxsize=4096)
+def parse_start_date(value: str) -> date | None:
+    """Parse ``value`` in one of the supported formats, or return ``None``."""
+    match = _START_DATE_RE.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day, de_day, de_month, de_year = match.groups()
+    try:
+        if de_year is not None:
+            return date(int(de_year), int(de_month), int(de_day))
+        return date(int(year), int(month or 1), int(day or 1))
+    except ValueError:
+        return None
+
+
+def years_since(start_date: str | None) -> float | None:
+    """Years elapsed since ``start_date``, or ``None`` when it is missing or unparseable."""
+    if not start_date:
+        return None
+    start = parse_start_date(start_date)
+    if start is None:
+        return None
+    return (date.today().toordinal() - start.toordinal()) / 365.25
+
+
+def years_since_str(start_date: str | None) -> str:
+    """``years_since`` formatted with one decimal, or ``"N/A"``."""
+    years = years_since(start_date)
+    return "N/A" if years is None else f"{years:.1f}"
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 
 from fastapi import Depends, Header, HTTPException, status
 
@@ -10,6 +13,48 @@ from app.models.auth import UserInfo
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_CACHE_MAX_SIZE = 4096
+_TOKEN_CACHE_EXPIRY_SKEW_SECONDS = 5
+_TOKEN_CACHE_MAX_TTL_SECONDS = 300
+
+# blake2b(token) -> (user, cache expiry timestamp), kept in LRU order. Entries expire
+# at the token's exp (minus skew) or after _TOKEN_CACHE_MAX_TTL_SECONDS, whichever is first.
+_token_cache: OrderedDict[bytes, tuple[UserInfo, float]] = OrderedDict()
+
+
+async def _get_user_cached(token: str) -> UserInfo:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        user, expires_at = cached
+        if now < expires_at:
+            _token_cache.move_to_end(key)
+            return user
+        del _token_cache[key]
+
+    payload = await validate_token(
+        token,
+        settings.AZURE_AD_TENANT_ID,
+        settings.AZURE_AD_CLIENT_ID,
+    )
+    user = UserInfo(
+        id=payload.get("oid"),
+        name=payload.get("name"),
+        email=payload.get("preferred_username"),
+        roles=extract_roles_from_token(payload),
+    )
+
+    # Only successful validations reach this point; failures are never cached
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        expires_at = min(float(exp) - _TOKEN_CACHE_EXPIRY_SKEW_SECONDS, now + _TOKEN_CACHE_MAX_TTL_SECONDS)
+        _token_cache[key] = (user, expires_at)
+        if len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+
+    return user
+
 
 async def get_current_user(authorization: str | None = Header(None)) -> UserInfo:
     if not authorization or not authorization.startswith("Bearer "):
@@ -19,14 +64,10 @@ async def get_current_user(authorization: str | None = Header(None)) -> UserInfo
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token = authorization.split(" ", 1)[1]
+    token = authorization[7:].strip()
 
     try:
-        payload = validate_token(
-            token,
-            settings.AZURE_AD_TENANT_ID,
-            settings.AZURE_AD_CLIENT_ID,
-        )
+        return await _get_user_cached(token)
     except HTTPException:
         raise
     except Exception as e:
@@ -37,18 +78,12 @@ async def get_current_user(authorization: str | None = Header(None)) -> UserInfo
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
-    roles = extract_roles_from_token(payload)
-    return UserInfo(
-        id=payload.get("oid"),
-        name=payload.get("name"),
-        email=payload.get("preferred_username"),
-        roles=roles,
-    )
-
 
 def require_role(*roles: str):
+    allowed = frozenset(roles)
+
     async def _check_role(user: UserInfo = Depends(get_current_user)) -> UserInfo:  # noqa: B008
-        if not any(r in user.roles for r in roles):
+        if allowed.isdisjoint(user.roles):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Required: {', '.join(roles)}",
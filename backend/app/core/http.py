@@ -0,0 +1,22 @@
+"""Shared aiohttp session for outbound REST calls (Azure AD, Azure AI Search)."""
+
+from __future__ import annotations
+
+import aiohttp
+
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create the pooled session owned by the app lifespan.
+
+    Keeping one session per process lets aiohttp reuse keep-alive connections
+    and cached DNS lookups instead of paying a TCP+TLS handshake per call.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=30,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=_DEFAULT_TIMEOUT)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import copy
 import logging
+from functools import lru_cache
 
 import aiohttp
+import orjson
 
 from app.core.config import Settings
 
@@ -82,45 +83,73 @@ INDEX_SCHEMA: dict[str, object] = {
 }
 
 
-async def create_or_update_index(settings: Settings) -> bool:
-    """Create or update the Azure AI Search index via REST API."""
-    endpoint = settings.AZURE_SEARCH_ENDPOINT.rstrip("/")
-    api_key = settings.AZURE_SEARCH_KEY
-    api_version = settings.AZURE_SEARCH_API_VERSION
+# Serialized once; decoding it is a cheaper fresh copy than deepcopy per call
+_INDEX_SCHEMA_BYTES = orjson.dumps(INDEX_SCHEMA)
 
-    if not endpoint or not api_key:
-        logger.warning("Azure Search credentials missing — index not created")
-        return False
 
-    index_name = settings.AZURE_SEARCH_INDEX or INDEX_SCHEMA["name"]
-    payload = copy.deepcopy(INDEX_SCHEMA)
+@lru_cache(maxsize=4)
+def _index_body(index_name: str, dimensions: int) -> bytes:
+    """Encoded index definition for ``index_name`` with the given vector dimensions."""
+    payload = orjson.loads(_INDEX_SCHEMA_BYTES)
     payload["name"] = index_name
 
     fields = payload.get("fields")
     if isinstance(fields, list):
         for field in fields:
             if field.get("name") == "contentVector":
-                field["dimensions"] = settings.OPENAI_EMBEDDING_DIMENSIONS
+                field["dimensions"] = dimensions
                 break
 
+    return orjson.dumps(payload)
+
+
+async def create_or_update_index(settings: Settings, session: aiohttp.ClientSession | None = None) -> bool:
+    """Create or update the Azure AI Search index via REST API.
+
+    Uses ``session`` when given (e.g. ``app.state.http``), otherwise a one-off session.
+    """
+    endpoint = settings.AZURE_SEARCH_ENDPOINT.rstrip("/")
+    api_key = settings.AZURE_SEARCH_KEY
+    api_version = settings.AZURE_SEARCH_API_VERSION
+
+    if not endpoint or not api_key:
+        logger.warning("Azure Search credentials missing — index not created")
+        return False
+
+    index_name = settings.AZURE_SEARCH_INDEX or INDEX_SCHEMA["name"]
+    body = _index_body(index_name, settings.OPENAI_EMBEDDING_DIMENSIONS)
+
     url = f"{endpoint}/indexes/{index_name}?api-version={api_version}"
     headers = {"Content-Type": "application/json", "api-key": api_key}
 
     try:
         timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.put(url, headers=headers, json=payload) as response:
-                if response.status in (200, 201):
-                    logger.info("Search index created/updated: %s", index_name)
-                    return True
-
-                error_text = await response.text()
-                logger.error(
-                    "Search index creation failed (%s): %s",
-                    response.status,
-                    error_text,
-                )
-                return False
+        if session is not None:
+            return await _put_index(session, url, headers, body, timeout, index_name)
+        async with aiohttp.ClientSession() as own_session:
+            return await _put_index(own_session, url, headers, body, timeout, index_name)
     except Exception:
         logger.exception("Search index creation failed")
         return False
+
+
+async def _put_index(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: dict[str, str],
+    body: bytes,
+    timeout: aiohttp.ClientTimeout,
+    index_name: str,
+) -> bool:
+    async with session.put(url, headers=headers, data=body, timeout=timeout) as response:
+        if response.status in (200, 201):
+            logger.info("Search index created/updated: %s", index_name)
+            return True
+
+        error_text = await response.text()
+        logger.error(
+            "Search index creation failed (%s): %s",
+            response.status,
+            error_text,
+        )
+        return False
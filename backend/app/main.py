@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable
 from contextlib import asynccontextmanager
+from typing import Any
 
+import aiohttp
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.router import api_router
+from app.core.auth import close_jwks_session, init_jwks_session
 from app.core.config import settings
+from app.core.cors import CachedCORSMiddleware
+from app.core.http import create_http_session
 from app.services.candidate_matcher import candidate_matcher
 from app.services.chat_service import chat_service
 from app.services.embedding_service import embedding_service
@@ -18,40 +25,57 @@ from app.services.search_service import search_service
 
 logger = logging.getLogger(__name__)
 
+# (service, what the app runs without if its initialization fails)
+_SERVICES = (
+    (employee_service, "DB"),
+    (embedding_service, "OpenAI"),
+    (search_service, "search"),
+    (chat_service, "chat"),
+    (lastenheft_analyzer, "analyzer"),
+    (candidate_matcher, "matcher"),
+)
+
+
+def _initialize(service: Any, http_session: aiohttp.ClientSession) -> Awaitable[None]:
+    if service is search_service:
+        return search_service.initialize(settings, session=http_session)
+    return service.initialize(settings)
+
 
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncIterator[None]:
-    try:
-        await employee_service.initialize(settings)
-    except Exception:
-        logger.exception("Failed to initialize EmployeeService — continuing without DB")
-    try:
-        await embedding_service.initialize(settings)
-    except Exception:
-        logger.exception("Failed to initialize EmbeddingService — continuing without OpenAI")
-    try:
-        await search_service.initialize(settings)
-    except Exception:
-        logger.exception("Failed to initialize SearchService — continuing without search")
-    try:
-        await chat_service.initialize(settings)
-    except Exception:
-        logger.exception("Failed to initialize ChatService — continuing without chat")
-    try:
-        await lastenheft_analyzer.initialize(settings)
-    except Exception:
-        logger.exception("Failed to initialize LastenheftAnalyzer — continuing without analyzer")
-    try:
-        await candidate_matcher.initialize(settings)
-    except Exception:
-        logger.exception("Failed to initialize CandidateMatcher — continuing without matcher")
+    # A sync generator would be iterated on the threadpool by StreamingResponse
+    if not inspect.isasyncgenfunction(chat_service.stream_chat):
+        raise RuntimeError("ChatService.stream_chat must be an async generator function")
+
+    # One pooled session for our own REST calls (JWKS, Azure AI Search)
+    http_session = create_http_session()
+    application.state.http = http_session
+    await init_jwks_session(http_session)
+
+    # Independent Azure SDK handshakes; overlap them so cold start is max(), not sum()
+    results = await asyncio.gather(
+        *(_initialize(service, http_session) for service, _ in _SERVICES),
+        return_exceptions=True,
+    )
+    for (service, unavailable), result in zip(_SERVICES, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error(
+                "Failed to initialize %s — continuing without %s",
+                type(service).__name__,
+                unavailable,
+                exc_info=result,
+            )
     yield
-    await employee_service.close()
-    await embedding_service.close()
-    await search_service.close()
-    await chat_service.close()
-    await lastenheft_analyzer.close()
-    await candidate_matcher.close()
+    results = await asyncio.gather(
+        *(service.close() for service, _ in _SERVICES),
+        close_jwks_session(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Error during shutdown", exc_info=result)
+    await http_session.close()
 
 
 app = FastAPI(
@@ -59,10 +83,11 @@ app = FastAPI(
     description="AI Employee Search + Lastenheft Analyzer",
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
-    CORSMiddleware,
+    CachedCORSMiddleware,
     allow_origins=[
         "http://localhost:5173",
         "https://cvision.emposo.eu",
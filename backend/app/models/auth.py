@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TokenPayload(BaseModel):
     oid: str | None = None
     name: str | None = None
     preferred_username: str | None = None
-    roles: list[str] = []
+    roles: tuple[str, ...] = ()
 
 
 class UserInfo(BaseModel):
+    # Instances are cached per token and shared between requests
+    model_config = ConfigDict(frozen=True)
+
     id: str | None = None
     name: str | None = None
     email: str | None = None
-    roles: list[str] = []
+    roles: tuple[str, ...] = ()
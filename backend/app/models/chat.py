@@ -0,0 +1,19 @@
+"""Models for the streaming chat endpoint."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+
+
+class ChatEvent(BaseModel):
+    """A single Server-Sent Event emitted by the chat stream."""
+
+    event: str
+    data: dict[str, Any]
+
+    def encode(self) -> str:
+        """Render the event in SSE wire format (``event: ...\\ndata: ...\\n\\n``)."""
+        return f"event: {self.event}\ndata: {orjson.dumps(self.data).decode()}\n\n"
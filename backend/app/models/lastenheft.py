@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, Field, field_serializer
 
 
 class LastenheftTextRequest(BaseModel):
@@ -16,7 +18,7 @@ class LastenheftUploadResponse(BaseModel):
 
     extracted_text: str
     char_count: int
-    format: str = Field(..., pattern=r"^(pdf|docx|text)$")
+    format: Literal["pdf", "docx", "text"]
 
 
 class QualityScore(BaseModel):
@@ -34,20 +36,17 @@ class OpenQuestion(BaseModel):
     """An open question identified in a Lastenheft."""
 
     question: str
-    category: str = Field(..., pattern=r"^(technical|team|timeline|budget|domain)$")
-    priority: str = Field(..., pattern=r"^(high|medium|low)$")
+    category: Literal["technical", "team", "timeline", "budget", "domain"]
+    priority: Literal["high", "medium", "low"]
 
 
 class ExtractedSkill(BaseModel):
     """A skill extracted from a Lastenheft."""
 
     name: str
-    category: str = Field(
-        ...,
-        pattern=r"^(programming|framework|cloud|database|methodology|soft_skill|domain|other)$",
-    )
+    category: Literal["programming", "framework", "cloud", "database", "methodology", "soft_skill", "domain", "other"]
     mandatory: bool
-    level: str | None = Field(default=None, pattern=r"^(junior|mid|senior|expert)$")
+    level: Literal["junior", "mid", "senior", "expert"] | None = None
 
 
 class LastenheftAnalysisRequest(BaseModel):
@@ -79,6 +78,10 @@ class ScoreBreakdown(BaseModel):
     semantic_similarity: float = Field(..., ge=0.0, le=1.0)
     availability: float = Field(..., ge=0.0, le=1.0)
 
+    @field_serializer("skill_match", "experience", "semantic_similarity", "availability")
+    def _round_score(self, value: float) -> float:
+        return round(value, 4)
+
 
 class CandidateMatch(BaseModel):
     """A single candidate match result with scoring details."""
@@ -92,6 +95,10 @@ class CandidateMatch(BaseModel):
     breakdown: ScoreBreakdown
     explanation: str
 
+    @field_serializer("total_score")
+    def _round_total(self, value: float) -> float:
+        return round(value, 4)
+
 
 class CandidateMatchResponse(BaseModel):
     """Response containing ranked candidate matches."""
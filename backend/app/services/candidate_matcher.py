@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import json
+import heapq
 import logging
+from operator import itemgetter
 
+import orjson
 from openai import AsyncAzureOpenAI
 
 from app.core.config import Settings
@@ -43,25 +45,33 @@ class CandidateMatcherError(Exception):
     pass
 
 
+def lower_required_skills(skills: list[ExtractedSkill]) -> list[tuple[str, float]]:
+    """``(lowercased name, weight)`` per required skill; mandatory skills count double."""
+    return [(s.name.lower(), 2.0 if s.mandatory else 1.0) for s in skills]
+
+
+def employee_skill_set(employee_skills: list[str], employee_tools: list[str]) -> frozenset[str]:
+    return frozenset(map(str.lower, employee_skills)) | frozenset(map(str.lower, employee_tools))
+
+
 def calculate_skill_match(
-    required_skills: list[ExtractedSkill],
-    employee_skills: list[str],
-    employee_tools: list[str],
+    required_skills: list[tuple[str, float]],
+    employee_set: frozenset[str],
 ) -> float:
-    if not required_skills:
-        return 0.0
+    """Weighted share of ``required_skills`` found in ``employee_set``.
 
-    employee_set = {s.lower() for s in employee_skills} | {t.lower() for t in employee_tools}
-    if not employee_set:
+    Both arguments are expected pre-lowercased, see ``lower_required_skills``
+    and ``employee_skill_set``.
+    """
+    if not required_skills or not employee_set:
         return 0.0
 
     weighted_total = 0.0
     weighted_matched = 0.0
 
-    for skill in required_skills:
-        weight = 2.0 if skill.mandatory else 1.0
+    for name, weight in required_skills:
         weighted_total += weight
-        if skill.name.lower() in employee_set:
+        if name in employee_set:
             weighted_matched += weight
 
     if weighted_total == 0.0:
@@ -69,25 +79,42 @@ def calculate_skill_match(
     return weighted_matched / weighted_total
 
 
-def calculate_experience_score(required_level: str | None, years: float) -> float:
-    if required_level is None:
-        return 0.7
+class SkillSet:
+    """Views over a request's required skills, derived once per ``match`` call."""
 
-    level_ranges: dict[str, tuple[float, float]] = {
-        "junior": (0.0, 2.0),
-        "mid": (2.0, 5.0),
-        "senior": (5.0, 10.0),
-        "expert": (8.0, 20.0),
-    }
+    __slots__ = ("all", "lowered", "lowered_names", "mandatory", "mandatory_names", "names", "primary_level")
+
+    def __init__(self, skills: list[ExtractedSkill]) -> None:
+        self.all = skills
+        self.mandatory = [s for s in skills if s.mandatory]
+        self.names = [s.name for s in skills]
+        self.mandatory_names = [s.name for s in self.mandatory]
+        self.lowered = lower_required_skills(skills)
+        self.lowered_names = frozenset(name for name, _ in self.lowered)
+        # Level of the first mandatory skill that has one, else of the first skill that has one
+        self.primary_level: str | None = next(
+            (s.level for s in self.mandatory if s.level),
+            next((s.level for s in skills if s.level), None),
+        )
+
+
+# (ideal years, spread) per level; ideal is the midpoint of the level's year range and
+# spread is half that range plus two years of tolerance
+_EXP_PARAMS: dict[str, tuple[float, float]] = {
+    "junior": (1.0, 3.0),  # 0-2 years
+    "mid": (3.5, 3.5),  # 2-5 years
+    "senior": (7.5, 4.5),  # 5-10 years
+    "expert": (14.0, 8.0),  # 8-20 years
+}
+_DEFAULT_EXP_PARAMS = _EXP_PARAMS["mid"]
 
-    ideal_min, ideal_max = level_ranges.get(required_level, (2.0, 5.0))
-    ideal_mid = (ideal_min + ideal_max) / 2.0
 
-    distance = abs(years - ideal_mid)
-    spread = (ideal_max - ideal_min) / 2.0 + 2.0
+def calculate_experience_score(required_level: str | None, years: float) -> float:
+    if required_level is None:
+        return 0.7
 
-    score = max(0.0, 1.0 - (distance / spread))
-    return min(1.0, score)
+    ideal_mid, spread = _EXP_PARAMS.get(required_level, _DEFAULT_EXP_PARAMS)
+    return min(1.0, max(0.0, 1.0 - abs(years - ideal_mid) / spread))
 
 
 def normalize_search_score(score: float, max_score: float) -> float:
@@ -123,65 +150,32 @@ class CandidateMatcher:
         self.client = None
         self.initialized = False
 
-    def _build_search_query(self, skills: list[ExtractedSkill]) -> tuple[str, list[str]]:
-        mandatory = [s.name for s in skills if s.mandatory]
-        all_names = [s.name for s in skills]
+    def _build_search_query(self, skillset: SkillSet) -> tuple[str, list[str]]:
+        return " ".join(skillset.mandatory_names or skillset.names), skillset.names
 
-        query_skills = mandatory if mandatory else all_names
-        query_text = " ".join(query_skills)
-        return query_text, all_names
+    def _score_candidate(self, result: dict, skillset: SkillSet) -> tuple[float, float]:
+        """Return the (skill, experience) scores, which don't depend on the other search hits."""
+        employee_set = employee_skill_set(result.get("skills", []), result.get("tools", []))
+        # Most hits share few skills with the request; reject those with one C-level set check
+        if skillset.lowered_names.isdisjoint(employee_set):
+            skill_score = 0.0
+        else:
+            skill_score = calculate_skill_match(skillset.lowered, employee_set)
 
-    def _score_candidate(
-        self,
-        result: dict,
-        required_skills: list[ExtractedSkill],
-        max_search_score: float,
-    ) -> tuple[float, ScoreBreakdown]:
-        skill_score = calculate_skill_match(
-            required_skills,
-            result.get("skills", []),
-            result.get("tools", []),
-        )
-
-        primary_level = next(
-            (s.level for s in required_skills if s.mandatory and s.level),
-            next((s.level for s in required_skills if s.level), None),
-        )
         years = float(result.get("years_of_experience", 0) or 0)
-        experience_score = calculate_experience_score(primary_level, years)
-
-        semantic_score = normalize_search_score(
-            result.get("score", 0),
-            max_search_score,
-        )
-
-        availability_score = DEFAULT_AVAILABILITY
-
-        total = (
-            WEIGHT_SKILL_MATCH * skill_score
-            + WEIGHT_EXPERIENCE * experience_score
-            + WEIGHT_SEMANTIC * semantic_score
-            + WEIGHT_AVAILABILITY * availability_score
-        )
-
-        breakdown = ScoreBreakdown(
-            skill_match=round(skill_score, 4),
-            experience=round(experience_score, 4),
-            semantic_similarity=round(semantic_score, 4),
-            availability=round(availability_score, 4),
-        )
-        return round(total, 4), breakdown
+        experience_score = calculate_experience_score(skillset.primary_level, years)
+        return skill_score, experience_score
 
     async def _generate_explanations(
         self,
         candidates: list[dict],
-        skills: list[ExtractedSkill],
+        skillset: SkillSet,
         text: str,
     ) -> dict[str, str]:
         if not self.client:
             return {}
 
-        skill_summary = ", ".join(s.name for s in skills)
+        skill_summary = ", ".join(skillset.names)
         candidates_text = "\n".join(
             f"- {c['employee_alias']} ({c.get('employee_name', '')}): "
             f"Skills: {', '.join(c.get('skills', []))}, "
@@ -213,7 +207,7 @@ class CandidateMatcher:
             content = response.choices[0].message.content
             if not content:
                 return {}
-            data = json.loads(content)
+            data = orjson.loads(content)
             return {item["employee_alias"]: item["explanation"] for item in data.get("explanations", [])}
         except Exception:
             logger.exception("Failed to generate match explanations — continuing without")
@@ -227,7 +221,8 @@ class CandidateMatcher:
         if not self.initialized or not self.client:
             raise CandidateMatcherError("CandidateMatcher not initialized")
 
-        query_text, all_skill_names = self._build_search_query(skills)
+        skillset = SkillSet(skills)
+        query_text, all_skill_names = self._build_search_query(skillset)
 
         try:
             query_vector = await embedding_service.get_embedding(query_text)
@@ -250,34 +245,54 @@ class CandidateMatcher:
                 query_skills=all_skill_names,
             )
 
-        max_search_score = max(r.get("score", 0) for r in search_results) or 1.0
-
-        scored: list[tuple[float, ScoreBreakdown, dict]] = []
+        # One pass over the hits: everything but the semantic score is independent of
+        # the best search score, so compute it while looking for that maximum.
+        partial: list[tuple[float, float, float, dict]] = []
+        max_search_score = 0.0
         for result in search_results:
-            total, breakdown = self._score_candidate(result, skills, max_search_score)
-            scored.append((total, breakdown, result))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        top_scored = scored[:MAX_CANDIDATES]
-
-        top_results = [item[2] for item in top_scored]
-        explanations = await self._generate_explanations(top_results, skills, text)
-
-        matches: list[CandidateMatch] = []
-        for total, breakdown, result in top_scored:
-            alias = result.get("employee_alias", "")
-            matches.append(
-                CandidateMatch(
-                    employee_name=result.get("employee_name", ""),
-                    employee_alias=alias,
-                    title=result.get("title", ""),
-                    location=result.get("location", ""),
-                    skills=result.get("skills", []),
-                    total_score=total,
-                    breakdown=breakdown,
-                    explanation=explanations.get(alias, ""),
-                )
+            raw_score = result.get("score", 0)
+            if raw_score > max_search_score:
+                max_search_score = raw_score
+            skill_score, experience_score = self._score_candidate(result, skillset)
+            partial.append((skill_score, experience_score, raw_score, result))
+        max_search_score = max_search_score or 1.0
+
+        availability_part = WEIGHT_AVAILABILITY * DEFAULT_AVAILABILITY
+        scored: list[tuple[float, float, float, float, dict]] = []
+        for skill_score, experience_score, raw_score, result in partial:
+            semantic_score = normalize_search_score(raw_score, max_search_score)
+            total = (
+                WEIGHT_SKILL_MATCH * skill_score
+                + WEIGHT_EXPERIENCE * experience_score
+                + WEIGHT_SEMANTIC * semantic_score
+                + availability_part
+            )
+            scored.append((total, skill_score, experience_score, semantic_score, result))
+
+        # Partial selection instead of sorting every search hit; same order as sorted()[:n]
+        top_scored = heapq.nlargest(MAX_CANDIDATES, scored, key=itemgetter(0))
+
+        top_results = [item[4] for item in top_scored]
+        explanations = await self._generate_explanations(top_results, skillset, text)
+
+        matches = [
+            CandidateMatch(
+                employee_name=result.get("employee_name", ""),
+                employee_alias=result.get("employee_alias", ""),
+                title=result.get("title", ""),
+                location=result.get("location", ""),
+                skills=result.get("skills", []),
+                total_score=total,
+                breakdown=ScoreBreakdown(
+                    skill_match=skill_score,
+                    experience=experience_score,
+                    semantic_similarity=semantic_score,
+                    availability=DEFAULT_AVAILABILITY,
+                ),
+                explanation=explanations.get(result.get("employee_alias", ""), ""),
             )
+            for total, skill_score, experience_score, semantic_score, result in top_scored
+        ]
 
         return CandidateMatchResponse(
             matches=matches,
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import io
 import logging
+import time
 from collections.abc import AsyncGenerator
 
 from openai import AsyncAzureOpenAI
 
 from app.core.config import Settings
+from app.models.chat import ChatEvent
 from app.services.embedding_service import embedding_service
 from app.services.search_service import search_service
 
 logger = logging.getLogger(__name__)
 
+TOKEN_BATCH_SIZE = 8
+# Longest a buffered token waits before it is sent, also while the model pauses
+TOKEN_FLUSH_INTERVAL = 0.03
+
 SYSTEM_PROMPT_DE = (
     "Du bist ein KI-Assistent für HR-Fachleute bei der Suche nach geeigneten Mitarbeitern. Deine Aufgabe:\n"
     "1. Analysiere die bereitgestellten Mitarbeiterdaten und beantworte präzise die Anfrage.\n"
@@ -43,6 +50,27 @@ SYSTEM_PROMPT_EN = (
 )
 
 
+_CONTEXT_LABELS_DE = {
+    "empty": "Keine passenden Mitarbeiter gefunden.",
+    "header": "Hier sind die relevantesten Mitarbeiter für Ihre Anfrage:\n\n",
+    "title": "Position",
+    "location": "Standort",
+    "skills": "Fähigkeiten",
+    "profile": "Profil",
+    "more": "... und {remaining} weitere Ergebnisse",
+}
+
+_CONTEXT_LABELS_EN = {
+    "empty": "No matching employees found.",
+    "header": "Here are the most relevant employees for your query:\n\n",
+    "title": "Title",
+    "location": "Location",
+    "skills": "Skills",
+    "profile": "Profile",
+    "more": "... and {remaining} more results",
+}
+
+
 class ChatService:
     def __init__(self) -> None:
         self.client: AsyncAzureOpenAI | None = None
@@ -75,17 +103,12 @@ class ChatService:
         return SYSTEM_PROMPT_EN
 
     def assemble_context(self, results: list[dict], language: str) -> str:
+        labels = _CONTEXT_LABELS_DE if language == "de" else _CONTEXT_LABELS_EN
         if not results:
-            if language == "de":
-                return "Keine passenden Mitarbeiter gefunden."
-            return "No matching employees found."
+            return labels["empty"]
 
-        if language == "de":
-            header = "Hier sind die relevantesten Mitarbeiter für Ihre Anfrage:\n\n"
-        else:
-            header = "Here are the most relevant employees for your query:\n\n"
-
-        parts: list[str] = [header]
+        buf = io.StringIO()
+        buf.write(labels["header"])
         for i, result in enumerate(results[:10]):
             name = result.get("employee_name", "Unknown")
             alias = result.get("employee_alias", "")
@@ -95,42 +118,36 @@ class ChatService:
             tools = result.get("tools", [])
             content = result.get("content", "")
 
-            parts.append(f"**{i + 1}. {name}**")
+            buf.write(f"\n**{i + 1}. {name}**")
             if alias:
-                parts.append(f"  Alias: {alias}")
+                buf.write(f"\n  Alias: {alias}")
             if title:
-                label = "Position" if language == "de" else "Title"
-                parts.append(f"  {label}: {title}")
+                buf.write(f"\n  {labels['title']}: {title}")
             if location:
-                label = "Standort" if language == "de" else "Location"
-                parts.append(f"  {label}: {location}")
+                buf.write(f"\n  {labels['location']}: {location}")
             if skills:
                 skill_str = ", ".join(skills) if isinstance(skills, list) else str(skills)
-                label = "Fähigkeiten" if language == "de" else "Skills"
-                parts.append(f"  {label}: {skill_str}")
+                buf.write(f"\n  {labels['skills']}: {skill_str}")
             if tools:
                 tool_str = ", ".join(tools) if isinstance(tools, list) else str(tools)
-                parts.append(f"  Tools: {tool_str}")
+                buf.write(f"\n  Tools: {tool_str}")
             if content:
-                label = "Profil" if language == "de" else "Profile"
-                parts.append(f"  {label}: {content[:300]}")
-            parts.append("")
+                buf.write(f"\n  {labels['profile']}: {content[:300]}")
+            buf.write("\n")
 
         if len(results) > 10:
-            remaining = len(results) - 10
-            if language == "de":
-                parts.append(f"... und {remaining} weitere Ergebnisse")
-            else:
-                parts.append(f"... and {remaining} more results")
+            buf.write("\n")
+            buf.write(labels["more"].format(remaining=len(results) - 10))
 
-        return "\n".join(parts)
+        return buf.getvalue()
 
-    async def stream_chat(self, query: str, language: str = "de") -> AsyncGenerator[str, None]:
+    async def stream_chat(self, query: str, language: str = "de") -> AsyncGenerator[ChatEvent, None]:
         if not self.initialized or not self.client:
             raise RuntimeError("ChatService not initialized")
 
-        yield f"event: start\ndata: {json.dumps({'status': 'started'})}\n\n"
+        yield ChatEvent(event="start", data={"status": "started"})
 
+        pending: list[str] = []
         try:
             query_vector = await embedding_service.get_embedding(query)
 
@@ -148,9 +165,9 @@ class ChatService:
                 }
                 for r in results
             ]
-            yield (
-                f"event: search_complete\n"
-                f"data: {json.dumps({'results_count': len(results), 'employees': employees_summary})}\n\n"
+            yield ChatEvent(
+                event="search_complete",
+                data={"results_count": len(results), "employees": employees_summary},
             )
 
             context = self.assemble_context(results, language)
@@ -174,16 +191,50 @@ class ChatService:
                 stream=True,
             )
 
-            async for chunk in response:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    token = chunk.choices[0].delta.content
-                    yield f"event: token\ndata: {json.dumps({'content': token})}\n\n"
-
-            yield f"event: complete\ndata: {json.dumps({'status': 'complete'})}\n\n"
+            # Coalesce tokens into one frame per TOKEN_BATCH_SIZE tokens, or sooner once the oldest
+            # buffered token has waited TOKEN_FLUSH_INTERVAL seconds. The next chunk is awaited as a
+            # task so a pause in the stream can time out into a flush without cancelling the read.
+            stream = aiter(response)
+            next_chunk: asyncio.Future | None = None
+            flush_at = 0.0
+            try:
+                while True:
+                    if next_chunk is None:
+                        next_chunk = asyncio.ensure_future(anext(stream))
+                    timeout = max(flush_at - time.monotonic(), 0.0) if pending else None
+                    done, _ = await asyncio.wait((next_chunk,), timeout=timeout)
+                    if not done:
+                        yield ChatEvent(event="token", data={"content": "".join(pending)})
+                        pending.clear()
+                        continue
+
+                    finished, next_chunk = next_chunk, None
+                    try:
+                        chunk = finished.result()
+                    except StopAsyncIteration:
+                        break
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        if not pending:
+                            flush_at = time.monotonic() + TOKEN_FLUSH_INTERVAL
+                        pending.append(chunk.choices[0].delta.content)
+                        if len(pending) >= TOKEN_BATCH_SIZE:
+                            yield ChatEvent(event="token", data={"content": "".join(pending)})
+                            pending.clear()
+            finally:
+                if next_chunk is not None:
+                    next_chunk.cancel()
+
+            if pending:
+                yield ChatEvent(event="token", data={"content": "".join(pending)})
+                pending.clear()
+
+            yield ChatEvent(event="complete", data={"status": "complete"})
 
         except Exception as e:
             logger.exception("Chat streaming error")
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            if pending:
+                yield ChatEvent(event="token", data={"content": "".join(pending)})
+            yield ChatEvent(event="error", data={"error": str(e)})
 
 
 chat_service = ChatService()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 
@@ -10,6 +11,15 @@ logger = logging.getLogger(__name__)
 
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# PyMuPDF's defaults for "text" (no image blocks), spelled out so the extracted text
+# stays stable; unmapped glyphs keep coming out as their CID rather than U+FFFD
+_PDF_TEXT_FLAGS = (
+    fitz.TEXT_PRESERVE_WHITESPACE
+    | fitz.TEXT_PRESERVE_LIGATURES
+    | fitz.TEXT_MEDIABOX_CLIP
+    | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+)
+
 SUPPORTED_CONTENT_TYPES = {
     "application/pdf": "pdf",
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
@@ -21,21 +31,21 @@ class DocumentExtractionError(Exception):
 
 
 class DocumentExtractor:
-    def extract_from_pdf(self, file_bytes: bytes) -> str:
+    def extract_from_pdf(self, file_bytes: bytes | bytearray) -> str:
         try:
             doc = fitz.open(stream=file_bytes, filetype="pdf")
-            pages = [page.get_text() for page in doc]
-            doc.close()
-            return "\n".join(pages).strip()
+            try:
+                return "\n".join(page.get_text("text", flags=_PDF_TEXT_FLAGS) for page in doc).strip()
+            finally:
+                doc.close()
         except Exception as e:
             logger.error("PDF extraction failed: %s", e)
             raise DocumentExtractionError(f"Failed to extract text from PDF: {e}") from e
 
-    def extract_from_docx(self, file_bytes: bytes) -> str:
+    def extract_from_docx(self, file_bytes: bytes | bytearray) -> str:
         try:
             doc = docx.Document(io.BytesIO(file_bytes))
-            paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-            return "\n".join(paragraphs).strip()
+            return "\n".join(p.text for p in doc.paragraphs if p.text.strip()).strip()
         except Exception as e:
             logger.error("DOCX extraction failed: %s", e)
             raise DocumentExtractionError(f"Failed to extract text from DOCX: {e}") from e
@@ -43,7 +53,7 @@ class DocumentExtractor:
     def extract_from_text(self, text: str) -> str:
         return text.strip()
 
-    def extract(self, file_bytes: bytes, content_type: str) -> str:
+    def extract(self, file_bytes: bytes | bytearray, content_type: str) -> str:
         if content_type not in SUPPORTED_CONTENT_TYPES:
             raise DocumentExtractionError(f"Unsupported content type: {content_type}")
 
@@ -58,5 +68,9 @@ class DocumentExtractor:
             return self.extract_from_pdf(file_bytes)
         return self.extract_from_docx(file_bytes)
 
+    async def extract_async(self, file_bytes: bytes | bytearray, content_type: str) -> str:
+        """Run ``extract`` on a worker thread so parsing does not block the event loop."""
+        return await asyncio.to_thread(self.extract, file_bytes, content_type)
+
 
 document_extractor = DocumentExtractor()
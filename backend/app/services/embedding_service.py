@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+from array import array
+from collections import OrderedDict
 
 from openai import AsyncAzureOpenAI
 
@@ -8,6 +12,22 @@ from app.core.config import Settings
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_CACHE_MAX_SIZE = 1024
+
+
+def _cache_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class _Flight:
+    """An embedding request in progress that identical concurrent callers wait on."""
+
+    __slots__ = ("done", "error")
+
+    def __init__(self) -> None:
+        self.done = asyncio.Event()
+        self.error: Exception | None = None
+
 
 class EmbeddingService:
     def __init__(self) -> None:
@@ -15,6 +35,10 @@ class EmbeddingService:
         self.initialized = False
         self.model = ""
         self.dimensions = 0
+        # blake2b(text) -> vector packed as doubles (8 bytes per value instead of a float object
+        # plus list slot), in LRU order; and requests currently in flight
+        self._cache: OrderedDict[bytes, array[float]] = OrderedDict()
+        self._inflight: dict[bytes, _Flight] = {}
 
     async def initialize(self, settings: Settings) -> None:
         if self.initialized:
@@ -36,11 +60,51 @@ class EmbeddingService:
     async def close(self) -> None:
         self.client = None
         self.initialized = False
+        self._cache.clear()
+        self._inflight.clear()
 
     async def get_embedding(self, text: str) -> list[float]:
+        """Embedding for ``text``; repeated and concurrent identical requests share one API call."""
         if not self.initialized or not self.client:
             raise RuntimeError("EmbeddingService not initialized")
 
+        key = _cache_key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached.tolist()
+
+        while (flight := self._inflight.get(key)) is not None:
+            await flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached.tolist()
+
+        # No identical request in flight: this caller fetches, later ones wait on it
+        flight = _Flight()
+        self._inflight[key] = flight
+        try:
+            vector = await self._create_embedding(text)
+            self._store(key, vector)
+            return vector
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            flight.done.set()
+
+    def _store(self, key: bytes, vector: list[float]) -> None:
+        self._cache[key] = array("d", vector)
+        if len(self._cache) > EMBEDDING_CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+
+    async def _create_embedding(self, text: str) -> list[float]:
+        if not self.client:
+            raise RuntimeError("EmbeddingService not initialized")
+
         response = await self.client.embeddings.create(
             input=text,
             model=self.model,
@@ -49,21 +113,39 @@ class EmbeddingService:
         return response.data[0].embedding
 
     async def get_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embeddings for ``texts`` in order; only uncached, distinct texts are sent to the API."""
         if not self.initialized or not self.client:
             raise RuntimeError("EmbeddingService not initialized")
 
-        response = await self.client.embeddings.create(
-            input=texts,
-            model=self.model,
-            dimensions=self.dimensions,
-        )
-        return [item.embedding for item in response.data]
+        keys = [_cache_key(text) for text in texts]
+        found: dict[bytes, list[float]] = {}
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                found[key] = cached.tolist()
+            else:
+                missing.setdefault(key, text)
+
+        if missing:
+            response = await self.client.embeddings.create(
+                input=list(missing.values()),
+                model=self.model,
+                dimensions=self.dimensions,
+            )
+            for key, item in zip(missing, response.data, strict=True):
+                found[key] = item.embedding
+                self._store(key, item.embedding)
+
+        return [found[key] for key in keys]
 
     async def check_connection(self) -> bool:
         if not self.initialized:
             return False
         try:
-            await self.get_embedding("test")
+            # Bypass the cache so the probe really reaches the API
+            await self._create_embedding("test")
             return True
         except Exception:
             logger.exception("EmbeddingService connection check failed")
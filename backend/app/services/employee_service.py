@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any
 
 from azure.cosmos.aio import CosmosClient
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
 
 from app.core.config import Settings
+from app.core.dates import years_since_str
 from app.models.employee import EmployeeDetail, EmployeeSummary
 
 logger = logging.getLogger(__name__)
@@ -35,22 +36,33 @@ _FIELD_MAP: list[tuple[str, str]] = [
     ("location", "Location"),
     ("start_date", "Start"),
 ]
+# The subset needed for list views, so those skip building a full EmployeeDetail
+_SUMMARY_FIELD_MAP: list[tuple[str, str]] = [
+    (python_key, cosmos_key) for python_key, cosmos_key in _FIELD_MAP if python_key in EmployeeSummary.model_fields
+]
+# Read by _map_fields besides the mapped columns
+_EXTRA_COLUMNS = ("id", "Alias", "New Job Title")
+
+
+def _select(field_map: list[tuple[str, str]]) -> str:
+    """``SELECT`` projecting only the columns ``field_map`` needs instead of the whole document.
+
+    An object literal keeps the original (space-containing) property names, and
+    properties missing on a document are simply left out, as with ``SELECT *``.
+    """
+    columns = (*_EXTRA_COLUMNS, *(cosmos_key for _, cosmos_key in field_map))
+    # Column names come from the constants above, never from user input
+    return "SELECT VALUE {" + ", ".join(f'"{col}": c["{col}"]' for col in columns) + "} FROM c"  # noqa: S608
+
+
+_DETAIL_SELECT = _select(_FIELD_MAP)
+_SUMMARY_SELECT = _select(_SUMMARY_FIELD_MAP)
 
 
 def _calculate_experience(start_date: str | None) -> str:
-    if not start_date:
-        return "N/A"
-    try:
-        for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%d.%m.%Y"):
-            try:
-                start = datetime.strptime(start_date, fmt)  # noqa: DTZ007
-                years = (datetime.now() - start).days / 365.25  # noqa: DTZ005
-                return f"{years:.1f}"
-            except ValueError:
-                continue
-        return "N/A"
-    except Exception:
-        return "N/A"
+    # Shares its formats with reindex, so bare "YYYY" and "YYYY-MM" (counted from the first
+    # day) yield a number here too; they used to be reported as "N/A"
+    return years_since_str(start_date)
 
 
 class EmployeeService:
@@ -58,6 +70,7 @@ class EmployeeService:
         self.client: CosmosClient | None = None
         self.container: Any = None
         self.initialized: bool = False
+        self.id_is_partition_key = False
 
     async def initialize(self, settings: Settings) -> None:
         if self.initialized:
@@ -76,6 +89,7 @@ class EmployeeService:
         await self.client.__aenter__()
         db = self.client.get_database_client(database_name)
         self.container = db.get_container_client(container_name)
+        self.id_is_partition_key = settings.COSMOS_DB_EMPLOYEES_PARTITION_KEY == "/id"
         self.initialized = True
         logger.info("EmployeeService initialized (container=%s)", container_name)
 
@@ -90,7 +104,14 @@ class EmployeeService:
         if not self.container:
             return None
 
-        query = 'SELECT * FROM c WHERE c.id = @alias OR c.Alias = @alias OR c["Employee ID"] = @alias'
+        if self.id_is_partition_key:
+            try:
+                item = await self.container.read_item(item=alias, partition_key=alias)
+                return self._transform_employee(item)
+            except CosmosResourceNotFoundError:
+                pass  # Not an id; it may still be an Alias or Employee ID
+
+        query = f'{_DETAIL_SELECT} WHERE c.id = @alias OR c.Alias = @alias OR c["Employee ID"] = @alias'
         params: list[dict[str, str]] = [{"name": "@alias", "value": alias}]
 
         items: list[dict[str, Any]] = []
@@ -109,31 +130,19 @@ class EmployeeService:
         if not self.container:
             return []
 
-        query = "SELECT * FROM c OFFSET @skip LIMIT @limit"
+        query = f"{_SUMMARY_SELECT} OFFSET @skip LIMIT @limit"
         params: list[dict[str, Any]] = [
             {"name": "@skip", "value": skip},
             {"name": "@limit", "value": limit},
         ]
 
-        results: list[EmployeeSummary] = []
-        async for item in self.container.query_items(
-            query=query,
-            parameters=params,
-        ):
-            detail = self._transform_employee(item)
-            results.append(
-                EmployeeSummary(
-                    id=detail.id,
-                    name=detail.name,
-                    title=detail.title,
-                    department=detail.department,
-                    unit=detail.unit,
-                    location=detail.location,
-                    email=detail.email,
-                )
+        return [
+            self._transform_summary(item)
+            async for item in self.container.query_items(
+                query=query,
+                parameters=params,
             )
-
-        return results
+        ]
 
     async def check_connection(self) -> bool:
         if not self.container:
@@ -149,22 +158,25 @@ class EmployeeService:
             logger.exception("Cosmos DB connection check failed")
             return False
 
-    def _transform_employee(self, raw: dict[str, Any]) -> EmployeeDetail:
-        data: dict[str, Any] = {
-            "id": raw.get("id") or raw.get("Alias") or "unknown",
-            "years_of_experience": "N/A",
-        }
+    def _map_fields(self, raw: dict[str, Any], field_map: list[tuple[str, str]]) -> dict[str, Any]:
+        data: dict[str, Any] = {"id": raw.get("id") or raw.get("Alias") or "unknown"}
 
-        for python_key, cosmos_key in _FIELD_MAP:
+        for python_key, cosmos_key in field_map:
             data[python_key] = raw.get(cosmos_key)
 
         # Fallback: "New Job Title" if "Job Title" is empty
         if not data.get("title"):
             data["title"] = raw.get("New Job Title")
 
-        data["years_of_experience"] = _calculate_experience(data.get("start_date"))
+        return data
 
+    def _transform_employee(self, raw: dict[str, Any]) -> EmployeeDetail:
+        data = self._map_fields(raw, _FIELD_MAP)
+        data["years_of_experience"] = _calculate_experience(data.get("start_date"))
         return EmployeeDetail(**data)
 
+    def _transform_summary(self, raw: dict[str, Any]) -> EmployeeSummary:
+        return EmployeeSummary(**self._map_fields(raw, _SUMMARY_FIELD_MAP))
+
 
 employee_service = EmployeeService()
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
 
+import orjson
 from openai import AsyncAzureOpenAI
+from pydantic import ValidationError
 
 from app.core.config import Settings
 from app.models.lastenheft import (
@@ -16,9 +16,7 @@ from app.models.lastenheft import (
 
 logger = logging.getLogger(__name__)
 
-QUALITY_SYSTEM_PROMPT = (
-    "Du bist ein Experte für die Bewertung von Lastenheften/Leistungsbeschreibungen. "
-    "Bewerte den folgenden Text anhand dieser Kriterien auf einer Skala von 0-100:\n"
+_QUALITY_CRITERIA = (
     "- completeness: Sind alle wesentlichen Aspekte abgedeckt "
     "(Ziele, Anforderungen, Rahmenbedingungen, Abnahmekriterien)?\n"
     "- clarity: Sind die Formulierungen klar und eindeutig?\n"
@@ -26,30 +24,20 @@ QUALITY_SYSTEM_PROMPT = (
     "- feasibility: Sind die Anforderungen technisch und zeitlich umsetzbar?\n"
     "- overall: Gewichteter Gesamtwert "
     "(completeness 30%, clarity 25%, specificity 25%, feasibility 20%)\n"
-    "- summary: Kurze Zusammenfassung (2-3 Sätze) der Bewertung.\n\n"
-    "Antworte ausschließlich als JSON-Objekt mit den Feldern: "
-    "completeness, clarity, specificity, feasibility, overall, summary."
+    "- summary: Kurze Zusammenfassung (2-3 Sätze) der Bewertung.\n"
 )
 
-QUESTIONS_SYSTEM_PROMPT = (
-    "Du bist ein erfahrener IT-Berater der offene Fragen in Ausschreibungen identifiziert. "
-    "Analysiere den folgenden Lastenheft-Text und identifiziere offene Fragen, "
-    "die vor einer Angebotserstellung geklärt werden sollten.\n\n"
+_QUESTIONS_RUBRIC = (
     "Kategorien für Fragen:\n"
     "- technical: Technische Unklarheiten\n"
     "- team: Fragen zu Team-Zusammensetzung und Rollen\n"
     "- timeline: Fragen zu Zeitplan und Meilensteinen\n"
     "- budget: Fragen zu Budget und Vergütung\n"
     "- domain: Fachliche/domänenspezifische Fragen\n\n"
-    "Prioritäten: high, medium, low\n\n"
-    "Antworte ausschließlich als JSON-Objekt mit dem Feld 'questions', "
-    "wobei jedes Element die Felder question, category, priority hat."
+    "Prioritäten: high, medium, low\n"
 )
 
-SKILLS_SYSTEM_PROMPT = (
-    "Du bist ein Technical Recruiter der benötigte Skills aus Lastenheften extrahiert. "
-    "Analysiere den folgenden Text und extrahiere alle geforderten technischen und "
-    "fachlichen Kompetenzen.\n\n"
+_SKILLS_RUBRIC = (
     "Kategorien für Skills:\n"
     "- programming: Programmiersprachen (z.B. Python, Java, C#)\n"
     "- framework: Frameworks und Libraries (z.B. React, FastAPI, Spring)\n"
@@ -63,18 +51,75 @@ SKILLS_SYSTEM_PROMPT = (
     "- name: Normalisierter Skill-Name\n"
     "- category: Eine der obigen Kategorien\n"
     "- mandatory: true wenn explizit gefordert, false wenn nice-to-have\n"
-    "- level: junior, mid, senior, expert oder null wenn nicht spezifiziert\n\n"
+    "- level: junior, mid, senior, expert oder null wenn nicht spezifiziert\n"
+)
+
+QUALITY_SYSTEM_PROMPT = (
+    "Du bist ein Experte für die Bewertung von Lastenheften/Leistungsbeschreibungen. "
+    "Bewerte den folgenden Text anhand dieser Kriterien auf einer Skala von 0-100:\n"
+    f"{_QUALITY_CRITERIA}\n"
+    "Antworte ausschließlich als JSON-Objekt mit den Feldern: "
+    "completeness, clarity, specificity, feasibility, overall, summary."
+)
+
+QUESTIONS_SYSTEM_PROMPT = (
+    "Du bist ein erfahrener IT-Berater der offene Fragen in Ausschreibungen identifiziert. "
+    "Analysiere den folgenden Lastenheft-Text und identifiziere offene Fragen, "
+    "die vor einer Angebotserstellung geklärt werden sollten.\n\n"
+    f"{_QUESTIONS_RUBRIC}\n"
+    "Antworte ausschließlich als JSON-Objekt mit dem Feld 'questions', "
+    "wobei jedes Element die Felder question, category, priority hat."
+)
+
+SKILLS_SYSTEM_PROMPT = (
+    "Du bist ein Technical Recruiter der benötigte Skills aus Lastenheften extrahiert. "
+    "Analysiere den folgenden Text und extrahiere alle geforderten technischen und "
+    "fachlichen Kompetenzen.\n\n"
+    f"{_SKILLS_RUBRIC}\n"
     "Antworte ausschließlich als JSON-Objekt mit dem Feld 'skills'."
 )
 
+# All three analyses in one request, so the Lastenheft text is sent and billed once
+ANALYSIS_SYSTEM_PROMPT = (
+    "Du bist ein erfahrener IT-Berater und Technical Recruiter und analysierst "
+    "Lastenhefte/Leistungsbeschreibungen. Führe für den folgenden Text drei Analysen durch.\n\n"
+    "1. quality: Bewerte den Text anhand dieser Kriterien auf einer Skala von 0-100:\n"
+    f"{_QUALITY_CRITERIA}\n"
+    "2. questions: Identifiziere offene Fragen, die vor einer Angebotserstellung "
+    "geklärt werden sollten.\n"
+    f"{_QUESTIONS_RUBRIC}\n"
+    "3. skills: Extrahiere alle geforderten technischen und fachlichen Kompetenzen.\n"
+    f"{_SKILLS_RUBRIC}\n"
+    "Antworte ausschließlich als JSON-Objekt mit den Feldern "
+    "'quality' (Objekt mit completeness, clarity, specificity, feasibility, overall, summary), "
+    "'questions' (Liste von Objekten mit question, category, priority) und "
+    "'skills' (Liste von Objekten mit name, category, mandatory, level)."
+)
+
+# System messages are immutable, so every request reuses the same dict; keeping the system prompt
+# as the first message also gives Azure OpenAI's automatic prompt caching a stable prefix
+_SYSTEM_MESSAGES: dict[str, dict[str, str]] = {
+    prompt: {"role": "system", "content": prompt}
+    for prompt in (QUALITY_SYSTEM_PROMPT, QUESTIONS_SYSTEM_PROMPT, SKILLS_SYSTEM_PROMPT, ANALYSIS_SYSTEM_PROMPT)
+}
+
 LLM_TEMPERATURE = 0.3
 LLM_MAX_TOKENS = 2000
+LLM_ANALYSIS_MAX_TOKENS = 4000
 
 
 class LastenheftAnalyzerError(Exception):
     pass
 
 
+def _parse_questions(data: dict) -> list[OpenQuestion]:
+    return [OpenQuestion(**q) for q in data.get("questions", [])]
+
+
+def _parse_skills(data: dict) -> list[ExtractedSkill]:
+    return [ExtractedSkill(**s) for s in data.get("skills", [])]
+
+
 class LastenheftAnalyzer:
     def __init__(self) -> None:
         self.client: AsyncAzureOpenAI | None = None
@@ -102,12 +147,10 @@ class LastenheftAnalyzer:
         self.initialized = False
 
     def _build_messages(self, system_prompt: str, text: str) -> list[dict[str, str]]:
-        return [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": text},
-        ]
+        system_message = _SYSTEM_MESSAGES.get(system_prompt) or {"role": "system", "content": system_prompt}
+        return [system_message, {"role": "user", "content": text}]
 
-    async def _call_llm(self, system_prompt: str, text: str) -> dict:
+    async def _call_llm(self, system_prompt: str, text: str, max_tokens: int = LLM_MAX_TOKENS) -> dict:
         if not self.initialized or not self.client:
             raise LastenheftAnalyzerError("LastenheftAnalyzer not initialized")
 
@@ -118,14 +161,14 @@ class LastenheftAnalyzer:
                 model=self.model,
                 messages=messages,  # type: ignore[arg-type]
                 temperature=LLM_TEMPERATURE,
-                max_tokens=LLM_MAX_TOKENS,
+                max_tokens=max_tokens,
                 response_format={"type": "json_object"},
             )
             content = response.choices[0].message.content
             if not content:
                 raise LastenheftAnalyzerError("Empty response from LLM")
-            return json.loads(content)
-        except json.JSONDecodeError as e:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
             raise LastenheftAnalyzerError(f"Failed to parse LLM JSON response: {e}") from e
         except LastenheftAnalyzerError:
             raise
@@ -138,29 +181,30 @@ class LastenheftAnalyzer:
 
     async def extract_questions(self, text: str) -> list[OpenQuestion]:
         data = await self._call_llm(QUESTIONS_SYSTEM_PROMPT, text)
-        questions_raw = data.get("questions", [])
-        return [OpenQuestion(**q) for q in questions_raw]
+        return _parse_questions(data)
 
     async def extract_skills(self, text: str) -> list[ExtractedSkill]:
         data = await self._call_llm(SKILLS_SYSTEM_PROMPT, text)
-        skills_raw = data.get("skills", [])
-        return [ExtractedSkill(**s) for s in skills_raw]
+        return _parse_skills(data)
 
     async def analyze(self, text: str) -> LastenheftAnalysisResponse:
+        """Quality, open questions and skills from a single combined LLM call."""
         if not self.initialized or not self.client:
             raise LastenheftAnalyzerError("LastenheftAnalyzer not initialized")
 
-        quality_task = self.assess_quality(text)
-        questions_task = self.extract_questions(text)
-        skills_task = self.extract_skills(text)
-
-        quality, questions, skills = await asyncio.gather(quality_task, questions_task, skills_task)
+        data = await self._call_llm(ANALYSIS_SYSTEM_PROMPT, text, max_tokens=LLM_ANALYSIS_MAX_TOKENS)
 
-        return LastenheftAnalysisResponse(
-            quality_assessment=quality,
-            open_questions=questions,
-            extracted_skills=skills,
-        )
+        quality = data.get("quality")
+        if not isinstance(quality, dict):
+            raise LastenheftAnalyzerError("LLM response has no quality object")
+        try:
+            return LastenheftAnalysisResponse(
+                quality_assessment=QualityScore(**quality),
+                open_questions=_parse_questions(data),
+                extracted_skills=_parse_skills(data),
+            )
+        except (TypeError, ValidationError) as e:
+            raise LastenheftAnalyzerError(f"Invalid analysis response from LLM: {e}") from e
 
 
 lastenheft_analyzer = LastenheftAnalyzer()
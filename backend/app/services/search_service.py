@@ -1,13 +1,37 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
+from array import array
+from collections import OrderedDict
 
 import aiohttp
+import orjson
 
 from app.core.config import Settings
+from app.core.http import create_http_session
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CACHE_MAX_SIZE = 256
+SEARCH_CACHE_TTL_SECONDS = 60.0
+# How long a connection check verdict is reused; failures are re-checked sooner
+HEALTH_OK_TTL_SECONDS = 30.0
+HEALTH_FAIL_TTL_SECONDS = 5.0
+
+_SearchKey = tuple[str, bytes, int, str | None]
+
+
+def _search_cache_key(query_text: str, query_vector: list[float] | None, top: int, filters: str | None) -> _SearchKey:
+    vector_digest = hashlib.blake2b(array("d", query_vector or ()).tobytes(), digest_size=16).digest()
+    return query_text, vector_digest, top, filters
+
+
+def _copy_results(results: list[dict]) -> list[dict]:
+    # Callers may mutate what they get back; never hand out the cached dicts/lists
+    return [{**r, "skills": list(r.get("skills") or []), "tools": list(r.get("tools") or [])} for r in results]
+
 
 class SearchService:
     def __init__(self) -> None:
@@ -16,8 +40,14 @@ class SearchService:
         self.api_key = ""
         self.index_name = ""
         self.api_version = ""
-
-    async def initialize(self, settings: Settings) -> None:
+        self.session: aiohttp.ClientSession | None = None
+        self._owns_session = False
+        self._healthy = False
+        self._health_checked_until = 0.0
+        # search key -> (monotonic expiry, processed results), in LRU order
+        self._cache: OrderedDict[_SearchKey, tuple[float, list[dict]]] = OrderedDict()
+
+    async def initialize(self, settings: Settings, session: aiohttp.ClientSession | None = None) -> None:
         if self.initialized:
             return
 
@@ -29,6 +59,9 @@ class SearchService:
         self.api_key = settings.AZURE_SEARCH_KEY
         self.index_name = settings.AZURE_SEARCH_INDEX
         self.api_version = settings.AZURE_SEARCH_API_VERSION
+        # Without a session from the app lifespan, own a pooled one until close()
+        self._owns_session = session is None
+        self.session = session if session is not None else create_http_session()
         self.initialized = True
 
     async def close(self) -> None:
@@ -37,6 +70,13 @@ class SearchService:
         self.api_key = ""
         self.index_name = ""
         self.api_version = ""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+        self.session = None
+        self._owns_session = False
+        self._healthy = False
+        self._health_checked_until = 0.0
+        self._cache.clear()
 
     async def hybrid_search(
         self,
@@ -48,6 +88,28 @@ class SearchService:
         if not self.initialized:
             raise RuntimeError("SearchService not initialized")
 
+        key = _search_cache_key(query_text, query_vector, top, filters)
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None:
+            if now < cached[0]:
+                self._cache.move_to_end(key)
+                return _copy_results(cached[1])
+            del self._cache[key]
+
+        results = await self._search(query_text, query_vector, top, filters)
+        self._cache[key] = (now + SEARCH_CACHE_TTL_SECONDS, results)
+        if len(self._cache) > SEARCH_CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+        return _copy_results(results)
+
+    async def _search(
+        self,
+        query_text: str,
+        query_vector: list[float] | None,
+        top: int,
+        filters: str | None,
+    ) -> list[dict]:
         search_text = query_text.strip() if query_text.strip() else "*"
         payload: dict[str, object] = {
             "search": search_text,
@@ -76,45 +138,50 @@ class SearchService:
         headers = {"Content-Type": "application/json", "api-key": self.api_key}
 
         timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._process_results(data)
+        async with self.session.post(url, headers=headers, data=orjson.dumps(payload), timeout=timeout) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                return self._process_results(data)
 
-                error_text = await response.text()
-                raise RuntimeError(f"Search failed: {response.status} - {error_text}")
+            error_text = await response.text()
+            raise RuntimeError(f"Search failed: {response.status} - {error_text}")
 
     def _process_results(self, data: dict) -> list[dict]:
-        results: list[dict] = []
-        for doc in data.get("value", []):
-            results.append(
-                {
-                    "id": doc.get("id"),
-                    "employee_name": doc.get("employeeName"),
-                    "employee_alias": doc.get("employeeAlias"),
-                    "content": doc.get("content", "")[:500],
-                    "skills": doc.get("skills", []),
-                    "tools": doc.get("tools", []),
-                    "title": doc.get("title"),
-                    "location": doc.get("location"),
-                    "score": doc.get("@search.score", 0),
-                }
-            )
-        return results
+        return [
+            {
+                "id": doc.get("id"),
+                "employee_name": doc.get("employeeName"),
+                "employee_alias": doc.get("employeeAlias"),
+                "content": (doc.get("content") or "")[:500],
+                "skills": doc.get("skills", []),
+                "tools": doc.get("tools", []),
+                "title": doc.get("title"),
+                "location": doc.get("location"),
+                "score": doc.get("@search.score", 0),
+            }
+            for doc in data.get("value", ())
+        ]
 
     async def check_connection(self) -> bool:
         if not self.initialized:
             return False
 
+        now = time.monotonic()
+        if now < self._health_checked_until:
+            return self._healthy
+
+        self._healthy = await self._ping()
+        self._health_checked_until = now + (HEALTH_OK_TTL_SECONDS if self._healthy else HEALTH_FAIL_TTL_SECONDS)
+        return self._healthy
+
+    async def _ping(self) -> bool:
         url = f"{self.endpoint}/indexes/{self.index_name}?api-version={self.api_version}"
         headers = {"Content-Type": "application/json", "api-key": self.api_key}
 
         try:
             timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers) as response:
-                    return response.status == 200
+            async with self.session.get(url, headers=headers, timeout=timeout) as response:
+                return response.status == 200
         except Exception:
             logger.exception("SearchService connection check failed")
             return False
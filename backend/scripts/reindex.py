@@ -5,142 +5,254 @@ BLOCKER: text-embedding-3-large is NOT yet deployed to Azure OpenAI.
 This script will fail at the embedding step until the model is provisioned.
 Once deployed, run from the backend/ directory:
 
-    python3 scripts/reindex.py [--dry-run] [--batch-size N] [--verbose]
+    python3 scripts/reindex.py [--dry-run] [--batch-size N] [--max-request-chars N] [--concurrency N]
+                               [--embedding-cache PATH | --no-embedding-cache] [--verbose]
 
 Reads ALL employees from Cosmos DB (read-only), generates embeddings,
 and uploads search documents to the cvision-v3-index Azure AI Search index.
+Embeddings are kept in a local SQLite cache, so re-runs only embed changed CVs.
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import hashlib
 import logging
+import math
 import os
+import queue
+import random
+import sqlite3
+import struct
 import sys
-from datetime import datetime
-from typing import Any
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, TypeVar
 
 _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
 import aiohttp  # noqa: E402
+import httpx  # noqa: E402
+import orjson  # noqa: E402
 from azure.cosmos.aio import CosmosClient  # noqa: E402
-from openai import AsyncAzureOpenAI  # noqa: E402
+from openai import APITimeoutError, AsyncAzureOpenAI, RateLimitError  # noqa: E402
 
 from app.core.config import Settings  # noqa: E402
+from app.core.dates import years_since  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
+# Batches buffered between pipeline stages, and upload workers
+_PIPELINE_DEPTH = 4
+_UPLOAD_WORKERS = 2
+# Connection cap for the Search upload session; comfortably above _UPLOAD_WORKERS
+_SEARCH_CONNECTIONS = 16
+# Retries after an embedding 429/timeout or a throttled/failing Search upload, backing off 1s, 2s, 4s, ...
+# unless the service names its own Retry-After
+_RATE_LIMIT_RETRIES = 5
+
+DEFAULT_EMBEDDING_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".embedding_cache.sqlite")
+
+# Top-level document properties read by the build_* helpers; the reindex query projects only these
+_COSMOS_FIELDS = (
+    "id",
+    "metadata",
+    "personal_info",
+    "skills",
+    "experience",
+    "education",
+    "certifications",
+    "languages",
+    "industry_knowledge",
+)
+EMPLOYEE_QUERY = "SELECT VALUE {" + ", ".join(f'"{f}": c["{f}"]' for f in _COSMOS_FIELDS) + "} FROM c"  # noqa: S608
+
+# text-embedding-3-* models reject inputs over 8191 tokens, which fails the whole batch. There
+# is no tokenizer in this tree, so cap by characters: German CV text (compounds, product names,
+# dates, IDs) can get down to about 2 characters per token, so 16k characters stays under it.
+MAX_EMBEDDING_CHARS = 16_000
+# Longer texts are embedded as overlapping windows, each within the same cap, and the vectors averaged
+EMBEDDING_WINDOW_CHARS = MAX_EMBEDDING_CHARS
+EMBEDDING_WINDOW_OVERLAP = 2_000
+# Batches fill up to this many characters of CV text per embedding request (~100k tokens): far fewer
+# requests than a fixed handful of employees, while one request stays a small slice of the per-minute quota
+DEFAULT_MAX_REQUEST_CHARS = 200_000
+# Ceiling on employees per batch, which is also the Search upload size (each document carries its vector)
+DEFAULT_BATCH_SIZE = 50
+
+EmbedFn = Callable[[list[str]], Awaitable[list[list[float]]]]
+UploadFn = Callable[[list[dict[str, Any]]], Awaitable[tuple[int, int]]]
+
+_T = TypeVar("_T")
+
 
 def _calculate_years(start_date: str | None) -> float:
-    if not start_date:
-        return 0.0
-    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%d.%m.%Y", "%Y-%m", "%Y"):
-        try:
-            start = datetime.strptime(start_date, fmt)  # noqa: DTZ007
-            years = (datetime.now() - start).days / 365.25  # noqa: DTZ005
-            return round(years, 1)
-        except ValueError:
-            continue
-    return 0.0
-
-
-def _get_all_skills(doc: dict[str, Any]) -> list[str]:
-    """Extract all skills from nested skills object."""
-    skills_obj = doc.get("skills", {})
-    if not isinstance(skills_obj, dict):
-        return []
-    all_skills: list[str] = []
-    for key in ("tools", "technologies", "methods", "standards", "soft_skills"):
-        items = skills_obj.get(key, [])
-        if isinstance(items, list):
-            all_skills.extend(str(s) for s in items if s)
-    return all_skills
-
-
-def _get_tools(doc: dict[str, Any]) -> list[str]:
-    """Extract tools from nested skills object."""
-    skills_obj = doc.get("skills", {})
-    if not isinstance(skills_obj, dict):
-        return []
-    tools = skills_obj.get("tools", [])
-    return [str(t) for t in tools if t] if isinstance(tools, list) else []
-
-
-def _get_experience_text(doc: dict[str, Any]) -> str:
-    """Build experience summary from experience array."""
-    experiences = doc.get("experience", [])
-    if not isinstance(experiences, list):
-        return ""
-    parts: list[str] = []
-    for exp in experiences:
-        if not isinstance(exp, dict):
-            continue
-        title = exp.get("title", "")
-        company = exp.get("company", "")
-        role = exp.get("role", "")
-        desc = exp.get("description", "")
-        tasks = exp.get("tasks", [])
-        areas = exp.get("areas_of_expertise", [])
-        line_parts = [p for p in [title, company, role] if p]
-        if tasks and isinstance(tasks, list):
-            line_parts.append(f"Tasks: {', '.join(str(t) for t in tasks)}")
-        if areas and isinstance(areas, list):
-            line_parts.append(f"Expertise: {', '.join(str(a) for a in areas)}")
-        if desc:
-            line_parts.append(desc)
-        if line_parts:
-            parts.append(" | ".join(line_parts))
-    return "; ".join(parts)
-
-
-def _get_projects_text(doc: dict[str, Any]) -> str:
-    """Extract project titles from experience array."""
-    experiences = doc.get("experience", [])
-    if not isinstance(experiences, list):
-        return ""
-    projects = []
-    for exp in experiences:
-        if isinstance(exp, dict) and exp.get("type") == "project":
-            title = exp.get("title", "")
-            if title:
-                projects.append(title)
-    return ", ".join(projects)
-
-
-def _get_latest_title(doc: dict[str, Any]) -> str:
-    """Get the latest job title from experience."""
-    experiences = doc.get("experience", [])
-    if not isinstance(experiences, list):
-        return ""
-    for exp in experiences:
-        if isinstance(exp, dict) and exp.get("type") == "job":
-            title = exp.get("title", "")
-            if title:
-                return title
-    # Fallback to any experience title
-    for exp in experiences:
-        if isinstance(exp, dict):
-            title = exp.get("title", "")
-            if title:
-                return title
-    return ""
-
-
-def _get_earliest_start(doc: dict[str, Any]) -> str | None:
-    """Find the earliest start date from experience."""
-    experiences = doc.get("experience", [])
-    if not isinstance(experiences, list):
-        return None
-    dates: list[str] = []
-    for exp in experiences:
-        if isinstance(exp, dict):
-            sd = exp.get("start_date", "")
-            if sd:
-                dates.append(sd)
-    return min(dates) if dates else None
+    years = years_since(start_date)
+    return 0.0 if years is None else round(years, 1)
+
+
+_SKILL_KEYS = ("tools", "technologies", "methods", "standards", "soft_skills")
+
+
+def _experience_line(exp: dict[str, Any]) -> str:
+    title = exp.get("title", "")
+    company = exp.get("company", "")
+    role = exp.get("role", "")
+    desc = exp.get("description", "")
+    tasks = exp.get("tasks", [])
+    areas = exp.get("areas_of_expertise", [])
+    line_parts = [p for p in [title, company, role] if p]
+    if tasks and isinstance(tasks, list):
+        line_parts.append(f"Tasks: {', '.join(str(t) for t in tasks)}")
+    if areas and isinstance(areas, list):
+        line_parts.append(f"Expertise: {', '.join(str(a) for a in areas)}")
+    if desc:
+        line_parts.append(desc)
+    return " | ".join(line_parts)
+
+
+class EmployeeFields:
+    """Search fields of a Cosmos DB employee document, derived in one pass over its skills and experience.
+
+    The reindex query only fetches the properties in ``_COSMOS_FIELDS``; add new ones there too.
+    """
+
+    __slots__ = (
+        "all_skills",
+        "content",
+        "earliest_start",
+        "experience_text",
+        "location",
+        "name",
+        "projects_text",
+        "title",
+        "tools",
+    )
+
+    def __init__(self, doc: dict[str, Any]) -> None:
+        metadata = doc.get("metadata", {})
+        name = ""
+        if isinstance(metadata, dict):
+            name = metadata.get("title", "")
+            if not name:
+                first = metadata.get("first_name", "")
+                last = metadata.get("last_name", "")
+                name = f"{first} {last}".strip()
+        self.name: str = name
+
+        # All skills (tools + technologies + methods + standards + soft skills); tools come first
+        self.all_skills: list[str] = []
+        self.tools: list[str] = []
+        skills_obj = doc.get("skills", {})
+        if isinstance(skills_obj, dict):
+            for key in _SKILL_KEYS:
+                items = skills_obj.get(key, [])
+                if isinstance(items, list):
+                    values = [str(s) for s in items if s]
+                    if key == "tools":
+                        self.tools = values
+                    self.all_skills.extend(values)
+
+        # Experience lines, project titles, latest title (first job, else first entry) and earliest start
+        lines: list[str] = []
+        projects: list[str] = []
+        job_title = any_title = ""
+        earliest: str | None = None
+        experiences = doc.get("experience", [])
+        if isinstance(experiences, list):
+            for exp in experiences:
+                if not isinstance(exp, dict):
+                    continue
+                line = _experience_line(exp)
+                if line:
+                    lines.append(line)
+                exp_title = exp.get("title", "")
+                if exp_title:
+                    any_title = any_title or exp_title
+                    if exp.get("type") == "job":
+                        job_title = job_title or exp_title
+                    elif exp.get("type") == "project":
+                        projects.append(exp_title)
+                start = exp.get("start_date", "")
+                if start and (earliest is None or start < earliest):
+                    earliest = start
+        self.experience_text: str = "; ".join(lines)
+        self.projects_text: str = ", ".join(projects)
+        self.title: str = job_title or any_title
+        self.earliest_start: str | None = earliest
+
+        personal = doc.get("personal_info", {})
+        self.location: str = personal.get("location", "") if isinstance(personal, dict) else ""
+
+        self.content: str = self._searchable_text(doc)
+
+    def _searchable_text(self, doc: dict[str, Any]) -> str:
+        parts: list[str] = []
+        if self.name:
+            parts.append(f"Name: {self.name}")
+        if self.title:
+            parts.append(f"Title: {self.title}")
+        if self.all_skills:
+            parts.append(f"Skills: {', '.join(self.all_skills)}")
+        if self.tools:
+            parts.append(f"Tools: {', '.join(self.tools)}")
+        if self.experience_text:
+            parts.append(f"Experience: {self.experience_text}")
+        if self.projects_text:
+            parts.append(f"Projects: {self.projects_text}")
+        if self.location:
+            parts.append(f"Location: {self.location}")
+
+        # Education
+        education = doc.get("education", [])
+        if isinstance(education, list) and education:
+            edu_parts = []
+            for edu in education:
+                if isinstance(edu, dict):
+                    degree = edu.get("degree", "")
+                    field = edu.get("field_of_study", "")
+                    inst = edu.get("institution", "")
+                    edu_parts.append(" - ".join(p for p in [degree, field, inst] if p))
+            if edu_parts:
+                parts.append(f"Education: {'; '.join(edu_parts)}")
+
+        # Certifications
+        certs = doc.get("certifications", [])
+        if isinstance(certs, list) and certs:
+            cert_titles = [c.get("title", "") for c in certs if isinstance(c, dict) and c.get("title")]
+            if cert_titles:
+                parts.append(f"Certifications: {', '.join(cert_titles)}")
+
+        # Languages
+        langs = doc.get("languages", [])
+        if isinstance(langs, list) and langs:
+            lang_parts = [
+                f"{l.get('language', '')} ({l.get('proficiency', '')})"
+                for l in langs
+                if isinstance(l, dict) and l.get("language")
+            ]
+            if lang_parts:
+                parts.append(f"Languages: {', '.join(lang_parts)}")
+
+        # Industry knowledge
+        industry = doc.get("industry_knowledge", {})
+        if isinstance(industry, dict):
+            industries = industry.get("industries", [])
+            companies = industry.get("companies", [])
+            if isinstance(industries, list) and industries:
+                parts.append(f"Industries: {', '.join(str(i) for i in industries)}")
+            if isinstance(companies, list) and companies:
+                parts.append(f"Companies: {', '.join(str(c) for c in companies)}")
+
+        return "\n".join(parts)
+
+
+# A Cosmos document streamed into the pipeline together with its derived fields
+PreparedEmployee = tuple[dict[str, Any], EmployeeFields]
 
 
 def build_searchable_text(doc: dict[str, Any]) -> str:
@@ -149,126 +261,36 @@ def build_searchable_text(doc: dict[str, Any]) -> str:
     Cosmos DB documents have nested structure with metadata, skills, experience, etc.
     This function concatenates key fields into a single string for embedding.
     """
-    parts: list[str] = []
-
-    # Name from metadata
-    metadata = doc.get("metadata", {})
-    name = ""
-    if isinstance(metadata, dict):
-        name = metadata.get("title", "")
-        if not name:
-            first = metadata.get("first_name", "")
-            last = metadata.get("last_name", "")
-            name = f"{first} {last}".strip()
-    if name:
-        parts.append(f"Name: {name}")
-
-    # Latest job title
-    title = _get_latest_title(doc)
-    if title:
-        parts.append(f"Title: {title}")
-
-    # All skills (tools + technologies + methods + standards)
-    all_skills = _get_all_skills(doc)
-    if all_skills:
-        parts.append(f"Skills: {', '.join(all_skills)}")
-
-    # Tools specifically
-    tools = _get_tools(doc)
-    if tools:
-        parts.append(f"Tools: {', '.join(tools)}")
-
-    # Experience
-    exp_text = _get_experience_text(doc)
-    if exp_text:
-        parts.append(f"Experience: {exp_text}")
-
-    # Projects
-    projects = _get_projects_text(doc)
-    if projects:
-        parts.append(f"Projects: {projects}")
-
-    # Location
-    personal = doc.get("personal_info", {})
-    location = personal.get("location", "") if isinstance(personal, dict) else ""
-    if location:
-        parts.append(f"Location: {location}")
-
-    # Education
-    education = doc.get("education", [])
-    if isinstance(education, list) and education:
-        edu_parts = []
-        for edu in education:
-            if isinstance(edu, dict):
-                degree = edu.get("degree", "")
-                field = edu.get("field_of_study", "")
-                inst = edu.get("institution", "")
-                edu_parts.append(" - ".join(p for p in [degree, field, inst] if p))
-        if edu_parts:
-            parts.append(f"Education: {'; '.join(edu_parts)}")
-
-    # Certifications
-    certs = doc.get("certifications", [])
-    if isinstance(certs, list) and certs:
-        cert_titles = [c.get("title", "") for c in certs if isinstance(c, dict) and c.get("title")]
-        if cert_titles:
-            parts.append(f"Certifications: {', '.join(cert_titles)}")
-
-    # Languages
-    langs = doc.get("languages", [])
-    if isinstance(langs, list) and langs:
-        lang_parts = [
-            f"{l.get('language', '')} ({l.get('proficiency', '')})"
-            for l in langs
-            if isinstance(l, dict) and l.get("language")
-        ]
-        if lang_parts:
-            parts.append(f"Languages: {', '.join(lang_parts)}")
-
-    # Industry knowledge
-    industry = doc.get("industry_knowledge", {})
-    if isinstance(industry, dict):
-        industries = industry.get("industries", [])
-        companies = industry.get("companies", [])
-        if isinstance(industries, list) and industries:
-            parts.append(f"Industries: {', '.join(str(i) for i in industries)}")
-        if isinstance(companies, list) and companies:
-            parts.append(f"Companies: {', '.join(str(c) for c in companies)}")
-
-    return "\n".join(parts)
-
-
-def build_search_document(doc: dict[str, Any], embedding: list[float]) -> dict[str, Any]:
-    """Map Cosmos DB employee doc to search index fields."""
+    return EmployeeFields(doc).content
+
+
+def build_search_document(
+    doc: dict[str, Any],
+    embedding: list[float],
+    fields: EmployeeFields | None = None,
+) -> dict[str, Any]:
+    """Map Cosmos DB employee doc to search index fields.
+
+    Pass ``fields`` when they were already derived (e.g. to build the embedding text).
+    """
+    if fields is None:
+        fields = EmployeeFields(doc)
     doc_id = doc.get("id") or "unknown"
-    metadata = doc.get("metadata", {})
-    name = ""
-    if isinstance(metadata, dict):
-        name = metadata.get("title", "")
-        if not name:
-            first = metadata.get("first_name", "")
-            last = metadata.get("last_name", "")
-            name = f"{first} {last}".strip()
-
-    all_skills = _get_all_skills(doc)
-    tools = _get_tools(doc)
-    personal = doc.get("personal_info", {})
-    location = personal.get("location", "") if isinstance(personal, dict) else ""
 
     return {
         "@search.action": "mergeOrUpload",
         "id": str(doc_id),
-        "employeeName": name,
+        "employeeName": fields.name,
         "employeeAlias": str(doc_id),
-        "content": build_searchable_text(doc),
-        "skills": all_skills,
-        "tools": tools,
-        "experience": _get_experience_text(doc),
-        "projects": _get_projects_text(doc),
-        "title": _get_latest_title(doc),
-        "location": location,
+        "content": fields.content,
+        "skills": fields.all_skills,
+        "tools": fields.tools,
+        "experience": fields.experience_text,
+        "projects": fields.projects_text,
+        "title": fields.title,
+        "location": fields.location,
         "department": "",
-        "yearsOfExperience": _calculate_years(_get_earliest_start(doc)),
+        "yearsOfExperience": _calculate_years(fields.earliest_start),
         "contentVector": embedding,
     }
 
@@ -284,16 +306,260 @@ async def upload_batch(
     if dry_run:
         return len(documents), 0
 
-    payload = {"value": documents}
-    async with session.post(url, headers=headers, json=payload) as response:
-        if response.status in (200, 207):
-            data = await response.json()
-            results = data.get("value", [])
-            succeeded = sum(1 for r in results if r.get("status") is True or r.get("statusCode") in (200, 201))
-            return succeeded, len(results) - succeeded
+    body = orjson.dumps({"value": documents})
+    attempt = 0
+    while True:
+        async with session.post(url, headers=headers, data=body) as response:
+            if response.status in (200, 207):
+                data = orjson.loads(await response.read())
+                results = data.get("value", [])
+                succeeded = sum(1 for r in results if r.get("status") is True or r.get("statusCode") in (200, 201))
+                return succeeded, len(results) - succeeded
+
+            # 429 when throttled, 5xx (mostly 503) while the service is busy or failing over
+            retryable = response.status == 429 or response.status >= 500
+            if not retryable or attempt == _RATE_LIMIT_RETRIES:
+                error = await response.text()
+                raise RuntimeError(f"Upload failed ({response.status}): {error}")
+            status = response.status
+            delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+
+        logger.warning("Search upload failed (%d) — retrying in %.1fs...", status, delay)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Seconds to wait before retrying: ``Retry-After`` when the service sent one, else ``2**attempt``."""
+    delay = float(2**attempt)
+    if retry_after:
+        try:
+            delay = max(float(retry_after), 0.0)
+        except ValueError:  # HTTP-date form; fall back to the exponential delay
+            pass
+    # Jitter keeps workers that were throttled together from retrying in lockstep
+    return delay + random.uniform(0, 0.5)  # noqa: S311
+
+
+def embedding_windows(text: str) -> list[str]:
+    """Split ``text`` into overlapping windows the embedding model accepts.
+
+    Texts within the model limit are returned as-is in a single window.
+    """
+    if len(text) <= MAX_EMBEDDING_CHARS:
+        return [text]
+    stride = EMBEDDING_WINDOW_CHARS - EMBEDDING_WINDOW_OVERLAP
+    return [
+        text[start : start + EMBEDDING_WINDOW_CHARS] for start in range(0, len(text) - EMBEDDING_WINDOW_OVERLAP, stride)
+    ]
+
+
+def mean_pool(vectors: list[list[float]]) -> list[float]:
+    """Average ``vectors`` and rescale to unit length, like the model's own outputs."""
+    if len(vectors) == 1:
+        return vectors[0]
+    mean = [math.fsum(column) / len(vectors) for column in zip(*vectors, strict=True)]
+    norm = math.hypot(*mean)
+    return [x / norm for x in mean] if norm else mean
+
+
+async def embed_documents(embed: EmbedFn, texts: list[str]) -> list[list[float]]:
+    """One vector per text; the windows of every distinct text go out in a single ``embed`` call.
+
+    Identical texts (e.g. placeholder CVs) are embedded once and share the resulting vector.
+    """
+    unique = list(dict.fromkeys(texts))
+    windows = [embedding_windows(text) for text in unique]
+    vectors = await embed([window for text_windows in windows for window in text_windows])
+    pooled: dict[str, list[float]] = {}
+    start = 0
+    for text, text_windows in zip(unique, windows, strict=True):
+        pooled[text] = mean_pool(vectors[start : start + len(text_windows)])
+        start += len(text_windows)
+    return [pooled[text] for text in texts]
+
+
+async def embed_with_backoff(embed: EmbedFn, texts: list[str]) -> list[list[float]]:
+    """Call ``embed``, sleeping exponentially longer after each rate-limit response or timeout."""
+    for attempt in range(_RATE_LIMIT_RETRIES):
+        try:
+            return await embed(texts)
+        except RateLimitError as e:
+            delay = _retry_delay(attempt, e.response.headers.get("Retry-After"))
+            logger.warning("Embedding rate limited — retrying in %.1fs...", delay)
+        except APITimeoutError:
+            delay = _retry_delay(attempt)
+            logger.warning("Embedding request timed out — retrying in %.1fs...", delay)
+        await asyncio.sleep(delay)
+    return await embed(texts)
+
+
+class EmbeddingCache:
+    """Embeddings on disk keyed by ``(model, sha256(text))``, so unchanged texts are not re-embedded.
+
+    Vectors are stored as little-endian float32 blobs, the precision of the index's ``Edm.Single``
+    vector field, so a cache hit uploads exactly what a fresh embedding would.
+    """
+
+    def __init__(self, path: str, model: str) -> None:
+        self.model = model
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings_f32 ("
+            "model TEXT NOT NULL, content_hash TEXT NOT NULL, embedding BLOB NOT NULL, "
+            "PRIMARY KEY (model, content_hash))"
+        )
+
+    def get_many(self, texts: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        for text in dict.fromkeys(texts):
+            row = self._db.execute(
+                "SELECT embedding FROM embeddings_f32 WHERE model = ? AND content_hash = ?",
+                (self.model, _content_hash(text)),
+            ).fetchone()
+            if row is not None:
+                found[text] = list(struct.unpack(f"<{len(row[0]) // 4}f", row[0]))
+        return found
+
+    def put_many(self, vectors: dict[str, list[float]]) -> None:
+        self._db.executemany(
+            "INSERT OR REPLACE INTO embeddings_f32 (model, content_hash, embedding) VALUES (?, ?, ?)",
+            [
+                (self.model, _content_hash(text), struct.pack(f"<{len(vector)}f", *vector))
+                for text, vector in vectors.items()
+            ],
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
 
-        error = await response.text()
-        raise RuntimeError(f"Upload failed ({response.status}): {error}")
+
+async def embed_cached(cache: EmbeddingCache, embed: EmbedFn, texts: list[str]) -> list[list[float]]:
+    """Call ``embed`` only for texts missing from ``cache`` and store what it returns."""
+    found = cache.get_many(texts)
+    missing = [text for text in dict.fromkeys(texts) if text not in found]
+    if missing:
+        fresh = dict(zip(missing, await embed(missing), strict=True))
+        cache.put_many(fresh)
+        found.update(fresh)
+    return [found[text] for text in texts]
+
+
+async def prepare_employees(docs: AsyncIterable[dict[str, Any]]) -> AsyncIterator[PreparedEmployee]:
+    """Pair each streamed Cosmos document with its derived search fields."""
+    async for doc in docs:
+        yield doc, EmployeeFields(doc)
+
+
+async def iter_batches(
+    items: AsyncIterable[_T],
+    size: int,
+    *,
+    max_weight: int | None = None,
+    weight: Callable[[_T], int] | None = None,
+) -> AsyncIterator[list[_T]]:
+    """Group ``items`` into lists as they arrive; the last one may be shorter.
+
+    A batch holds at most ``size`` items and, when ``max_weight`` is given, at most that much total
+    ``weight``. An item heavier than ``max_weight`` on its own still gets a batch of one.
+    """
+    batch: list[_T] = []
+    total = 0
+    async for item in items:
+        item_weight = weight(item) if weight is not None else 0
+        if batch and max_weight is not None and total + item_weight > max_weight:
+            yield batch
+            batch, total = [], 0
+        batch.append(item)
+        total += item_weight
+        if len(batch) == size:
+            yield batch
+            batch, total = [], 0
+    if batch:
+        yield batch
+
+
+async def run_pipeline(
+    batches: AsyncIterable[list[PreparedEmployee]],
+    embed: EmbedFn,
+    upload: UploadFn,
+    *,
+    concurrency: int = 8,
+) -> tuple[int, int]:
+    """Embed and upload ``batches`` with the two stages overlapping.
+
+    Embedding (Azure OpenAI) and uploading (Azure AI Search) hit different
+    services, so while one batch uploads the next ones are already being
+    embedded. Up to ``concurrency`` embedding requests are in flight at once to
+    use the Azure OpenAI quota, and bounded queues between the stages keep
+    memory flat when one side is slower. A failed batch is logged and counted, and the run continues;
+    if reading ``batches`` fails, the other stages are cancelled and the error is raised.
+    Returns ``(succeeded, failed)`` document counts.
+    """
+    embed_queue: asyncio.Queue[tuple[int, list[PreparedEmployee]] | None] = asyncio.Queue(_PIPELINE_DEPTH)
+    upload_queue: asyncio.Queue[tuple[int, list[dict[str, Any]]] | None] = asyncio.Queue(_PIPELINE_DEPTH)
+    totals = [0, 0]
+
+    async def produce() -> None:
+        number = 0
+        async for batch in batches:
+            number += 1
+            await embed_queue.put((number, batch))
+        for _ in range(concurrency):
+            await embed_queue.put(None)
+
+    async def embed_worker() -> None:
+        while (item := await embed_queue.get()) is not None:
+            number, batch = item
+            logger.info("Processing batch %d (%d employees)...", number, len(batch))
+            try:
+                embeddings = await embed_documents(embed, [fields.content for _, fields in batch])
+                documents = [
+                    build_search_document(doc, emb, fields)
+                    for (doc, fields), emb in zip(batch, embeddings, strict=True)
+                ]
+            except Exception:
+                logger.exception("Batch %d embedding failed — continuing...", number)
+                totals[1] += len(batch)
+                continue
+            await upload_queue.put((number, documents))
+
+    async def embed_stage() -> None:
+        await asyncio.gather(*(embed_worker() for _ in range(concurrency)))
+        for _ in range(_UPLOAD_WORKERS):
+            await upload_queue.put(None)
+
+    async def upload_worker() -> None:
+        while (item := await upload_queue.get()) is not None:
+            number, documents = item
+            try:
+                succeeded, failed = await upload(documents)
+            except Exception:
+                logger.exception("Batch %d upload failed — continuing...", number)
+                totals[1] += len(documents)
+                continue
+            totals[0] += succeeded
+            totals[1] += failed
+            logger.info("Batch %d: %d succeeded, %d failed", number, succeeded, failed)
+
+    # A stage that raises (e.g. Cosmos paging fails mid-stream) cancels the others before we return,
+    # so nothing is left running against clients the caller is about to close
+    try:
+        async with asyncio.TaskGroup() as stages:
+            stages.create_task(produce())
+            stages.create_task(embed_stage())
+            for _ in range(_UPLOAD_WORKERS):
+                stages.create_task(upload_worker())
+    except ExceptionGroup as group:
+        if len(group.exceptions) == 1:
+            raise group.exceptions[0] from None
+        raise
+    return totals[0], totals[1]
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -308,8 +574,34 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=10,
-        help="Number of employees per batch (default: 10)",
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Maximum employees per batch (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--max-request-chars",
+        type=int,
+        default=DEFAULT_MAX_REQUEST_CHARS,
+        help=f"Maximum CV text characters per embedding request (default: {DEFAULT_MAX_REQUEST_CHARS})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum concurrent embedding requests (default: 8)",
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--embedding-cache",
+        default=DEFAULT_EMBEDDING_CACHE,
+        metavar="PATH",
+        help="SQLite file caching embeddings between runs (default: scripts/.embedding_cache.sqlite)",
+    )
+    cache_group.add_argument(
+        "--no-embedding-cache",
+        dest="embedding_cache",
+        action="store_const",
+        const=None,
+        help="Embed every CV, without reading or writing the cache",
     )
     parser.add_argument(
         "--verbose",
@@ -319,34 +611,47 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def configure_logging(verbose: bool) -> QueueListener:
+    """Route log records through a queue so stderr writes happen off the event loop thread.
+
+    The returned listener is already running; ``stop()`` it on exit to flush pending records.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    # Added directly rather than via basicConfig, which would also give the QueueHandler a formatter
+    # and format every message twice
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
 async def reindex(args: argparse.Namespace) -> None:
     settings = Settings()
-    level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(message)s")
 
     logger.info("Connecting to Cosmos DB...")
     cosmos_client = CosmosClient(settings.COSMOS_DB_ENDPOINT, settings.COSMOS_DB_KEY)
+    openai_client: AsyncAzureOpenAI | None = None
+    embedding_cache: EmbeddingCache | None = None
     try:
         db = cosmos_client.get_database_client(settings.COSMOS_DB_DATABASE)
         container = db.get_container_client(settings.COSMOS_DB_EMPLOYEES_CONTAINER)
 
-        logger.info("Fetching all employees...")
-        employees: list[dict[str, Any]] = []
-        async for item in container.read_all_items():
-            employees.append(item)
-
-        logger.info("Found %d employees", len(employees))
-        if not employees:
-            logger.warning("No employees found. Exiting.")
-            return
-
-        openai_client: AsyncAzureOpenAI | None = None
         if not args.dry_run:
             logger.info("Initializing OpenAI embedding client...")
+            # Keep one warm connection per in-flight embedding request for the whole run
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
             openai_client = AsyncAzureOpenAI(
                 azure_endpoint=settings.OPENAI_ENDPOINT,
                 api_key=settings.OPENAI_API_KEY,
                 api_version=settings.OPENAI_API_VERSION,
+                http_client=http_client,
             )
 
         search_url = (
@@ -359,82 +664,87 @@ async def reindex(args: argparse.Namespace) -> None:
             "api-key": settings.AZURE_SEARCH_KEY,
         }
 
-        total_succeeded = 0
-        total_failed = 0
-        total_batches = (len(employees) + args.batch_size - 1) // args.batch_size
-
-        timeout = aiohttp.ClientTimeout(total=60)
-        async with aiohttp.ClientSession(timeout=timeout) as http_session:
-            for batch_idx in range(total_batches):
-                start = batch_idx * args.batch_size
-                end = min(start + args.batch_size, len(employees))
-                batch = employees[start:end]
-
-                logger.info(
-                    "Processing batch %d/%d (%d employees)...",
-                    batch_idx + 1,
-                    total_batches,
-                    len(batch),
-                )
-
-                try:
-                    texts = [build_searchable_text(doc) for doc in batch]
-
-                    if args.dry_run:
-                        embeddings: list[list[float]] = [[0.0] * settings.OPENAI_EMBEDDING_DIMENSIONS] * len(batch)
-                    else:
-                        assert openai_client is not None
-                        resp = await openai_client.embeddings.create(
-                            input=texts,
-                            model=settings.OPENAI_EMBEDDING_MODEL,
-                            dimensions=settings.OPENAI_EMBEDDING_DIMENSIONS,
-                        )
-                        embeddings = [item.embedding for item in resp.data]
-
-                    documents = [build_search_document(doc, emb) for doc, emb in zip(batch, embeddings)]
-
-                    succeeded, failed = await upload_batch(
-                        http_session,
-                        search_url,
-                        search_headers,
-                        documents,
-                        dry_run=args.dry_run,
-                    )
-                    total_succeeded += succeeded
-                    total_failed += failed
-
-                    logger.info(
-                        "Batch %d/%d: %d succeeded, %d failed",
-                        batch_idx + 1,
-                        total_batches,
-                        succeeded,
-                        failed,
-                    )
-                except Exception:
-                    logger.exception(
-                        "Batch %d/%d failed — continuing...",
-                        batch_idx + 1,
-                        total_batches,
-                    )
-                    total_failed += len(batch)
-
-                if batch_idx < total_batches - 1:
-                    await asyncio.sleep(1)
+        async def embed(texts: list[str]) -> list[list[float]]:
+            if args.dry_run:
+                return [[0.0] * settings.OPENAI_EMBEDDING_DIMENSIONS] * len(texts)
+            assert openai_client is not None
+            resp = await openai_client.embeddings.create(
+                input=texts,
+                model=settings.OPENAI_EMBEDDING_MODEL,
+                dimensions=settings.OPENAI_EMBEDDING_DIMENSIONS,
+            )
+            return [item.embedding for item in resp.data]
+
+        embed_batch = functools.partial(embed_with_backoff, embed)
+        # Dry runs produce placeholder vectors, which must never end up in the cache
+        if args.embedding_cache and not args.dry_run:
+            model_key = f"{settings.OPENAI_EMBEDDING_MODEL}:{settings.OPENAI_EMBEDDING_DIMENSIONS}"
+            embedding_cache = EmbeddingCache(args.embedding_cache, model_key)
+            embed_batch = functools.partial(embed_cached, embedding_cache, embed_batch)
+
+        # Batches are built from Cosmos pages as they arrive instead of loading every employee first;
+        # iter_batches regroups items, so Cosmos is free to pick its own (larger) page size
+        logger.info("Streaming employees from Cosmos DB...")
+        employees = prepare_employees(container.query_items(EMPLOYEE_QUERY, max_item_count=-1))
+        # Fill each embedding request up to the character budget instead of a fixed employee count
+        batches = iter_batches(
+            employees,
+            args.batch_size,
+            max_weight=args.max_request_chars,
+            weight=lambda employee: len(employee[1].content),
+        )
+
+        # Uploads now carry up to --batch-size vectors each; leave room for large batches, fail fast on connect
+        timeout = aiohttp.ClientTimeout(total=120, sock_connect=10)
+        # One Search endpoint for the whole run: few sockets, kept alive, DNS resolved once
+        connector = aiohttp.TCPConnector(
+            limit=_SEARCH_CONNECTIONS,
+            limit_per_host=_SEARCH_CONNECTIONS,
+            ttl_dns_cache=600,
+            keepalive_timeout=75,
+        )
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as http_session:
+            upload = functools.partial(
+                upload_batch,
+                http_session,
+                search_url,
+                search_headers,
+                dry_run=args.dry_run,
+            )
+            total_succeeded, total_failed = await run_pipeline(
+                batches,
+                embed_batch,
+                upload,
+                concurrency=args.concurrency,
+            )
     finally:
+        if embedding_cache is not None:
+            embedding_cache.close()
+        if openai_client is not None:
+            await openai_client.close()
         await cosmos_client.close()
 
+    total_employees = total_succeeded + total_failed
+    if not total_employees:
+        logger.warning("No employees found.")
+        return
+
     logger.info("=" * 50)
     logger.info("Re-indexing complete!")
     logger.info("Total succeeded: %d", total_succeeded)
     logger.info("Total failed: %d", total_failed)
-    logger.info("Total employees: %d", len(employees))
+    logger.info("Total employees: %d", total_employees)
     if args.dry_run:
         logger.info("[DRY RUN] No documents were actually uploaded.")
 
 
 def main() -> None:
     args = parse_args()
-    asyncio.run(reindex(args))
+    listener = configure_logging(args.verbose)
+    try:
+        asyncio.run(reindex(args))
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
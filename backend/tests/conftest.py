@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import base64
 import time
+from collections.abc import Callable
+from typing import NamedTuple
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from cryptography.hazmat.primitives.asymmetric import rsa
@@ -10,7 +13,7 @@ from httpx import ASGITransport, AsyncClient
 from jose import jwt
 from starlette.testclient import TestClient
 
-from app.core.dependencies import get_current_user
+from app.core.dependencies import _token_cache, get_current_user
 from app.main import app
 from app.models.auth import UserInfo
 
@@ -24,6 +27,12 @@ def _int_to_base64url(value: int) -> str:
     return base64.urlsafe_b64encode(value.to_bytes(byte_length, byteorder="big")).rstrip(b"=").decode("ascii")
 
 
+# The app only runs on asyncio (uvicorn) and some code uses asyncio APIs directly, so skip trio
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
 @pytest.fixture(autouse=True)
 def _auth_settings():
     from app.core.config import settings
@@ -37,11 +46,54 @@ def _auth_settings():
     settings.AZURE_AD_CLIENT_ID = original_client
 
 
+@pytest.fixture(autouse=True)
+def _reset_dependency_overrides():
+    yield
+    app.dependency_overrides.clear()
+
+
+# Validated users are cached module-globally; never let one test's entries reach another
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    _token_cache.clear()
+    yield
+    _token_cache.clear()
+
+
+# Returned by every mocked get_embedding call; the code under test only reads it
+FAKE_EMBEDDING = [0.1] * 3072
+
+
+class MockServices(NamedTuple):
+    embedding: MagicMock
+    search: MagicMock
+
+
 @pytest.fixture
+def mock_services(monkeypatch) -> Callable[[str], MockServices]:
+    """Replace ``embedding_service`` and ``search_service`` in the given module with mocks.
+
+    Defaults: ``get_embedding`` returns ``FAKE_EMBEDDING`` and ``hybrid_search`` returns no hits;
+    tests adjust ``return_value``/``side_effect`` on the returned mocks.
+    """
+
+    def install(module: str) -> MockServices:
+        embedding = MagicMock()
+        embedding.get_embedding = AsyncMock(return_value=FAKE_EMBEDDING)
+        search = MagicMock()
+        search.hybrid_search = AsyncMock(return_value=[])
+        monkeypatch.setattr(f"{module}.embedding_service", embedding)
+        monkeypatch.setattr(f"{module}.search_service", search)
+        return MockServices(embedding, search)
+
+    return install
+
+
+# One app lifespan per test module instead of one per test; overrides are reset per test above
+@pytest.fixture(scope="module")
 def client():
     with TestClient(app) as c:
         yield c
-    app.dependency_overrides.clear()
 
 
 @pytest.fixture
@@ -49,10 +101,10 @@ async def async_client():
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
-    app.dependency_overrides.clear()
 
 
-@pytest.fixture
+# RSA key generation is slow; one key pair serves every test (nothing mutates the returned values)
+@pytest.fixture(scope="session")
 def rsa_test_keys():
     private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
     private_pem = private_key.private_bytes(
@@ -74,6 +126,9 @@ def rsa_test_keys():
     return private_pem, jwks_response
 
 
+_TOKEN_CACHE: dict[tuple[str, str, str, str, tuple[str, ...], bool], str] = {}
+
+
 def _make_token(
     private_pem: str,
     *,
@@ -82,6 +137,23 @@ def _make_token(
     email: str = "test@emposo.de",
     roles: list[str] | None = None,
     expired: bool = False,
+) -> str:
+    # Signing is an RSA private-key operation; identical requests reuse the token. Timestamps are fixed
+    # at first use, which is fine as long as a test session stays well inside the one-hour validity.
+    key = (private_pem, oid, name, email, tuple(roles or ()), expired)
+    token = _TOKEN_CACHE.get(key)
+    if token is None:
+        token = _TOKEN_CACHE[key] = _sign_token(private_pem, oid, name, email, roles, expired)
+    return token
+
+
+def _sign_token(
+    private_pem: str,
+    oid: str,
+    name: str,
+    email: str,
+    roles: list[str] | None,
+    expired: bool,
 ) -> str:
     now = int(time.time())
     claims = {
@@ -114,8 +186,13 @@ def mock_user_sales():
 
 
 @pytest.fixture
-def authenticated_client(mock_user_admin):
+def authenticated_client(client, mock_user_admin):
+    # The module's shared client with an admin user; the override is cleared after each test
     app.dependency_overrides[get_current_user] = lambda: mock_user_admin
-    with TestClient(app) as c:
-        yield c
-    app.dependency_overrides.clear()
+    return client
+
+
+@pytest.fixture
+def authenticated_async_client(async_client, mock_user_admin):
+    app.dependency_overrides[get_current_user] = lambda: mock_user_admin
+    return async_client
@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+
 def test_root_returns_message(client):
     response = client.get("/")
     assert response.status_code == 200
@@ -13,3 +16,25 @@ def test_health_returns_status(client):
     assert "version" in data
     assert data["version"] == "0.1.0"
     assert "services" in data
+
+
+def test_cors_allows_configured_origin(client):
+    response = client.get("/", headers={"Origin": "https://cvision.emposo.eu"})
+    assert response.headers["access-control-allow-origin"] == "https://cvision.emposo.eu"
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+
+def test_cors_preflight_rejects_unknown_origin(client):
+    response = client.options(
+        "/api/v1/health",
+        headers={"Origin": "https://evil.example.com", "Access-Control-Request-Method": "GET"},
+    )
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_cors_skipped_without_origin_header(client):
+    response = client.get("/")
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+    assert "vary" not in response.headers
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+import asyncio
+import hashlib
+import time
+from unittest.mock import MagicMock, patch
 
+import aiohttp
+import orjson
 import pytest
-from fastapi import HTTPException
+from fastapi import Depends, FastAPI, HTTPException
+from jose import jwt
+from starlette.testclient import TestClient
 
-from app.core.auth import extract_roles_from_token, validate_token
-from app.core.dependencies import require_role
-from tests.conftest import TEST_CLIENT_ID, TEST_TENANT_ID, _make_token
+from app.core.auth import _cache, extract_roles_from_token, get_jwks, get_signing_key, validate_token
+from app.core.dependencies import _get_user_cached, _token_cache, get_current_user, require_role
+from app.models.auth import UserInfo
+from tests.conftest import TEST_CLIENT_ID, TEST_KID, TEST_TENANT_ID, _make_token
 
 
 def test_missing_auth_header_returns_401(client):
@@ -69,31 +77,205 @@ async def test_role_check_fails_with_wrong_role(mock_user_viewer):
 
 def test_extract_roles_from_token_with_roles():
     payload = {"roles": ["admin", "viewer"]}
-    assert extract_roles_from_token(payload) == ["admin", "viewer"]
+    assert extract_roles_from_token(payload) == ("admin", "viewer")
 
 
 def test_extract_roles_from_token_empty():
-    assert extract_roles_from_token({}) == []
+    assert extract_roles_from_token({}) == ()
 
 
 def test_extract_roles_from_token_invalid_type():
-    assert extract_roles_from_token({"roles": "not-a-list"}) == []
+    assert extract_roles_from_token({"roles": "not-a-list"}) == ()
 
 
+@pytest.mark.anyio
 @patch("app.core.auth.get_jwks")
-def test_validate_token_with_valid_token(mock_get_jwks, rsa_test_keys):
+async def test_validate_token_with_valid_token(mock_get_jwks, rsa_test_keys):
     private_pem, jwks_response = rsa_test_keys
     mock_get_jwks.return_value = jwks_response
 
     token = _make_token(private_pem, roles=["admin", "viewer"])
-    payload = validate_token(token, TEST_TENANT_ID, TEST_CLIENT_ID)
+    payload = await validate_token(token, TEST_TENANT_ID, TEST_CLIENT_ID)
 
     assert payload["oid"] == "test-oid-123"
     assert payload["name"] == "Test User"
     assert payload["roles"] == ["admin", "viewer"]
 
 
-def test_validate_token_missing_config():
+@pytest.mark.anyio
+async def test_validate_token_missing_config():
     with pytest.raises(HTTPException) as exc_info:
-        validate_token("any-token", "", "")
+        await validate_token("any-token", "", "")
     assert exc_info.value.status_code == 500
+
+
+@pytest.mark.anyio
+@patch("app.core.auth.get_jwks")
+async def test_signing_key_reused_for_same_jwks(mock_get_jwks, rsa_test_keys):
+    private_pem, jwks_response = rsa_test_keys
+    mock_get_jwks.return_value = jwks_response
+    token = _make_token(private_pem)
+
+    first_key, algorithm = await get_signing_key(token, TEST_TENANT_ID)
+    second_key, _ = await get_signing_key(token, TEST_TENANT_ID)
+
+    assert algorithm == "RS256"
+    assert first_key is second_key
+
+
+@patch("app.core.auth.get_jwks")
+def test_repeated_requests_reuse_validated_token(mock_get_jwks, client, rsa_test_keys):
+    private_pem, jwks_response = rsa_test_keys
+    mock_get_jwks.return_value = jwks_response
+    headers = {"Authorization": f"Bearer {_make_token(private_pem)}"}
+
+    with patch("app.core.dependencies.validate_token", wraps=validate_token) as mock_validate:
+        first = client.get("/api/v1/health/protected", headers=headers)
+        second = client.get("/api/v1/health/protected", headers=headers)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert mock_validate.call_count == 1
+
+
+@patch("app.core.auth.get_jwks")
+def test_cached_user_lifetime_is_capped(mock_get_jwks, client, rsa_test_keys):
+    private_pem, jwks_response = rsa_test_keys
+    mock_get_jwks.return_value = jwks_response
+
+    response = client.get(
+        "/api/v1/health/protected",
+        headers={"Authorization": f"Bearer {_make_token(private_pem)}"},
+    )
+
+    assert response.status_code == 200
+    ((user, expires_at),) = _token_cache.values()
+    assert user.id == "test-oid-123"
+    assert expires_at <= time.time() + 300
+
+
+def test_cached_token_past_expiry_is_revalidated(client):
+    token = "cached-but-expired"  # noqa: S105
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    _token_cache[key] = (UserInfo(id="stale"), time.time() - 1)
+
+    response = client.get("/api/v1/health/protected", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 401
+    assert key not in _token_cache
+
+
+@pytest.mark.anyio
+@patch("app.core.auth.get_jwks")
+async def test_validate_token_accepts_alternate_issuer_and_audience(mock_get_jwks, rsa_test_keys):
+    private_pem, jwks_response = rsa_test_keys
+    mock_get_jwks.return_value = jwks_response
+
+    now = int(time.time())
+    claims = {
+        "oid": "test-oid-123",
+        "iss": f"https://sts.windows.net/{TEST_TENANT_ID}/",
+        "aud": f"api://{TEST_CLIENT_ID}",
+        "exp": now + 3600,
+    }
+    token = jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": TEST_KID})
+
+    with patch("app.core.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+        payload = await validate_token(token, TEST_TENANT_ID, TEST_CLIENT_ID)
+
+    assert payload["oid"] == "test-oid-123"
+    assert mock_decode.call_count == 1
+
+
+@pytest.mark.anyio
+@patch("app.core.auth.get_jwks")
+async def test_validate_token_rejects_wrong_audience(mock_get_jwks, rsa_test_keys):
+    private_pem, jwks_response = rsa_test_keys
+    mock_get_jwks.return_value = jwks_response
+
+    now = int(time.time())
+    claims = {
+        "iss": f"https://login.microsoftonline.com/{TEST_TENANT_ID}/v2.0",
+        "aud": "some-other-app",
+        "exp": now + 3600,
+    }
+    token = jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": TEST_KID})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await validate_token(token, TEST_TENANT_ID, TEST_CLIENT_ID)
+    assert exc_info.value.status_code == 401
+    assert "audience" in exc_info.value.detail
+
+
+@pytest.mark.anyio
+async def test_concurrent_jwks_misses_fetch_once(rsa_test_keys):
+    _, jwks_response = rsa_test_keys
+    tenant_id = "coalesce-tenant"
+    _cache["jwks"].pop(f"jwks_{tenant_id}", None)
+
+    class _FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        async def read(self):
+            return orjson.dumps(jwks_response)
+
+        async def __aenter__(self):
+            await asyncio.sleep(0.01)
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    session = MagicMock(closed=False)
+    session.get.side_effect = lambda url, **kwargs: _FakeResponse()
+
+    with patch("app.core.auth._jwks_session", session):
+        results = await asyncio.gather(*(get_jwks(tenant_id) for _ in range(10)))
+
+    assert session.get.call_count == 1
+    assert all(r is results[0] for r in results)
+    assert results[0] == jwks_response
+    _cache["jwks"].pop(f"jwks_{tenant_id}", None)
+
+
+@patch("app.core.auth.get_jwks")
+def test_token_validated_once_per_request_with_shared_dependency(mock_get_jwks, rsa_test_keys):
+    private_pem, jwks_response = rsa_test_keys
+    mock_get_jwks.return_value = jwks_response
+
+    probe = FastAPI()
+
+    @probe.get("/both")
+    async def both(
+        user: UserInfo = Depends(get_current_user),  # noqa: B008
+        admin: UserInfo = Depends(require_role("admin")),  # noqa: B008
+    ):
+        return {"same": user is admin}
+
+    headers = {"Authorization": f"Bearer {_make_token(private_pem, roles=['admin'])}"}
+    with patch("app.core.dependencies._get_user_cached", wraps=_get_user_cached) as mock_validate:
+        response = TestClient(probe).get("/both", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"same": True}
+    assert mock_validate.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_jwks_refresh_failure_serves_stale_keys(rsa_test_keys):
+    _, jwks_response = rsa_test_keys
+    cache_key = "jwks_stale-tenant"
+    _cache["jwks"][cache_key] = jwks_response
+    _cache["jwks_timestamp"][cache_key] = 0.0
+
+    session = MagicMock(closed=False)
+    session.get.side_effect = aiohttp.ClientConnectionError("unreachable")
+
+    with patch("app.core.auth._jwks_session", session):
+        result = await get_jwks("stale-tenant")
+
+    assert result is jwks_response
+    assert session.get.call_count == 1
+    _cache["jwks"].pop(cache_key, None)
+    _cache["jwks_timestamp"].pop(cache_key, None)
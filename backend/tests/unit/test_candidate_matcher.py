@@ -4,11 +4,7 @@ import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from starlette.testclient import TestClient
 
-from app.core.dependencies import get_current_user
-from app.main import app
-from app.models.auth import UserInfo
 from app.models.lastenheft import (
     CandidateMatch,
     CandidateMatchResponse,
@@ -18,8 +14,11 @@ from app.models.lastenheft import (
 from app.services.candidate_matcher import (
     CandidateMatcher,
     CandidateMatcherError,
+    SkillSet,
     calculate_experience_score,
     calculate_skill_match,
+    employee_skill_set,
+    lower_required_skills,
     normalize_search_score,
 )
 
@@ -65,64 +64,89 @@ def _make_llm_response(content: str) -> MagicMock:
     return response
 
 
-class TestCalculateSkillMatch:
-    def test_all_skills_match(self):
-        required = [
-            ExtractedSkill(name="Python", category="programming", mandatory=True, level=None),
-            ExtractedSkill(name="React", category="framework", mandatory=False, level=None),
-        ]
-        result = calculate_skill_match(required, ["Python", "React", "Java"], [])
-        assert result == 1.0
+# match() only reads the search hits, so these are built once and shared across tests
+@pytest.fixture(scope="module")
+def ranked_hits() -> tuple[list[dict], str]:
+    search_results = [
+        _make_search_result(0, skills=["Python", "React", "Azure"], tools=["Docker"], score=0.95),
+        _make_search_result(1, skills=["Python"], tools=[], score=0.80),
+        _make_search_result(2, skills=["Java", "Spring"], tools=["Maven"], score=0.60),
+    ]
+    explanations_json = json.dumps(
+        {
+            "explanations": [
+                {"employee_alias": "emp0", "explanation": "Perfekte Übereinstimmung mit allen Skills."},
+                {"employee_alias": "emp1", "explanation": "Python-Erfahrung vorhanden, React fehlt."},
+                {"employee_alias": "emp2", "explanation": "Keine relevanten Skills gefunden."},
+            ]
+        }
+    )
+    return search_results, explanations_json
 
-    def test_no_skills_match(self):
-        required = [
-            ExtractedSkill(name="Python", category="programming", mandatory=True, level=None),
-            ExtractedSkill(name="React", category="framework", mandatory=True, level=None),
-        ]
-        result = calculate_skill_match(required, ["Go", "Rust"], ["Vim"])
-        assert result == 0.0
 
-    def test_partial_match(self):
-        required = [
-            ExtractedSkill(name="Python", category="programming", mandatory=False, level=None),
-            ExtractedSkill(name="React", category="framework", mandatory=False, level=None),
-        ]
-        result = calculate_skill_match(required, ["Python"], [])
-        assert result == pytest.approx(0.5)
+@pytest.fixture(scope="module")
+def many_hits() -> tuple[list[dict], str]:
+    search_results = [_make_search_result(i, skills=["Python"], score=1.0 - i * 0.05) for i in range(15)]
+    explanations_json = json.dumps(
+        {"explanations": [{"employee_alias": f"emp{i}", "explanation": f"Match {i}"} for i in range(10)]}
+    )
+    return search_results, explanations_json
+
+
+def _skill(name: str, mandatory: bool = True) -> ExtractedSkill:
+    return ExtractedSkill(name=name, category="programming", mandatory=mandatory, level=None)
+
+
+class TestCalculateSkillMatch:
+    @pytest.mark.parametrize(
+        ("required", "skills", "tools", "expected"),
+        [
+            pytest.param(
+                [_skill("Python"), _skill("React", False)], ["Python", "React", "Java"], [], 1.0, id="all_match"
+            ),
+            pytest.param([_skill("Python"), _skill("React")], ["Go", "Rust"], ["Vim"], 0.0, id="no_match"),
+            pytest.param([_skill("Python", False), _skill("React", False)], ["Python"], [], 0.5, id="partial_match"),
+            pytest.param([_skill("Python")], ["python"], [], 1.0, id="case_insensitive"),
+            pytest.param([_skill("Docker")], [], ["Docker", "Kubernetes"], 1.0, id="matches_tools"),
+            pytest.param([], ["Python", "React"], ["Docker"], 0.0, id="empty_required"),
+            pytest.param([_skill("Python")], [], [], 0.0, id="empty_employee"),
+        ],
+    )
+    def test_skill_match(self, required, skills, tools, expected):
+        result = calculate_skill_match(lower_required_skills(required), employee_skill_set(skills, tools))
+        assert result == pytest.approx(expected)
 
     def test_mandatory_skills_count_double(self):
         required = [
             ExtractedSkill(name="Python", category="programming", mandatory=True, level=None),
             ExtractedSkill(name="React", category="framework", mandatory=False, level=None),
         ]
-        result_mandatory = calculate_skill_match(required, ["Python"], [])
-        result_optional = calculate_skill_match(required, ["React"], [])
+        result_mandatory = calculate_skill_match(lower_required_skills(required), employee_skill_set(["Python"], []))
+        result_optional = calculate_skill_match(lower_required_skills(required), employee_skill_set(["React"], []))
         assert result_mandatory > result_optional
 
-    def test_case_insensitive_matching(self):
-        required = [
-            ExtractedSkill(name="Python", category="programming", mandatory=True, level=None),
-        ]
-        result = calculate_skill_match(required, ["python"], [])
-        assert result == 1.0
 
-    def test_matches_against_tools_too(self):
-        required = [
-            ExtractedSkill(name="Docker", category="cloud", mandatory=True, level=None),
-        ]
-        result = calculate_skill_match(required, [], ["Docker", "Kubernetes"])
-        assert result == 1.0
+class TestSkillSet:
+    def test_splits_mandatory_and_all_names(self):
+        skillset = SkillSet(SAMPLE_SKILLS)
+        assert skillset.names == [s.name for s in SAMPLE_SKILLS]
+        assert skillset.mandatory_names == [s.name for s in SAMPLE_SKILLS if s.mandatory]
+        assert skillset.lowered == lower_required_skills(SAMPLE_SKILLS)
+        assert skillset.lowered_names == {s.name.lower() for s in SAMPLE_SKILLS}
 
-    def test_empty_required_skills(self):
-        result = calculate_skill_match([], ["Python", "React"], ["Docker"])
-        assert result == 0.0
+    def test_primary_level_prefers_mandatory_skill(self):
+        skills = [
+            ExtractedSkill(name="Scrum", category="methodology", mandatory=False, level="expert"),
+            ExtractedSkill(name="Python", category="programming", mandatory=True, level="senior"),
+        ]
+        assert SkillSet(skills).primary_level == "senior"
 
-    def test_empty_employee_skills_and_tools(self):
-        required = [
+    def test_primary_level_falls_back_to_optional_skill(self):
+        skills = [
             ExtractedSkill(name="Python", category="programming", mandatory=True, level=None),
+            ExtractedSkill(name="Scrum", category="methodology", mandatory=False, level="mid"),
         ]
-        result = calculate_skill_match(required, [], [])
-        assert result == 0.0
+        assert SkillSet(skills).primary_level == "mid"
 
 
 class TestCalculateExperienceScore:
@@ -158,6 +182,9 @@ class TestCalculateExperienceScore:
         result = calculate_experience_score("expert", 2.0)
         assert result < 0.8
 
+    def test_unknown_level_scored_as_mid(self):
+        assert calculate_experience_score("principal", 4.0) == calculate_experience_score("mid", 4.0)
+
     def test_returns_between_0_and_1(self):
         for level in [None, "junior", "mid", "senior", "expert"]:
             for years in [0.0, 1.0, 3.0, 5.0, 10.0, 20.0]:
@@ -166,23 +193,46 @@ class TestCalculateExperienceScore:
 
 
 class TestNormalizeSearchScore:
-    def test_zero_score(self):
-        assert normalize_search_score(0.0, 10.0) == 0.0
-
-    def test_max_score(self):
-        assert normalize_search_score(10.0, 10.0) == 1.0
-
-    def test_mid_score(self):
-        assert normalize_search_score(5.0, 10.0) == pytest.approx(0.5)
-
-    def test_zero_max_score_returns_zero(self):
-        assert normalize_search_score(5.0, 0.0) == 0.0
+    @pytest.mark.parametrize(
+        ("score", "max_score", "expected"),
+        [
+            pytest.param(0.0, 10.0, 0.0, id="zero"),
+            pytest.param(10.0, 10.0, 1.0, id="max"),
+            pytest.param(5.0, 10.0, 0.5, id="mid"),
+            pytest.param(5.0, 0.0, 0.0, id="zero_max"),
+            pytest.param(-1.0, 10.0, 0.0, id="negative_clamps_to_zero"),
+            pytest.param(15.0, 10.0, 1.0, id="above_max_clamps_to_one"),
+        ],
+    )
+    def test_normalize(self, score, max_score, expected):
+        assert normalize_search_score(score, max_score) == pytest.approx(expected)
+
+
+class TestScoreSerialization:
+    def test_scores_rounded_on_dump(self):
+        breakdown = ScoreBreakdown(
+            skill_match=2 / 3,
+            experience=0.123456,
+            semantic_similarity=0.5,
+            availability=0.8,
+        )
+        match = CandidateMatch(
+            employee_name="A",
+            employee_alias="a",
+            title="",
+            location="",
+            skills=[],
+            total_score=1 / 3,
+            breakdown=breakdown,
+            explanation="",
+        )
 
-    def test_negative_score_clamps_to_zero(self):
-        assert normalize_search_score(-1.0, 10.0) == 0.0
+        data = match.model_dump()
 
-    def test_score_above_max_clamps_to_one(self):
-        assert normalize_search_score(15.0, 10.0) == 1.0
+        assert data["total_score"] == 0.3333
+        assert data["breakdown"]["skill_match"] == 0.6667
+        assert data["breakdown"]["experience"] == 0.1235
+        assert match.total_score == 1 / 3
 
 
 class TestCandidateMatcherInitialize:
@@ -229,7 +279,20 @@ class TestCandidateMatcherInitialize:
         assert matcher.client is None
 
 
+@pytest.fixture
+def services(mock_services):
+    return mock_services("app.services.candidate_matcher")
+
+
 class TestCandidateMatcherMatch:
+    @pytest.fixture
+    def matcher(self):
+        matcher = CandidateMatcher()
+        matcher.initialized = True
+        matcher.client = MagicMock()
+        matcher.model = "gpt-4o"
+        return matcher
+
     @pytest.mark.anyio
     async def test_not_initialized_raises(self):
         matcher = CandidateMatcher()
@@ -237,20 +300,10 @@ class TestCandidateMatcherMatch:
             await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
 
     @pytest.mark.anyio
-    async def test_empty_search_results_returns_empty(self):
-        matcher = CandidateMatcher()
-        matcher.initialized = True
-        matcher.client = MagicMock()
-        matcher.model = "gpt-4o"
+    async def test_empty_search_results_returns_empty(self, matcher, services):
+        services.search.hybrid_search.return_value = []
 
-        with (
-            patch("app.services.candidate_matcher.embedding_service") as mock_emb,
-            patch("app.services.candidate_matcher.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=[])
-
-            result = await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
+        result = await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
 
         assert isinstance(result, CandidateMatchResponse)
         assert result.matches == []
@@ -258,37 +311,12 @@ class TestCandidateMatcherMatch:
         assert "Python" in result.query_skills
 
     @pytest.mark.anyio
-    async def test_full_pipeline_returns_scored_matches(self):
-        matcher = CandidateMatcher()
-        matcher.initialized = True
-        matcher.client = MagicMock()
-        matcher.model = "gpt-4o"
-
-        search_results = [
-            _make_search_result(0, skills=["Python", "React", "Azure"], tools=["Docker"], score=0.95),
-            _make_search_result(1, skills=["Python"], tools=[], score=0.80),
-            _make_search_result(2, skills=["Java", "Spring"], tools=["Maven"], score=0.60),
-        ]
-
-        explanations_json = json.dumps(
-            {
-                "explanations": [
-                    {"employee_alias": "emp0", "explanation": "Perfekte Übereinstimmung mit allen Skills."},
-                    {"employee_alias": "emp1", "explanation": "Python-Erfahrung vorhanden, React fehlt."},
-                    {"employee_alias": "emp2", "explanation": "Keine relevanten Skills gefunden."},
-                ]
-            }
-        )
+    async def test_full_pipeline_returns_scored_matches(self, matcher, services, ranked_hits):
+        search_results, explanations_json = ranked_hits
+        services.search.hybrid_search.return_value = search_results
+        matcher.client.chat.completions.create = AsyncMock(return_value=_make_llm_response(explanations_json))
 
-        with (
-            patch("app.services.candidate_matcher.embedding_service") as mock_emb,
-            patch("app.services.candidate_matcher.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=search_results)
-            matcher.client.chat.completions.create = AsyncMock(return_value=_make_llm_response(explanations_json))
-
-            result = await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
+        result = await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
 
         assert isinstance(result, CandidateMatchResponse)
         assert len(result.matches) == 3
@@ -307,169 +335,98 @@ class TestCandidateMatcherMatch:
         assert first.explanation != ""
 
     @pytest.mark.anyio
-    async def test_limits_to_top_10(self):
-        matcher = CandidateMatcher()
-        matcher.initialized = True
-        matcher.client = MagicMock()
-        matcher.model = "gpt-4o"
-
-        search_results = [_make_search_result(i, skills=["Python"], score=1.0 - i * 0.05) for i in range(15)]
-
-        explanations_json = json.dumps(
-            {"explanations": [{"employee_alias": f"emp{i}", "explanation": f"Match {i}"} for i in range(10)]}
-        )
+    async def test_limits_to_top_10(self, matcher, services, many_hits):
+        search_results, explanations_json = many_hits
+        services.search.hybrid_search.return_value = search_results
+        matcher.client.chat.completions.create = AsyncMock(return_value=_make_llm_response(explanations_json))
 
-        with (
-            patch("app.services.candidate_matcher.embedding_service") as mock_emb,
-            patch("app.services.candidate_matcher.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=search_results)
-            matcher.client.chat.completions.create = AsyncMock(return_value=_make_llm_response(explanations_json))
-
-            result = await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
+        result = await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
 
         assert len(result.matches) <= 10
 
     @pytest.mark.anyio
-    async def test_llm_error_returns_matches_without_explanations(self):
-        matcher = CandidateMatcher()
-        matcher.initialized = True
-        matcher.client = MagicMock()
-        matcher.model = "gpt-4o"
-
+    async def test_llm_error_returns_matches_without_explanations(self, matcher, services):
         search_results = [
             _make_search_result(0, skills=["Python", "React"], score=0.9),
         ]
 
-        with (
-            patch("app.services.candidate_matcher.embedding_service") as mock_emb,
-            patch("app.services.candidate_matcher.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=search_results)
-            matcher.client.chat.completions.create = AsyncMock(side_effect=Exception("LLM rate limited"))
+        services.search.hybrid_search.return_value = search_results
+        matcher.client.chat.completions.create = AsyncMock(side_effect=Exception("LLM rate limited"))
 
-            result = await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
+        result = await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
 
         assert len(result.matches) == 1
         assert result.matches[0].employee_name == "Employee 0"
         assert result.matches[0].explanation == ""
 
     @pytest.mark.anyio
-    async def test_builds_query_from_mandatory_skills(self):
-        matcher = CandidateMatcher()
-        matcher.initialized = True
-        matcher.client = MagicMock()
-        matcher.model = "gpt-4o"
-
+    async def test_builds_query_from_mandatory_skills(self, matcher, services):
         skills = [
             ExtractedSkill(name="Python", category="programming", mandatory=True, level=None),
             ExtractedSkill(name="Docker", category="cloud", mandatory=False, level=None),
         ]
 
-        with (
-            patch("app.services.candidate_matcher.embedding_service") as mock_emb,
-            patch("app.services.candidate_matcher.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=[])
+        services.search.hybrid_search.return_value = []
 
-            result = await matcher.match(skills, SAMPLE_TEXT)
+        result = await matcher.match(skills, SAMPLE_TEXT)
 
         assert "Python" in result.query_skills
         assert "Docker" in result.query_skills
 
     @pytest.mark.anyio
-    async def test_no_mandatory_skills_uses_all(self):
-        matcher = CandidateMatcher()
-        matcher.initialized = True
-        matcher.client = MagicMock()
-        matcher.model = "gpt-4o"
-
+    async def test_no_mandatory_skills_uses_all(self, matcher, services):
         skills = [
             ExtractedSkill(name="Python", category="programming", mandatory=False, level=None),
             ExtractedSkill(name="React", category="framework", mandatory=False, level=None),
         ]
 
-        with (
-            patch("app.services.candidate_matcher.embedding_service") as mock_emb,
-            patch("app.services.candidate_matcher.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=[])
+        services.search.hybrid_search.return_value = []
 
-            result = await matcher.match(skills, SAMPLE_TEXT)
+        result = await matcher.match(skills, SAMPLE_TEXT)
 
         assert "Python" in result.query_skills
         assert "React" in result.query_skills
 
     @pytest.mark.anyio
-    async def test_embedding_error_raises(self):
-        matcher = CandidateMatcher()
-        matcher.initialized = True
-        matcher.client = MagicMock()
-        matcher.model = "gpt-4o"
+    async def test_embedding_error_raises(self, matcher, services):
+        services.embedding.get_embedding.side_effect = RuntimeError("Embedding failed")
 
-        with patch("app.services.candidate_matcher.embedding_service") as mock_emb:
-            mock_emb.get_embedding = AsyncMock(side_effect=RuntimeError("Embedding failed"))
-
-            with pytest.raises(CandidateMatcherError, match="Embedding failed"):
-                await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
+        with pytest.raises(CandidateMatcherError, match="Embedding failed"):
+            await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
 
     @pytest.mark.anyio
-    async def test_search_error_raises(self):
-        matcher = CandidateMatcher()
-        matcher.initialized = True
-        matcher.client = MagicMock()
-        matcher.model = "gpt-4o"
+    async def test_search_error_raises(self, matcher, services):
+        services.search.hybrid_search.side_effect = RuntimeError("Search unavailable")
 
-        with (
-            patch("app.services.candidate_matcher.embedding_service") as mock_emb,
-            patch("app.services.candidate_matcher.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(side_effect=RuntimeError("Search unavailable"))
-
-            with pytest.raises(CandidateMatcherError, match="Search unavailable"):
-                await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
+        with pytest.raises(CandidateMatcherError, match="Search unavailable"):
+            await matcher.match(SAMPLE_SKILLS, SAMPLE_TEXT)
 
 
 class TestMatchEndpoint:
-    def test_returns_401_without_auth(self):
-        app.dependency_overrides.clear()
-        with TestClient(app) as client:
-            response = client.post(
-                "/api/v1/lastenheft/match",
-                json={
-                    "extracted_skills": [
-                        {"name": "Python", "category": "programming", "mandatory": True, "level": None}
-                    ],
-                    "text": SAMPLE_TEXT,
-                },
-            )
+    @pytest.mark.anyio
+    async def test_returns_401_without_auth(self, async_client):
+        response = await async_client.post(
+            "/api/v1/lastenheft/match",
+            json={
+                "extracted_skills": [{"name": "Python", "category": "programming", "mandatory": True, "level": None}],
+                "text": SAMPLE_TEXT,
+            },
+        )
         assert response.status_code == 401
 
-    def test_returns_422_for_short_text(self):
-        mock_user = UserInfo(id="u1", name="Test", email="t@emposo.de", roles=["admin"])
-        app.dependency_overrides[get_current_user] = lambda: mock_user
-        with TestClient(app) as client:
-            response = client.post(
-                "/api/v1/lastenheft/match",
-                json={
-                    "extracted_skills": [
-                        {"name": "Python", "category": "programming", "mandatory": True, "level": None}
-                    ],
-                    "text": "short",
-                },
-            )
+    @pytest.mark.anyio
+    async def test_returns_422_for_short_text(self, authenticated_async_client):
+        response = await authenticated_async_client.post(
+            "/api/v1/lastenheft/match",
+            json={
+                "extracted_skills": [{"name": "Python", "category": "programming", "mandatory": True, "level": None}],
+                "text": "short",
+            },
+        )
         assert response.status_code == 422
-        app.dependency_overrides.clear()
-
-    def test_returns_matches_with_auth(self):
-        mock_user = UserInfo(id="u1", name="Test", email="t@emposo.de", roles=["admin"])
-        app.dependency_overrides[get_current_user] = lambda: mock_user
 
+    @pytest.mark.anyio
+    async def test_returns_matches_with_auth(self, authenticated_async_client):
         mock_response = CandidateMatchResponse(
             matches=[
                 CandidateMatch(
@@ -494,16 +451,15 @@ class TestMatchEndpoint:
 
         with patch("app.api.v1.endpoints.lastenheft.candidate_matcher") as mock_matcher:
             mock_matcher.match = AsyncMock(return_value=mock_response)
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/v1/lastenheft/match",
-                    json={
-                        "extracted_skills": [
-                            {"name": "Python", "category": "programming", "mandatory": True, "level": "senior"}
-                        ],
-                        "text": SAMPLE_TEXT,
-                    },
-                )
+            response = await authenticated_async_client.post(
+                "/api/v1/lastenheft/match",
+                json={
+                    "extracted_skills": [
+                        {"name": "Python", "category": "programming", "mandatory": True, "level": "senior"}
+                    ],
+                    "text": SAMPLE_TEXT,
+                },
+            )
 
         assert response.status_code == 200
         data = response.json()
@@ -512,25 +468,20 @@ class TestMatchEndpoint:
         assert data["matches"][0]["total_score"] == 0.85
         assert data["total_candidates_searched"] == 5
         assert "Python" in data["query_skills"]
-        app.dependency_overrides.clear()
-
-    def test_returns_502_on_matcher_error(self):
-        mock_user = UserInfo(id="u1", name="Test", email="t@emposo.de", roles=["admin"])
-        app.dependency_overrides[get_current_user] = lambda: mock_user
 
+    @pytest.mark.anyio
+    async def test_returns_502_on_matcher_error(self, authenticated_async_client):
         with patch("app.api.v1.endpoints.lastenheft.candidate_matcher") as mock_matcher:
             mock_matcher.match = AsyncMock(side_effect=CandidateMatcherError("Search unavailable"))
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/v1/lastenheft/match",
-                    json={
-                        "extracted_skills": [
-                            {"name": "Python", "category": "programming", "mandatory": True, "level": None}
-                        ],
-                        "text": SAMPLE_TEXT,
-                    },
-                )
+            response = await authenticated_async_client.post(
+                "/api/v1/lastenheft/match",
+                json={
+                    "extracted_skills": [
+                        {"name": "Python", "category": "programming", "mandatory": True, "level": None}
+                    ],
+                    "text": SAMPLE_TEXT,
+                },
+            )
 
         assert response.status_code == 502
         assert "Candidate matching failed" in response.json()["detail"]
-        app.dependency_overrides.clear()
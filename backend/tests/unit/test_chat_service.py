@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,7 +10,13 @@ from starlette.testclient import TestClient
 from app.core.dependencies import get_current_user
 from app.main import app
 from app.models.auth import UserInfo
-from app.services.chat_service import SYSTEM_PROMPT_DE, SYSTEM_PROMPT_EN, ChatService
+from app.models.chat import ChatEvent
+from app.services.chat_service import SYSTEM_PROMPT_DE, SYSTEM_PROMPT_EN, TOKEN_BATCH_SIZE, ChatService
+
+
+@pytest.fixture
+def services(mock_services):
+    return mock_services("app.services.chat_service")
 
 
 def _sample_results(count: int = 2) -> list[dict]:
@@ -107,13 +114,12 @@ class TestStreamChat:
                 pass
 
     @pytest.mark.anyio
-    async def test_yields_start_event_first(self):
+    async def test_yields_start_event_first(self, services):
         service = ChatService()
         service.initialized = True
         service.client = MagicMock()
         service.model = "gpt-4o"
 
-        mock_embedding = [0.1] * 3072
         mock_results = _sample_results(1)
 
         mock_chunk = MagicMock()
@@ -123,30 +129,23 @@ class TestStreamChat:
         async def mock_stream():
             yield mock_chunk
 
-        with (
-            patch("app.services.chat_service.embedding_service") as mock_emb,
-            patch("app.services.chat_service.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=mock_embedding)
-            mock_search.hybrid_search = AsyncMock(return_value=mock_results)
-            service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
+        services.search.hybrid_search.return_value = mock_results
+        service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
 
-            events = []
-            async for event in service.stream_chat("find Python devs", "en"):
-                events.append(event)
+        events = []
+        async for event in service.stream_chat("find Python devs", "en"):
+            events.append(event)
 
-        assert events[0].startswith("event: start\n")
-        data = json.loads(events[0].split("data: ")[1].strip())
-        assert data["status"] == "started"
+        assert events[0].event == "start"
+        assert events[0].data["status"] == "started"
 
     @pytest.mark.anyio
-    async def test_full_pipeline_event_order(self):
+    async def test_full_pipeline_event_order(self, services):
         service = ChatService()
         service.initialized = True
         service.client = MagicMock()
         service.model = "gpt-4o"
 
-        mock_embedding = [0.1] * 3072
         mock_results = _sample_results(2)
 
         mock_chunk1 = MagicMock()
@@ -161,23 +160,19 @@ class TestStreamChat:
             yield mock_chunk1
             yield mock_chunk2
 
-        with (
-            patch("app.services.chat_service.embedding_service") as mock_emb,
-            patch("app.services.chat_service.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=mock_embedding)
-            mock_search.hybrid_search = AsyncMock(return_value=mock_results)
-            service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
+        services.search.hybrid_search.return_value = mock_results
+        service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
 
-            events = []
-            async for event in service.stream_chat("find devs", "de"):
-                events.append(event)
+        events = []
+        async for event in service.stream_chat("find devs", "de"):
+            events.append(event)
 
-        event_types = [e.split("\n")[0].replace("event: ", "") for e in events]
-        assert event_types == ["start", "search_complete", "token", "token", "complete"]
+        event_types = [e.event for e in events]
+        assert event_types == ["start", "search_complete", "token", "complete"]
+        assert events[2].data["content"] == "First token"
 
     @pytest.mark.anyio
-    async def test_search_complete_contains_employees(self):
+    async def test_search_complete_contains_employees(self, services):
         service = ChatService()
         service.initialized = True
         service.client = MagicMock()
@@ -189,95 +184,138 @@ class TestStreamChat:
             return
             yield  # noqa: RET504 — make this an async generator
 
-        with (
-            patch("app.services.chat_service.embedding_service") as mock_emb,
-            patch("app.services.chat_service.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=mock_results)
-            service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
+        services.search.hybrid_search.return_value = mock_results
+        service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
 
-            events = []
-            async for event in service.stream_chat("test", "en"):
-                events.append(event)
+        events = []
+        async for event in service.stream_chat("test", "en"):
+            events.append(event)
 
-        search_event = events[1]
-        data = json.loads(search_event.split("data: ")[1].strip())
+        data = events[1].data
         assert data["results_count"] == 2
         assert len(data["employees"]) == 2
         assert data["employees"][0]["name"] == "Employee 0"
         assert data["employees"][0]["alias"] == "emp0"
 
     @pytest.mark.anyio
-    async def test_handles_embedding_error(self):
+    async def test_handles_embedding_error(self, services):
         service = ChatService()
         service.initialized = True
         service.client = MagicMock()
         service.model = "gpt-4o"
 
-        with patch("app.services.chat_service.embedding_service") as mock_emb:
-            mock_emb.get_embedding = AsyncMock(side_effect=RuntimeError("Embedding failed"))
+        services.embedding.get_embedding.side_effect = RuntimeError("Embedding failed")
 
-            events = []
-            async for event in service.stream_chat("test", "en"):
-                events.append(event)
+        events = []
+        async for event in service.stream_chat("test", "en"):
+            events.append(event)
 
-        assert events[0].startswith("event: start\n")
-        assert events[1].startswith("event: error\n")
-        error_data = json.loads(events[1].split("data: ")[1].strip())
-        assert "Embedding failed" in error_data["error"]
+        assert events[0].event == "start"
+        assert events[1].event == "error"
+        assert "Embedding failed" in events[1].data["error"]
 
     @pytest.mark.anyio
-    async def test_handles_search_error(self):
+    async def test_handles_search_error(self, services):
         service = ChatService()
         service.initialized = True
         service.client = MagicMock()
         service.model = "gpt-4o"
 
-        with (
-            patch("app.services.chat_service.embedding_service") as mock_emb,
-            patch("app.services.chat_service.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(side_effect=RuntimeError("Search unavailable"))
+        services.search.hybrid_search.side_effect = RuntimeError("Search unavailable")
 
-            events = []
-            async for event in service.stream_chat("test", "de"):
-                events.append(event)
+        events = []
+        async for event in service.stream_chat("test", "de"):
+            events.append(event)
 
-        error_event = [e for e in events if e.startswith("event: error")]
+        error_event = [e for e in events if e.event == "error"]
         assert len(error_event) == 1
-        error_data = json.loads(error_event[0].split("data: ")[1].strip())
-        assert "Search unavailable" in error_data["error"]
+        assert "Search unavailable" in error_event[0].data["error"]
 
     @pytest.mark.anyio
-    async def test_handles_openai_stream_error(self):
+    async def test_handles_openai_stream_error(self, services):
         service = ChatService()
         service.initialized = True
         service.client = MagicMock()
         service.model = "gpt-4o"
 
-        with (
-            patch("app.services.chat_service.embedding_service") as mock_emb,
-            patch("app.services.chat_service.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=_sample_results(1))
-            service.client.chat.completions.create = AsyncMock(side_effect=Exception("OpenAI rate limit"))
+        services.search.hybrid_search.return_value = _sample_results(1)
+        service.client.chat.completions.create = AsyncMock(side_effect=Exception("OpenAI rate limit"))
 
-            events = []
-            async for event in service.stream_chat("test", "en"):
-                events.append(event)
+        events = []
+        async for event in service.stream_chat("test", "en"):
+            events.append(event)
 
-        event_types = [e.split("\n")[0].replace("event: ", "") for e in events]
+        event_types = [e.event for e in events]
         assert "start" in event_types
         assert "error" in event_types
         assert "complete" not in event_types
 
+    @pytest.mark.anyio
+    async def test_tokens_are_batched_into_frames(self, services):
+        service = ChatService()
+        service.initialized = True
+        service.client = MagicMock()
+        service.model = "gpt-4o"
+
+        def _chunk(text: str) -> MagicMock:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = text
+            return chunk
+
+        async def mock_stream():
+            for i in range(TOKEN_BATCH_SIZE + 2):
+                yield _chunk(str(i))
+            raise RuntimeError("connection reset")
+
+        with patch("app.services.chat_service.TOKEN_FLUSH_INTERVAL", 60.0):
+            services.search.hybrid_search.return_value = _sample_results(1)
+            service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
+
+            events = [event async for event in service.stream_chat("test", "en")]
+
+        tokens = [e.data["content"] for e in events if e.event == "token"]
+        assert tokens == ["01234567", "89"]
+        assert events[-1].event == "error"
+
+    @pytest.mark.anyio
+    async def test_buffered_tokens_flush_while_the_model_pauses(self, services):
+        service = ChatService()
+        service.initialized = True
+        service.client = MagicMock()
+        service.model = "gpt-4o"
+        resumed = asyncio.Event()
+
+        def _chunk(text: str) -> MagicMock:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = text
+            return chunk
+
+        async def mock_stream():
+            yield _chunk("Hel")
+            # Only continues once the first token has reached the client
+            await resumed.wait()
+            yield _chunk("lo")
+
+        services.search.hybrid_search.return_value = _sample_results(1)
+        service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
+
+        events = []
+        with patch("app.services.chat_service.TOKEN_FLUSH_INTERVAL", 0.01):
+            async with asyncio.timeout(5):
+                async for event in service.stream_chat("test", "en"):
+                    events.append(event)
+                    if event.event == "token":
+                        resumed.set()
+
+        assert [e.data["content"] for e in events if e.event == "token"] == ["Hel", "lo"]
+        assert events[-1].event == "complete"
+
 
 class TestSSEFormat:
     @pytest.mark.anyio
-    async def test_all_events_follow_sse_format(self):
+    async def test_all_events_follow_sse_format(self, services):
         service = ChatService()
         service.initialized = True
         service.client = MagicMock()
@@ -290,20 +328,16 @@ class TestSSEFormat:
         async def mock_stream():
             yield mock_chunk
 
-        with (
-            patch("app.services.chat_service.embedding_service") as mock_emb,
-            patch("app.services.chat_service.search_service") as mock_search,
-        ):
-            mock_emb.get_embedding = AsyncMock(return_value=[0.1] * 3072)
-            mock_search.hybrid_search = AsyncMock(return_value=_sample_results(1))
-            service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
+        services.search.hybrid_search.return_value = _sample_results(1)
+        service.client.chat.completions.create = AsyncMock(return_value=mock_stream())
 
-            async for event in service.stream_chat("test", "en"):
-                assert event.startswith("event: ")
-                assert "\ndata: " in event
-                assert event.endswith("\n\n")
-                data_str = event.split("data: ", 1)[1].rstrip("\n")
-                json.loads(data_str)
+        async for chat_event in service.stream_chat("test", "en"):
+            event = chat_event.encode()
+            assert event.startswith("event: ")
+            assert "\ndata: " in event
+            assert event.endswith("\n\n")
+            data_str = event.split("data: ", 1)[1].rstrip("\n")
+            json.loads(data_str)
 
 
 class TestChatEndpoint:
@@ -321,8 +355,8 @@ class TestChatEndpoint:
         app.dependency_overrides[get_current_user] = lambda: mock_user
 
         async def fake_stream(query: str, language: str):
-            yield 'event: start\ndata: {"status":"started"}\n\n'
-            yield 'event: complete\ndata: {"status":"complete"}\n\n'
+            yield ChatEvent(event="start", data={"status": "started"})
+            yield ChatEvent(event="complete", data={"status": "complete"})
 
         with patch("app.api.v1.endpoints.chat.chat_service") as mock_svc:
             mock_svc.stream_chat = fake_stream
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from app.core.dates import parse_start_date, years_since, years_since_str
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2020-01-15T08:30:00", date(2020, 1, 15)),
+        ("2020-01-15", date(2020, 1, 15)),
+        ("2020-01", date(2020, 1, 1)),
+        ("2020", date(2020, 1, 1)),
+        ("15.01.2020", date(2020, 1, 15)),
+    ],
+)
+def test_parse_start_date_supported_formats(value, expected):
+    assert parse_start_date(value) == expected
+
+
+@pytest.mark.parametrize("value", ["not-a-date", "2020-13-01", "31.02.2020", "2020-01-15 extra"])
+def test_parse_start_date_rejects_invalid(value):
+    assert parse_start_date(value) is None
+
+
+def test_years_since_counts_elapsed_years():
+    start = date.today().replace(year=date.today().year - 4)
+    assert years_since(start.isoformat()) == pytest.approx(4.0, abs=0.01)
+
+
+def test_years_since_missing_or_invalid():
+    assert years_since(None) is None
+    assert years_since("") is None
+    assert years_since("unknown") is None
+
+
+def test_years_since_str_formats_one_decimal():
+    start = date.today().replace(year=date.today().year - 4)
+    assert years_since_str(start.isoformat()) == "4.0"
+    assert years_since_str("unknown") == "N/A"
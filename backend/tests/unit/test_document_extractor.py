@@ -4,6 +4,7 @@ import io
 from pathlib import Path
 
 import docx
+import fitz
 import pytest
 from starlette.testclient import TestClient
 
@@ -11,6 +12,7 @@ from app.core.dependencies import get_current_user
 from app.main import app
 from app.models.auth import UserInfo
 from app.services.document_extractor import (
+    _PDF_TEXT_FLAGS,
     MAX_FILE_SIZE,
     SUPPORTED_CONTENT_TYPES,
     DocumentExtractionError,
@@ -44,6 +46,13 @@ def test_extract_from_pdf_returns_text(extractor, sample_pdf_bytes):
     assert len(result) > 0
 
 
+def test_pdf_text_flags_match_pymupdf_defaults(extractor, sample_pdf_bytes):
+    assert _PDF_TEXT_FLAGS == fitz.TEXTFLAGS_TEXT
+    with fitz.open(stream=sample_pdf_bytes, filetype="pdf") as doc:
+        expected = "\n".join(page.get_text("text") for page in doc).strip()
+    assert extractor.extract_from_pdf(sample_pdf_bytes) == expected
+
+
 def test_extract_from_pdf_invalid_bytes_raises(extractor):
     with pytest.raises(DocumentExtractionError, match="Failed to extract text from PDF"):
         extractor.extract_from_pdf(b"not a pdf")
@@ -96,6 +105,18 @@ def test_extract_dispatches_docx(extractor):
     assert "Test content" in result
 
 
+@pytest.mark.anyio
+async def test_extract_async_runs_extraction(extractor, sample_pdf_bytes):
+    text = await extractor.extract_async(sample_pdf_bytes, "application/pdf")
+    assert len(text) > 0
+
+
+@pytest.mark.anyio
+async def test_extract_async_propagates_errors(extractor):
+    with pytest.raises(DocumentExtractionError, match="Unsupported"):
+        await extractor.extract_async(b"data", "text/plain")
+
+
 def test_extract_rejects_unsupported_content_type(extractor):
     with pytest.raises(DocumentExtractionError, match="Unsupported content type"):
         extractor.extract(b"data", "application/octet-stream")
@@ -156,6 +177,20 @@ def test_upload_endpoint_rejects_empty_file(auth_client):
     assert "empty" in response.json()["detail"].lower()
 
 
+def test_upload_endpoint_rejects_oversized_file(auth_client):
+    response = auth_client.post(
+        "/api/v1/lastenheft/upload",
+        files={"file": ("big.pdf", b"x" * (MAX_FILE_SIZE + 1), "application/pdf")},
+    )
+    assert response.status_code == 413
+    assert "too large" in response.json()["detail"]
+
+
+def test_extract_accepts_bytearray(extractor, sample_pdf_bytes):
+    text = extractor.extract(bytearray(sample_pdf_bytes), "application/pdf")
+    assert len(text) > 0
+
+
 def test_text_paste_endpoint_returns_extracted_text(auth_client):
     response = auth_client.post(
         "/api/v1/lastenheft/text",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from array import array
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -66,6 +68,26 @@ async def test_get_embeddings_batch():
     assert result == embeddings
 
 
+@pytest.mark.anyio
+async def test_get_embeddings_batch_only_requests_uncached_texts():
+    service = EmbeddingService()
+    mock_response = MagicMock()
+    mock_response.data = [MagicMock(embedding=[0.2] * 3)]
+    mock_client = MagicMock()
+    mock_client.embeddings.create = AsyncMock(return_value=mock_response)
+
+    with patch("app.services.embedding_service.AsyncAzureOpenAI", return_value=mock_client):
+        await service.initialize(_make_settings())
+
+    with patch.object(service, "_create_embedding", AsyncMock(return_value=[0.1] * 3)):
+        await service.get_embedding("one")
+
+    result = await service.get_embeddings_batch(["one", "two", "two"])
+
+    assert result == [[0.1] * 3, [0.2] * 3, [0.2] * 3]
+    assert mock_client.embeddings.create.call_args.kwargs["input"] == ["two"]
+
+
 @pytest.mark.anyio
 async def test_check_connection_success():
     service = EmbeddingService()
@@ -74,7 +96,7 @@ async def test_check_connection_success():
     with patch("app.services.embedding_service.AsyncAzureOpenAI", return_value=MagicMock()):
         await service.initialize(settings)
 
-    with patch.object(service, "get_embedding", AsyncMock(return_value=[0.0] * 3072)):
+    with patch.object(service, "_create_embedding", AsyncMock(return_value=[0.0] * 3072)):
         assert await service.check_connection() is True
 
 
@@ -86,5 +108,81 @@ async def test_check_connection_failure():
     with patch("app.services.embedding_service.AsyncAzureOpenAI", return_value=MagicMock()):
         await service.initialize(settings)
 
-    with patch.object(service, "get_embedding", AsyncMock(side_effect=Exception("boom"))):
+    with patch.object(service, "_create_embedding", AsyncMock(side_effect=Exception("boom"))):
         assert await service.check_connection() is False
+
+
+@pytest.mark.anyio
+async def test_get_embedding_caches_repeated_text():
+    service = EmbeddingService()
+    mock_response = MagicMock()
+    mock_response.data = [MagicMock(embedding=[0.5] * 3072)]
+    mock_client = MagicMock()
+    mock_client.embeddings.create = AsyncMock(return_value=mock_response)
+
+    with patch("app.services.embedding_service.AsyncAzureOpenAI", return_value=mock_client):
+        await service.initialize(_make_settings())
+        first = await service.get_embedding("python aws")
+        second = await service.get_embedding("python aws")
+        await service.get_embedding("java")
+
+    assert first == second == [0.5] * 3072
+    assert mock_client.embeddings.create.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_requests_share_one_call():
+    service = EmbeddingService()
+    mock_response = MagicMock()
+    mock_response.data = [MagicMock(embedding=[0.5] * 3072)]
+
+    async def slow_create(**kwargs):
+        await asyncio.sleep(0.01)
+        return mock_response
+
+    mock_client = MagicMock()
+    mock_client.embeddings.create = AsyncMock(side_effect=slow_create)
+
+    with patch("app.services.embedding_service.AsyncAzureOpenAI", return_value=mock_client):
+        await service.initialize(_make_settings())
+        results = await asyncio.gather(*(service.get_embedding("python aws") for _ in range(5)))
+
+    assert mock_client.embeddings.create.await_count == 1
+    assert all(r == [0.5] * 3072 for r in results)
+
+
+@pytest.mark.anyio
+async def test_concurrent_waiters_receive_the_error():
+    service = EmbeddingService()
+
+    async def failing_create(**kwargs):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("rate limited")
+
+    mock_client = MagicMock()
+    mock_client.embeddings.create = AsyncMock(side_effect=failing_create)
+
+    with patch("app.services.embedding_service.AsyncAzureOpenAI", return_value=mock_client):
+        await service.initialize(_make_settings())
+        results = await asyncio.gather(
+            *(service.get_embedding("python aws") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    assert mock_client.embeddings.create.await_count == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.anyio
+async def test_cached_vectors_are_packed_and_copied_out():
+    service = EmbeddingService()
+    with patch("app.services.embedding_service.AsyncAzureOpenAI", return_value=MagicMock()):
+        await service.initialize(_make_settings())
+
+    with patch.object(service, "_create_embedding", AsyncMock(return_value=[0.1, 0.2, 0.3])):
+        await service.get_embedding("python")
+        first = await service.get_embedding("python")
+    first.append(9.9)
+
+    assert isinstance(next(iter(service._cache.values())), array)
+    assert await service.get_embedding("python") == [0.1, 0.2, 0.3]
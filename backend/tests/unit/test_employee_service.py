@@ -3,9 +3,14 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
 
+from app.core.config import Settings
+from app.core.dependencies import get_current_user
+from app.main import app
+from app.models.auth import UserInfo
 from app.models.employee import EmployeeDetail, EmployeeSummary
-from app.services.employee_service import EmployeeService, _calculate_experience
+from app.services.employee_service import EmployeeService, _calculate_experience, employee_service
 
 
 SAMPLE_COSMOS_DOC = {
@@ -84,6 +89,11 @@ def test_calculate_experience_with_valid_date():
     assert float(result) > 0
 
 
+@pytest.mark.parametrize(("partial", "full"), [("2020", "2020-01-01"), ("2020-06", "2020-06-01")])
+def test_calculate_experience_accepts_year_and_month_only(partial, full):
+    assert _calculate_experience(partial) == _calculate_experience(full) != "N/A"
+
+
 def test_calculate_experience_with_none():
     assert _calculate_experience(None) == "N/A"
 
@@ -131,6 +141,60 @@ async def test_get_employee_by_alias_not_found():
     assert result is None
 
 
+@pytest.mark.anyio
+async def test_get_employee_by_alias_uses_point_read():
+    service = EmployeeService()
+    service.initialized = True
+    service.id_is_partition_key = True
+    service.container = MagicMock()
+    service.container.read_item = AsyncMock(return_value=SAMPLE_COSMOS_DOC)
+
+    result = await service.get_employee_by_alias("JDOE")
+
+    assert result is not None
+    assert result.id == "JDOE"
+    service.container.read_item.assert_awaited_once_with(item="JDOE", partition_key="JDOE")
+    service.container.query_items.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_get_employee_by_alias_skips_point_read_by_default():
+    service = EmployeeService()
+    service.initialized = True
+    service.container = MagicMock()
+    service.container.read_item = AsyncMock()
+
+    async def mock_query_items(**kwargs):
+        yield SAMPLE_COSMOS_DOC
+
+    service.container.query_items = mock_query_items
+
+    result = await service.get_employee_by_alias("JDOE")
+
+    assert result is not None
+    assert Settings.model_fields["COSMOS_DB_EMPLOYEES_PARTITION_KEY"].default == ""
+    service.container.read_item.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_get_employee_by_alias_falls_back_to_query_when_not_an_id():
+    service = EmployeeService()
+    service.initialized = True
+    service.id_is_partition_key = True
+    service.container = MagicMock()
+    service.container.read_item = AsyncMock(side_effect=CosmosResourceNotFoundError(status_code=404, message="nf"))
+
+    async def mock_query_items(**kwargs):
+        yield SAMPLE_COSMOS_DOC
+
+    service.container.query_items = mock_query_items
+
+    result = await service.get_employee_by_alias("E-1001")
+
+    assert result is not None
+    assert result.id == "JDOE"
+
+
 @pytest.mark.anyio
 async def test_get_employee_by_alias_not_initialized():
     service = EmployeeService()
@@ -160,6 +224,27 @@ async def test_get_employees_returns_list():
     assert results[0].email == "john.doe@emposo.de"
 
 
+@pytest.mark.anyio
+async def test_get_employees_builds_summaries_with_title_fallback():
+    service = EmployeeService()
+    service.initialized = True
+
+    mock_container = MagicMock()
+
+    async def mock_query_items(**kwargs):
+        yield {"Alias": "MMUS", "Employee": "Max", "Job Title": "", "New Job Title": "Architect"}
+
+    mock_container.query_items = MagicMock(side_effect=mock_query_items)
+    service.container = mock_container
+
+    results = await service.get_employees()
+
+    assert type(results[0]) is EmployeeSummary
+    assert "Phone" not in mock_container.query_items.call_args.kwargs["query"]
+    assert results[0].id == "MMUS"
+    assert results[0].title == "Architect"
+
+
 @pytest.mark.anyio
 async def test_get_employees_not_initialized():
     service = EmployeeService()
@@ -187,3 +272,25 @@ async def test_check_connection_success():
 async def test_check_connection_not_initialized():
     service = EmployeeService()
     assert await service.check_connection() is False
+
+
+def test_list_employees_endpoint_serializes_summaries(client):
+    app.dependency_overrides[get_current_user] = lambda: UserInfo(id="u1", roles=["viewer"])
+    employees = [EmployeeSummary(id="JDOE", name="Doe, John", email="john.doe@emposo.de")]
+
+    with patch.object(employee_service, "get_employees", return_value=employees):
+        response = client.get("/api/v1/employees?limit=1")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [
+        {
+            "id": "JDOE",
+            "name": "Doe, John",
+            "title": None,
+            "department": None,
+            "unit": None,
+            "location": None,
+            "email": "john.doe@emposo.de",
+        }
+    ]
@@ -1,5 +1,19 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pytest
+
+from app.api.v1.endpoints import health
+from app.services.search_service import search_service
+
+
+@pytest.fixture(autouse=True)
+def _clear_health_cache():
+    health._health_cache = None
+    yield
+    health._health_cache = None
+
 
 def test_health_returns_status_and_services(client):
     response = client.get("/api/v1/health")
@@ -40,3 +54,24 @@ def test_health_protected_with_auth(authenticated_client):
     data = response.json()
     assert data["status"] == "ok"
     assert "user" in data
+
+
+def test_health_reports_failing_probe_as_degraded(client):
+    with (
+        patch.object(search_service, "initialized", True),
+        patch.object(search_service, "check_connection", side_effect=RuntimeError("boom")),
+    ):
+        response = client.get("/api/v1/health")
+
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["services"]["azure_search"] == "error"
+    assert data["services"]["cosmos_db"] == "not_configured"
+
+
+def test_health_result_is_cached_briefly(client):
+    with patch.object(health, "_check_cosmos", wraps=health._check_cosmos) as mock_check:
+        client.get("/api/v1/health")
+        client.get("/api/v1/health")
+
+    assert mock_check.call_count == 1
@@ -17,6 +17,8 @@ from app.models.lastenheft import (
     QualityScore,
 )
 from app.services.lastenheft_analyzer import (
+    ANALYSIS_SYSTEM_PROMPT,
+    LLM_ANALYSIS_MAX_TOKENS,
     LLM_MAX_TOKENS,
     LLM_TEMPERATURE,
     QUALITY_SYSTEM_PROMPT,
@@ -62,6 +64,14 @@ SKILLS_RESPONSE = json.dumps(
     }
 )
 
+ANALYSIS_RESPONSE = json.dumps(
+    {
+        "quality": json.loads(QUALITY_RESPONSE),
+        "questions": json.loads(QUESTIONS_RESPONSE)["questions"],
+        "skills": json.loads(SKILLS_RESPONSE)["skills"],
+    }
+)
+
 
 def _make_llm_response(content: str) -> MagicMock:
     message = MagicMock()
@@ -127,6 +137,13 @@ class TestBuildMessages:
         assert messages[1]["role"] == "user"
         assert messages[1]["content"] == "user text"
 
+    def test_reuses_system_message_for_known_prompts(self):
+        analyzer = LastenheftAnalyzer()
+        first = analyzer._build_messages(ANALYSIS_SYSTEM_PROMPT, "a")
+        second = analyzer._build_messages(ANALYSIS_SYSTEM_PROMPT, "b")
+        assert first[0] is second[0]
+        assert first[0] == {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT}
+
 
 class TestQualityPrompt:
     def test_quality_prompt_contains_scoring_criteria(self):
@@ -296,35 +313,20 @@ class TestAnalyze:
             await analyzer.analyze("text")
 
     @pytest.mark.anyio
-    async def test_runs_three_calls_in_parallel(self):
+    async def test_uses_single_combined_call(self):
         analyzer = LastenheftAnalyzer()
         analyzer.initialized = True
         analyzer.client = MagicMock()
         analyzer.model = "gpt-4o"
-
-        call_order: list[str] = []
-
-        async def mock_create(**kwargs):
-            messages = kwargs.get("messages", [])
-            system_content = messages[0]["content"] if messages else ""
-
-            if "Bewertung" in system_content:
-                call_order.append("quality")
-                return _make_llm_response(QUALITY_RESPONSE)
-            elif "offene Fragen" in system_content:
-                call_order.append("questions")
-                return _make_llm_response(QUESTIONS_RESPONSE)
-            else:
-                call_order.append("skills")
-                return _make_llm_response(SKILLS_RESPONSE)
-
-        analyzer.client.chat.completions.create = AsyncMock(side_effect=mock_create)
+        analyzer.client.chat.completions.create = AsyncMock(return_value=_make_llm_response(ANALYSIS_RESPONSE))
 
         result = await analyzer.analyze(SAMPLE_TEXT)
 
         assert isinstance(result, LastenheftAnalysisResponse)
-        assert len(call_order) == 3
-        assert analyzer.client.chat.completions.create.call_count == 3
+        analyzer.client.chat.completions.create.assert_awaited_once()
+        call_kwargs = analyzer.client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["messages"][0]["content"] == ANALYSIS_SYSTEM_PROMPT
+        assert call_kwargs["max_tokens"] == LLM_ANALYSIS_MAX_TOKENS
 
     @pytest.mark.anyio
     async def test_returns_complete_analysis(self):
@@ -332,15 +334,7 @@ class TestAnalyze:
         analyzer.initialized = True
         analyzer.client = MagicMock()
         analyzer.model = "gpt-4o"
-
-        responses = iter(
-            [
-                _make_llm_response(QUALITY_RESPONSE),
-                _make_llm_response(QUESTIONS_RESPONSE),
-                _make_llm_response(SKILLS_RESPONSE),
-            ]
-        )
-        analyzer.client.chat.completions.create = AsyncMock(side_effect=lambda **kw: next(responses))
+        analyzer.client.chat.completions.create = AsyncMock(return_value=_make_llm_response(ANALYSIS_RESPONSE))
 
         result = await analyzer.analyze(SAMPLE_TEXT)
 
@@ -360,6 +354,36 @@ class TestAnalyze:
         with pytest.raises(LastenheftAnalyzerError):
             await analyzer.analyze(SAMPLE_TEXT)
 
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "quality",
+        [None, "good", {"overall": "high"}],
+        ids=["null", "not_a_dict", "invalid_fields"],
+    )
+    async def test_malformed_quality_raises_analyzer_error(self, quality):
+        analyzer = LastenheftAnalyzer()
+        analyzer.initialized = True
+        analyzer.client = MagicMock()
+        analyzer.model = "gpt-4o"
+        payload = {**json.loads(ANALYSIS_RESPONSE), "quality": quality}
+        analyzer.client.chat.completions.create = AsyncMock(return_value=_make_llm_response(json.dumps(payload)))
+
+        with pytest.raises(LastenheftAnalyzerError):
+            await analyzer.analyze(SAMPLE_TEXT)
+
+    @pytest.mark.anyio
+    async def test_missing_quality_raises_analyzer_error(self):
+        analyzer = LastenheftAnalyzer()
+        analyzer.initialized = True
+        analyzer.client = MagicMock()
+        analyzer.model = "gpt-4o"
+        payload = json.loads(ANALYSIS_RESPONSE)
+        del payload["quality"]
+        analyzer.client.chat.completions.create = AsyncMock(return_value=_make_llm_response(json.dumps(payload)))
+
+        with pytest.raises(LastenheftAnalyzerError, match="no quality object"):
+            await analyzer.analyze(SAMPLE_TEXT)
+
 
 class TestAnalyzeEndpoint:
     def test_returns_401_without_auth(self):
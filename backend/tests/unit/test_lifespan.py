@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+
+from app.main import employee_service, lifespan, search_service
+
+# Kept out of test_app.py: its module-scoped client holds app's lifespan open, and a second
+# startup/shutdown would rebind app.state and close the services underneath it. These tests
+# drive lifespan() directly on a throwaway FastAPI instance in a module without that client.
+
+
+@pytest.mark.anyio
+async def test_lifespan_rejects_sync_stream_chat():
+    def sync_stream(query: str, language: str = "de"):
+        yield "event: start\n\n"
+
+    with patch("app.main.chat_service") as mock_svc:
+        mock_svc.stream_chat = sync_stream
+        with pytest.raises(RuntimeError, match="async generator"):
+            async with lifespan(FastAPI()):
+                pass
+
+
+@pytest.mark.anyio
+async def test_lifespan_continues_when_one_service_fails():
+    application = FastAPI()
+    with (
+        patch.object(employee_service, "initialize", side_effect=RuntimeError("db down")),
+        patch.object(search_service, "initialize") as mock_search_init,
+    ):
+        async with lifespan(application):
+            assert not application.state.http.closed
+
+    mock_search_init.assert_awaited_once()
+    assert application.state.http.closed
@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
-
+import asyncio
+import logging
+import struct
+from logging.handlers import QueueHandler
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import orjson
 import pytest
+from openai import APITimeoutError, RateLimitError
 
 from scripts.reindex import (
+    MAX_EMBEDDING_CHARS,
+    EmbeddingCache,
+    EmployeeFields,
     _calculate_years,
     build_search_document,
     build_searchable_text,
+    configure_logging,
+    embed_cached,
+    embed_documents,
+    embed_with_backoff,
+    embedding_windows,
+    iter_batches,
     parse_args,
+    prepare_employees,
+    run_pipeline,
     upload_batch,
 )
 
@@ -80,6 +98,15 @@ MINIMAL_COSMOS_DOC: dict = {
 }
 
 
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _prepared(docs: list[dict]) -> list:
+    return [(doc, EmployeeFields(doc)) for doc in docs]
+
+
 def test_build_searchable_text_with_all_fields():
     text = build_searchable_text(SAMPLE_COSMOS_DOC)
 
@@ -135,6 +162,15 @@ def test_build_search_document_handles_missing_fields():
     assert doc["contentVector"] == embedding
 
 
+def test_build_search_document_reuses_derived_fields():
+    fields = EmployeeFields(SAMPLE_COSMOS_DOC)
+    doc = build_search_document(SAMPLE_COSMOS_DOC, [0.0], fields)
+
+    assert doc["content"] == fields.content == build_searchable_text(SAMPLE_COSMOS_DOC)
+    assert doc["skills"] is fields.all_skills
+    assert fields.earliest_start == "2020-01-15"
+
+
 def test_build_search_document_calculates_years_of_experience():
     embedding = [0.0] * 10
     doc = build_search_document(SAMPLE_COSMOS_DOC, embedding)
@@ -199,7 +235,9 @@ def test_parse_args_defaults():
     args = parse_args([])
 
     assert args.dry_run is False
-    assert args.batch_size == 10
+    assert args.batch_size == 50
+    assert args.max_request_chars == 200_000
+    assert args.concurrency == 8
     assert args.verbose is False
 
 
@@ -211,6 +249,11 @@ def test_parse_args_custom_values():
     assert args.dry_run is False
 
 
+def test_parse_args_embedding_cache():
+    assert parse_args(["--embedding-cache", "cache.sqlite"]).embedding_cache == "cache.sqlite"
+    assert parse_args(["--no-embedding-cache"]).embedding_cache is None
+
+
 def test_parse_args_dry_run():
     args = parse_args(["--dry-run"])
 
@@ -246,7 +289,7 @@ async def test_upload_batch_success():
 
     mock_response = AsyncMock()
     mock_response.status = 200
-    mock_response.json = AsyncMock(return_value=response_data)
+    mock_response.read = AsyncMock(return_value=orjson.dumps(response_data))
 
     mock_ctx = AsyncMock()
     mock_ctx.__aenter__ = AsyncMock(return_value=mock_response)
@@ -290,3 +333,233 @@ async def test_upload_batch_failure_raises():
             [{"id": "1"}],
             dry_run=False,
         )
+
+
+@pytest.mark.anyio
+async def test_upload_batch_retries_throttled_responses():
+    unavailable = AsyncMock()
+    unavailable.status = 503
+    unavailable.headers = {}
+    throttled = AsyncMock()
+    throttled.status = 429
+    throttled.headers = {"Retry-After": "7"}
+    ok = AsyncMock()
+    ok.status = 200
+    ok.read = AsyncMock(return_value=orjson.dumps({"value": [{"key": "1", "status": True, "statusCode": 200}]}))
+
+    mock_session = MagicMock()
+    mock_session.post.side_effect = [
+        MagicMock(__aenter__=AsyncMock(return_value=response), __aexit__=AsyncMock(return_value=False))
+        for response in (unavailable, throttled, ok)
+    ]
+
+    with (
+        patch("scripts.reindex.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        patch("scripts.reindex.random.uniform", return_value=0.0),
+    ):
+        result = await upload_batch(mock_session, "http://test/index", {}, [{"id": "1"}])
+
+    assert result == (1, 0)
+    # exponential delay first, then the service's Retry-After
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [1, 7]
+
+
+def test_embedding_windows_split_long_text_with_overlap():
+    assert embedding_windows("short") == ["short"]
+
+    text = "".join(str(i % 10) for i in range(MAX_EMBEDDING_CHARS * 2))
+    windows = embedding_windows(text)
+
+    assert len(windows) > 1
+    assert all(len(w) <= MAX_EMBEDDING_CHARS for w in windows)
+    assert windows[0][-100:] in windows[1]
+    assert text.endswith(windows[-1])
+
+
+def test_embedding_windows_keep_every_input_within_the_cap():
+    assert embedding_windows("x" * MAX_EMBEDDING_CHARS) == ["x" * MAX_EMBEDDING_CHARS]
+
+    windows = embedding_windows("x" * (MAX_EMBEDDING_CHARS + 1))
+
+    assert len(windows) == 2
+    assert all(len(w) <= MAX_EMBEDDING_CHARS for w in windows)
+    # 8191-token model limit at a pessimistic 2 characters per token
+    assert MAX_EMBEDDING_CHARS <= 8191 * 2
+
+
+@pytest.mark.anyio
+async def test_embed_documents_pools_windows_in_one_call():
+    long_text = "x" * (MAX_EMBEDDING_CHARS + 1)
+    embed = AsyncMock(return_value=[[1.0, 0.0], [3.0, 4.0], [0.0, 1.0]])
+
+    vectors = await embed_documents(embed, ["short", long_text])
+
+    embed.assert_awaited_once()
+    assert len(embed.await_args.args[0]) == 3
+    assert vectors[0] == [1.0, 0.0]
+    # mean of (3, 4) and (0, 1) is (1.5, 2.5), rescaled to unit length
+    assert vectors[1] == pytest.approx([0.5145, 0.8575], abs=1e-4)
+
+
+@pytest.mark.anyio
+async def test_embed_documents_embeds_identical_texts_once():
+    embed = AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+
+    vectors = await embed_documents(embed, ["a", "b", "a"])
+
+    assert embed.await_args.args[0] == ["a", "b"]
+    assert vectors == [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]]
+
+
+@pytest.mark.anyio
+async def test_iter_batches_groups_streamed_items():
+    batches = [batch async for batch in iter_batches(_aiter(range(7)), 3)]
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+@pytest.mark.anyio
+async def test_iter_batches_respects_weight_budget():
+    words = ["aaaa", "bb", "cccccc", "d", "e", "f"]
+    batches = [batch async for batch in iter_batches(_aiter(words), 3, max_weight=6, weight=len)]
+
+    # "cccccc" alone fills the budget; the count ceiling still applies to light items
+    assert batches == [["aaaa", "bb"], ["cccccc"], ["d", "e", "f"]]
+
+
+@pytest.mark.anyio
+async def test_prepare_employees_pairs_docs_with_fields():
+    prepared = [item async for item in prepare_employees(_aiter([SAMPLE_COSMOS_DOC]))]
+
+    assert prepared[0][0] is SAMPLE_COSMOS_DOC
+    assert prepared[0][1].content == build_searchable_text(SAMPLE_COSMOS_DOC)
+
+
+@pytest.mark.anyio
+async def test_run_pipeline_embeds_and_uploads_every_batch():
+    batches = [_prepared([{"id": str(i)} for i in range(start, start + 3)]) for start in range(0, 15, 3)]
+    embed = AsyncMock(side_effect=lambda texts: [[0.0]] * len(texts))
+    uploaded: list[str] = []
+
+    async def upload(documents):
+        uploaded.extend(doc["id"] for doc in documents)
+        return len(documents), 0
+
+    succeeded, failed = await run_pipeline(_aiter(batches), embed, upload)
+
+    assert (succeeded, failed) == (15, 0)
+    assert embed.await_count == 5
+    assert sorted(uploaded, key=int) == [str(i) for i in range(15)]
+
+
+@pytest.mark.anyio
+async def test_run_pipeline_counts_failed_batches_and_continues():
+    batches = [
+        _prepared([{"id": "1", "metadata": {"title": "A"}}, {"id": "2", "metadata": {"title": "B"}}]),
+        _prepared([{"id": "3"}]),
+        _prepared([{"id": "4"}]),
+    ]
+
+    async def embed(texts):
+        if len(texts) == 2:
+            raise RuntimeError("rate limited")
+        return [[0.0]] * len(texts)
+
+    async def upload(documents):
+        if documents[0]["id"] == "4":
+            raise RuntimeError("Upload failed (503)")
+        return len(documents), 0
+
+    succeeded, failed = await run_pipeline(_aiter(batches), embed, upload)
+
+    assert (succeeded, failed) == (1, 3)
+
+
+@pytest.mark.anyio
+async def test_run_pipeline_cancels_stages_when_reading_batches_fails():
+    embedding_started = asyncio.Event()
+
+    async def batches():
+        yield _prepared([{"id": "1"}])
+        await embedding_started.wait()
+        raise RuntimeError("Cosmos paging failed")
+
+    async def embed(texts):
+        embedding_started.set()
+        await asyncio.Event().wait()  # never finishes on its own
+
+    with pytest.raises(RuntimeError, match="Cosmos paging failed"):
+        await run_pipeline(batches(), embed, AsyncMock())
+
+    # The embed worker stuck in its request was cancelled rather than left running
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+def _rate_limit_error() -> RateLimitError:
+    request = httpx.Request("POST", "https://example.openai.azure.com/embeddings")
+    return RateLimitError("Too Many Requests", response=httpx.Response(429, request=request), body=None)
+
+
+@pytest.mark.anyio
+async def test_embed_with_backoff_retries_rate_limits_and_timeouts():
+    timeout = APITimeoutError(httpx.Request("POST", "https://example.openai.azure.com/embeddings"))
+    embed = AsyncMock(side_effect=[_rate_limit_error(), timeout, [[0.5]]])
+
+    with (
+        patch("scripts.reindex.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        patch("scripts.reindex.random.uniform", return_value=0.0),
+    ):
+        result = await embed_with_backoff(embed, ["text"])
+
+    assert result == [[0.5]]
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_embed_cached_only_embeds_misses_and_persists(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = EmbeddingCache(path, "model:2")
+    embed = AsyncMock(return_value=[[0.5, 0.25]])
+    assert await embed_cached(cache, embed, ["a"]) == [[0.5, 0.25]]
+    cache.close()
+
+    cache = EmbeddingCache(path, "model:2")
+    embed = AsyncMock(return_value=[[1.0, 0.0]])
+    result = await embed_cached(cache, embed, ["a", "b", "a"])
+    other_model = EmbeddingCache(path, "model:3").get_many(["a"])
+    cache.close()
+
+    assert embed.await_args.args[0] == ["b"]
+    assert result == [[0.5, 0.25], [1.0, 0.0], [0.5, 0.25]]
+    assert other_model == {}
+
+
+def test_embedding_cache_stores_single_precision(tmp_path):
+    vector = [0.1, -0.02, 0.7]
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), "model:3")
+    cache.put_many({"a": vector})
+
+    (blob,) = cache._db.execute("SELECT embedding FROM embeddings_f32").fetchone()
+    cached = cache.get_many(["a"])["a"]
+    cache.close()
+
+    assert len(blob) == 12
+    # Exactly what the index keeps for a fresh vector: float32 per component
+    assert cached == list(struct.unpack("<3f", struct.pack("<3f", *vector)))
+
+
+class TestConfigureLogging:
+    def test_records_reach_the_stream_through_the_queue(self, capsys):
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        root.handlers.clear()
+        try:
+            listener = configure_logging(verbose=False)
+            assert isinstance(root.handlers[0], QueueHandler)
+            logging.getLogger("scripts.reindex").info("batch done")
+            listener.stop()
+        finally:
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+
+        assert "INFO batch done" in capsys.readouterr().err
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from app.core.config import Settings
@@ -28,13 +29,6 @@ def _mock_session(response: MagicMock) -> MagicMock:
     return session
 
 
-def _mock_client_session(session: MagicMock) -> AsyncMock:
-    mock_client_session = AsyncMock()
-    mock_client_session.__aenter__.return_value = session
-    mock_client_session.__aexit__.return_value = None
-    return mock_client_session
-
-
 @pytest.mark.anyio
 async def test_hybrid_search_returns_results():
     service = SearchService()
@@ -58,12 +52,11 @@ async def test_hybrid_search_returns_results():
 
     response = MagicMock()
     response.status = 200
-    response.json = AsyncMock(return_value=search_data)
+    response.read = AsyncMock(return_value=orjson.dumps(search_data))
 
     session = _mock_session(response)
-    mock_client_session = _mock_client_session(session)
 
-    with patch("app.services.search_service.aiohttp.ClientSession", return_value=mock_client_session):
+    with patch("app.services.search_service.create_http_session", return_value=session):
         await service.initialize(settings)
         results = await service.hybrid_search("python")
 
@@ -79,16 +72,15 @@ async def test_hybrid_search_with_vector():
 
     response = MagicMock()
     response.status = 200
-    response.json = AsyncMock(return_value={"value": []})
+    response.read = AsyncMock(return_value=orjson.dumps({"value": []}))
 
     session = _mock_session(response)
-    mock_client_session = _mock_client_session(session)
 
-    with patch("app.services.search_service.aiohttp.ClientSession", return_value=mock_client_session):
+    with patch("app.services.search_service.create_http_session", return_value=session):
         await service.initialize(settings)
         await service.hybrid_search("python", query_vector=[0.1, 0.2, 0.3])
 
-    payload = session.post.call_args.kwargs["json"]
+    payload = orjson.loads(session.post.call_args.kwargs["data"])
     assert "vectorQueries" in payload
     assert payload["vectorQueries"][0]["fields"] == "contentVector"
 
@@ -100,16 +92,15 @@ async def test_hybrid_search_with_filters():
 
     response = MagicMock()
     response.status = 200
-    response.json = AsyncMock(return_value={"value": []})
+    response.read = AsyncMock(return_value=orjson.dumps({"value": []}))
 
     session = _mock_session(response)
-    mock_client_session = _mock_client_session(session)
 
-    with patch("app.services.search_service.aiohttp.ClientSession", return_value=mock_client_session):
+    with patch("app.services.search_service.create_http_session", return_value=session):
         await service.initialize(settings)
         await service.hybrid_search("python", filters="location eq 'Berlin'")
 
-    payload = session.post.call_args.kwargs["json"]
+    payload = orjson.loads(session.post.call_args.kwargs["data"])
     assert payload["filter"] == "location eq 'Berlin'"
 
 
@@ -137,9 +128,120 @@ def test_process_results():
     assert len(results[0]["content"]) == 500
 
 
+def test_process_results_tolerates_null_content():
+    results = SearchService()._process_results({"value": [{"id": "3", "content": None}]})
+    assert results[0]["content"] == ""
+    assert results[0]["skills"] == []
+
+
 @pytest.mark.anyio
 async def test_search_not_initialized():
     service = SearchService()
 
     with pytest.raises(RuntimeError):
         await service.hybrid_search("python")
+
+
+@pytest.mark.anyio
+async def test_hybrid_search_uses_shared_session():
+    service = SearchService()
+
+    response = MagicMock()
+    response.status = 200
+    response.read = AsyncMock(return_value=orjson.dumps({"value": []}))
+    session = _mock_session(response)
+
+    with patch("app.services.search_service.create_http_session") as mock_create_session:
+        await service.initialize(_make_settings(), session=session)
+        await service.hybrid_search("python")
+
+    mock_create_session.assert_not_called()
+    session.post.assert_called_once()
+    await service.close()
+    session.close.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_owned_session_reused_and_closed():
+    service = SearchService()
+
+    response = MagicMock()
+    response.status = 200
+    response.read = AsyncMock(return_value=orjson.dumps({"value": []}))
+    session = _mock_session(response)
+    session.close = AsyncMock()
+
+    with patch("app.services.search_service.create_http_session", return_value=session) as mock_create_session:
+        await service.initialize(_make_settings())
+        await service.hybrid_search("python")
+        await service.hybrid_search("java")
+        assert await service.check_connection() is True
+
+    mock_create_session.assert_called_once()
+    assert session.post.call_count == 2
+    await service.close()
+    session.close.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_hybrid_search_caches_identical_queries():
+    service = SearchService()
+
+    response = MagicMock()
+    response.status = 200
+    response.read = AsyncMock(
+        return_value=orjson.dumps(
+            {"value": [{"id": "1", "employeeName": "Jane Doe", "skills": ["Python"], "tools": []}]}
+        )
+    )
+    session = _mock_session(response)
+    await service.initialize(_make_settings(), session=session)
+
+    first = await service.hybrid_search("python", query_vector=[0.1, 0.2])
+    first[0]["skills"].append("mutated")
+    second = await service.hybrid_search("python", query_vector=[0.1, 0.2])
+    await service.hybrid_search("python", query_vector=[0.3, 0.4])
+
+    assert second[0]["skills"] == ["Python"]
+    assert session.post.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_hybrid_search_tolerates_null_collections():
+    service = SearchService()
+
+    response = MagicMock()
+    response.status = 200
+    response.read = AsyncMock(
+        return_value=orjson.dumps({"value": [{"id": "1", "employeeName": "Jane Doe", "skills": None, "tools": None}]})
+    )
+    await service.initialize(_make_settings(), session=_mock_session(response))
+
+    first = await service.hybrid_search("python")
+    second = await service.hybrid_search("python")
+
+    assert first[0]["skills"] == first[0]["tools"] == []
+    assert second[0]["skills"] == second[0]["tools"] == []
+
+
+@pytest.mark.anyio
+async def test_check_connection_caches_verdict():
+    service = SearchService()
+
+    response = MagicMock()
+    response.status = 503
+    session = _mock_session(response)
+    await service.initialize(_make_settings(), session=session)
+
+    with patch("app.services.search_service.time.monotonic", return_value=100.0):
+        assert await service.check_connection() is False
+        assert await service.check_connection() is False
+    assert session.get.call_count == 1
+
+    # Failures expire after a few seconds, successes are reused for longer
+    response.status = 200
+    with patch("app.services.search_service.time.monotonic", return_value=106.0):
+        assert await service.check_connection() is True
+    with patch("app.services.search_service.time.monotonic", return_value=130.0):
+        assert await service.check_connection() is True
+    assert session.get.call_count == 2